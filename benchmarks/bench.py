@@ -0,0 +1,465 @@
+"""Benchmarks for the server-side rendering paths of Flask-Moment.
+
+Run from the top-level directory of the project::
+
+    python benchmarks/bench.py
+
+Each benchmark reports the average cost of one rendered timestamp, or of one
+call for the benchmarks that do not render timestamps. A substring given as
+argument selects the benchmarks to run::
+
+    python benchmarks/bench.py include_moment
+
+The results can be saved as JSON and compared with a previous run, which
+reports the relative change of each benchmark and exits with an error status
+when one of them is slower than the threshold::
+
+    python benchmarks/bench.py --json baseline.json
+    python benchmarks/bench.py --compare baseline.json --threshold 10
+
+The benchmarks with names that start with ``memory_`` report the peak memory
+allocated per timestamp instead, measured with ``tracemalloc``.
+
+The benchmarks do not need a network connection.
+"""
+import argparse
+from datetime import date, datetime, timedelta, timezone
+import gc
+from itertools import product
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+
+from flask import Flask, render_template, render_template_string
+
+from flask_moment import Moment, render_format, render_from_now
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ROWS = 10000
+PAGE_ROWS = (100, 10000, 100000)
+app = Flask(__name__)
+moment = Moment(app)
+timestamps = [datetime(2020, 1, 1) + timedelta(seconds=i * 37)
+              for i in range(ROWS)]
+aware_timestamps = [ts.replace(tzinfo=timezone.utc) for ts in timestamps]
+local_timestamps = [ts.replace(tzinfo=timezone(timedelta(hours=-5)))
+                    for ts in timestamps]
+dates = [date(2020, 1, 1) + timedelta(days=i % 3650) for i in range(ROWS)]
+epochs = [1577836800 + i * 37 for i in range(ROWS)]
+float_epochs = [epoch + 0.25 for epoch in epochs]
+strings = [ts.isoformat() + 'Z' for ts in timestamps]
+page_timestamps = [datetime(2020, 1, 1) + timedelta(seconds=i * 37)
+                   for i in range(max(PAGE_ROWS))]
+
+# an application that compiles the template filters with the extension
+ext_app = Flask(__name__)
+ext_app.config['MOMENT_JINJA_EXTENSION'] = True
+Moment(ext_app)
+
+# an application that serves the JavaScript files itself
+static_app = Flask(__name__)
+static_app.config['MOMENT_SERVE_STATIC'] = True
+Moment(static_app)
+
+
+def rows(count, repeat=5):
+    """Set the number of rows and the repeat count of a benchmark, for the
+    benchmarks that do not process ``ROWS`` rows."""
+    def decorator(func):
+        func.rows = count
+        func.repeat = repeat
+        return func
+    return decorator
+
+
+def _include_moment_options():
+    """Return the valid combinations of the options of include_moment()."""
+    options = []
+    for values in product(
+            (None, '/static/moment.min.js'), (None, True), (None, False),
+            (True, False, ['de', 'fr']), ('moment', 'intl'),
+            ('blocking', 'defer', 'async'), (False, True)):
+        kwargs = dict(zip(('local_js', 'no_js', 'sri', 'with_locales',
+                           'engine', 'loading', 'resource_hints'), values))
+        try:
+            app.extensions['moment'].include_moment(**kwargs)
+        except ValueError:
+            continue
+        options.append(kwargs)
+    return options
+
+
+with app.app_context():
+    include_moment_options = _include_moment_options()
+
+
+def bench_moment_init():
+    m = app.extensions['moment']
+    for ts in timestamps:
+        m(ts)
+
+
+def bench_per_object_format():
+    m = app.extensions['moment']
+    for ts in timestamps:
+        m(ts).format('LLL', refresh=True)
+
+
+def bench_per_object_from_time():
+    m = app.extensions['moment']
+    for ts in timestamps:
+        m(ts).fromTime(ts, refresh=True)
+
+
+def bench_per_object_to_now():
+    m = app.extensions['moment']
+    for ts in timestamps:
+        m(ts).toNow()
+
+
+def bench_per_object_to_time():
+    m = app.extensions['moment']
+    for ts in timestamps:
+        m(ts).toTime(ts, refresh=True)
+
+
+def bench_per_object_calendar():
+    m = app.extensions['moment']
+    for ts in timestamps:
+        m(ts).calendar()
+
+
+def bench_per_object_value_of():
+    m = app.extensions['moment']
+    for ts in timestamps:
+        m(ts).valueOf()
+
+
+def bench_per_object_unix():
+    m = app.extensions['moment']
+    for ts in timestamps:
+        m(ts).unix()
+
+
+def bench_per_object_diff():
+    m = app.extensions['moment']
+    for ts in timestamps:
+        m(ts).diff(ts, 'days')
+
+
+def bench_function_format():
+    for ts in timestamps:
+        render_format(ts, 'LLL', refresh=True)
+
+
+def bench_function_from_now():
+    for ts in timestamps:
+        render_from_now(ts)
+
+
+def bench_render_many_format():
+    moment.render_many(timestamps, 'format', fmt='LLL', refresh=True)
+
+
+def bench_per_object_from_now():
+    m = app.extensions['moment']
+    for ts in timestamps:
+        m(ts).fromNow()
+
+
+def bench_render_many_format_prerender():
+    moment.render_many(timestamps, 'format', fmt='LLL', prerender=True)
+
+
+def bench_render_many_from_now():
+    moment.render_many(timestamps, 'fromNow')
+
+
+def bench_render_many_from_now_prerender():
+    moment.render_many(timestamps, 'fromNow', prerender=True)
+
+
+def bench_template_method_format():
+    render_template_string(
+        "{% for ts in timestamps %}{{ moment(ts).format('LLL', refresh=True) "
+        "}}{% endfor %}", timestamps=timestamps)
+
+
+def bench_template_filter_format():
+    render_template_string(
+        "{% for ts in timestamps %}{{ ts|moment_format('LLL', refresh=True) "
+        "}}{% endfor %}", timestamps=timestamps)
+
+
+def bench_template_extension_format():
+    with ext_app.app_context():
+        render_template_string(
+            "{% for ts in timestamps %}{{ ts|moment_format('LLL', "
+            "refresh=True) }}{% endfor %}", timestamps=timestamps)
+
+
+def bench_template_method_from_now():
+    render_template_string(
+        "{% for ts in timestamps %}{{ moment(ts).fromNow() }}{% endfor %}",
+        timestamps=timestamps)
+
+
+def bench_template_extension_from_now():
+    with ext_app.app_context():
+        render_template_string(
+            "{% for ts in timestamps %}{{ ts|moment_from_now }}{% endfor %}",
+            timestamps=timestamps)
+
+
+def bench_render_many_epoch_list():
+    moment.render_many(epochs, 'format', fmt='LLL')
+
+
+if np is not None:
+    datetime64_array = np.array(timestamps, dtype='datetime64[ns]')
+    epoch_array = np.array(epochs)
+
+    def bench_render_many_datetime64_array():
+        moment.render_many(datetime64_array, 'format', fmt='LLL')
+
+    def bench_render_many_epoch_array():
+        moment.render_many(epoch_array, 'format', fmt='LLL')
+
+
+def bench_iso_8601_strftime():
+    for ts in timestamps:
+        ts.strftime('%Y-%m-%dT%H:%M:%S' + 'Z')
+
+
+def bench_iso_8601_naive():
+    to_iso_8601 = app.extensions['moment']()._timestamp_as_iso_8601
+    for ts in timestamps:
+        to_iso_8601(ts)
+
+
+def bench_iso_8601_aware():
+    to_iso_8601 = app.extensions['moment']()._timestamp_as_iso_8601
+    for ts in aware_timestamps:
+        to_iso_8601(ts)
+
+
+def bench_iso_8601_epoch():
+    to_iso_8601 = app.extensions['moment']()._timestamp_as_iso_8601
+    for ts in epochs:
+        to_iso_8601(ts)
+
+
+def bench_iso_8601_local():
+    to_iso_8601 = app.extensions['moment'](local=True)._timestamp_as_iso_8601
+    for ts in timestamps:
+        to_iso_8601(ts)
+
+
+def bench_iso_8601_local_offset():
+    to_iso_8601 = app.extensions['moment']()._timestamp_as_iso_8601
+    for ts in local_timestamps:
+        to_iso_8601(ts)
+
+
+def bench_iso_8601_date():
+    to_iso_8601 = app.extensions['moment']()._timestamp_as_iso_8601
+    for ts in dates:
+        to_iso_8601(ts)
+
+
+def bench_iso_8601_float_epoch():
+    to_iso_8601 = app.extensions['moment']()._timestamp_as_iso_8601
+    for ts in float_epochs:
+        to_iso_8601(ts)
+
+
+def bench_iso_8601_string():
+    to_iso_8601 = app.extensions['moment']()._timestamp_as_iso_8601
+    for ts in strings:
+        to_iso_8601(ts)
+
+
+def bench_iso_8601_milliseconds():
+    to_iso_8601 = app.extensions['moment'](
+        milliseconds=True)._timestamp_as_iso_8601
+    for ts in timestamps:
+        to_iso_8601(ts)
+
+
+def bench_include_moment():
+    m = app.extensions['moment']
+    for _ in range(ROWS):
+        m.include_moment()
+
+
+@rows(len(include_moment_options) * 2)
+def bench_include_moment_options():
+    m = app.extensions['moment']
+    for kwargs in include_moment_options:
+        m.include_moment(**kwargs)
+    with static_app.test_request_context():
+        for kwargs in include_moment_options:
+            m.include_moment(**kwargs)
+
+
+@rows(len(include_moment_options) * 2)
+def bench_include_moment_options_uncached():
+    m = app.extensions['moment']
+    for kwargs in include_moment_options:
+        app.extensions['moment_cache'].clear()
+        m.include_moment(**kwargs)
+    with static_app.test_request_context():
+        for kwargs in include_moment_options:
+            static_app.extensions['moment_cache'].clear()
+            m.include_moment(**kwargs)
+
+
+def _page_benchmark(count):
+    @rows(count, repeat=5 if count < 100000 else 3)
+    def bench():
+        render_template('page.html', timestamps=page_timestamps[:count])
+
+    return bench
+
+
+for _count in PAGE_ROWS:
+    globals()['bench_page_{}'.format(_count)] = _page_benchmark(_count)
+
+
+@rows(max(PAGE_ROWS))
+def memory_moment_objects():
+    m = app.extensions['moment']
+    return [m(ts) for ts in page_timestamps]
+
+
+@rows(max(PAGE_ROWS))
+def memory_per_object_format():
+    m = app.extensions['moment']
+    return [m(ts).format('LLL') for ts in page_timestamps]
+
+
+@rows(max(PAGE_ROWS))
+def memory_function_format():
+    return [render_format(ts, 'LLL') for ts in page_timestamps]
+
+
+@rows(max(PAGE_ROWS))
+def memory_render_many_format():
+    return moment.render_many(page_timestamps, 'format', fmt='LLL')
+
+
+@rows(max(PAGE_ROWS))
+def memory_page():
+    return render_template('page.html', timestamps=page_timestamps)
+
+
+@rows(max(PAGE_ROWS))
+def memory_page_filter():
+    return render_template_string(
+        "{% for ts in timestamps %}<tr><td>{{ ts|moment_format('LLL') }}"
+        "</td></tr>{% endfor %}", timestamps=page_timestamps)
+
+
+def run(name, func, rows, repeat=5):
+    best = min(timeit.repeat(func, number=1, repeat=repeat)) * 1e6 / rows
+    print('{:<32} {:>10.3f} us/row'.format(name, best))
+    return best
+
+
+def measure(name, func, rows):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1] / rows
+    finally:
+        tracemalloc.stop()
+    print('{:<32} {:>10.1f} bytes/row'.format(name, peak))
+    return peak
+
+
+def _value(result):
+    return result.get('us_per_row', result.get('bytes_per_row'))
+
+
+def compare(results, baseline, threshold):
+    """Print the change of each result with respect to a baseline, and return
+    the names of the benchmarks that are slower than the threshold, given as
+    a percentage."""
+    regressions = []
+    print('{:<32} {:>10} {:>10} {:>8}'.format(
+        'benchmark', 'baseline', 'current', 'change'))
+    for name, result in results.items():
+        if name not in baseline:
+            print('{:<32} {:>10} {:>10.3f} {:>8}'.format(
+                name, '-', _value(result), 'new'))
+            continue
+        before = _value(baseline[name])
+        change = (_value(result) - before) * 100 / before
+        slower = change > threshold
+        if slower:
+            regressions.append(name)
+        print('{:<32} {:>10.3f} {:>10.3f} {:>+7.1f}%{}'.format(
+            name, before, _value(result), change,
+            ' regression' if slower else ''))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the benchmarks.')
+    parser.add_argument('pattern', nargs='?', default='',
+                        help='run only the benchmarks with this substring')
+    parser.add_argument('--json', metavar='FILE',
+                        help='save the results to this file')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='compare the results with a saved run')
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help='increase in percent reported as a regression '
+                        'by --compare (default: 10)')
+    args = parser.parse_args(argv)
+
+    results = {}
+    with app.test_request_context():
+        for name, func in sorted(globals().items()):
+            if name.startswith('bench_') and args.pattern in name:
+                app.extensions['moment'].render_cache_clear()
+                count = getattr(func, 'rows', ROWS)
+                repeat = getattr(func, 'repeat', 5)
+                results[name[6:]] = {
+                    'us_per_row': run(name[6:], func, count, repeat),
+                    'rows': count,
+                    'repeat': repeat,
+                }
+            elif name.startswith('memory_') and args.pattern in name:
+                app.extensions['moment'].render_cache_clear()
+                results[name] = {
+                    'bytes_per_row': measure(name, func, func.rows),
+                    'rows': func.rows,
+                }
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'python': platform.python_implementation() + ' ' +
+                platform.python_version(),
+                'platform': platform.platform(),
+                'numpy': np.__version__ if np is not None else None,
+                'results': results,
+            }, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        print()
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
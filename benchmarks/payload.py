@@ -0,0 +1,48 @@
+"""Compare the size of pages rendered with the default and compact markup.
+
+Run from the top-level directory of the project::
+
+    python benchmarks/payload.py
+"""
+from datetime import datetime, timedelta
+import gzip
+
+from flask import Flask, render_template_string
+
+from flask_moment import Moment
+
+ROWS = 5000
+app = Flask(__name__)
+moment = Moment(app)
+timestamps = [datetime(2020, 1, 1) + timedelta(seconds=i * 37)
+              for i in range(ROWS)]
+template = '''<table>
+{% for ts in timestamps %}
+<tr><td>{{ moment(ts).format('LLL') }}</td>
+<td>{{ moment(ts).fromNow(refresh=True) }}</td></tr>
+{% endfor %}
+</table>
+{{ moment.data_island() }}'''
+
+
+def page_size(compact):
+    app.config['MOMENT_COMPACT'] = compact
+    with app.test_request_context():
+        html = render_template_string(
+            template, timestamps=timestamps).encode('utf-8')
+    return len(html), len(gzip.compress(html))
+
+
+def main():
+    default = page_size(False)
+    compact = page_size(True)
+    print('{:<10} {:>12} {:>12}'.format('markup', 'bytes', 'gzip bytes'))
+    print('{:<10} {:>12} {:>12}'.format('default', *default))
+    print('{:<10} {:>12} {:>12}'.format('compact', *compact))
+    print('{:<10} {:>11.1f}% {:>11.1f}%'.format(
+        'saved', 100 - compact[0] * 100 / default[0],
+        100 - compact[1] * 100 / default[1]))
+
+
+if __name__ == '__main__':
+    main()
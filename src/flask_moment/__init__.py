@@ -1,48 +1,98 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+import hashlib
+from itertools import islice
+import json
+import os
+from time import perf_counter
+from urllib.parse import urlsplit
 from packaging.version import parse as version_parse
-from markupsafe import Markup
-from flask import current_app
+from markupsafe import Markup, escape
+from flask import current_app, g, has_app_context, has_request_context, \
+    request
+from flask.signals import Namespace
+from jinja2.ext import Extension
+from jinja2.lexer import Token
+from jinja2.utils import htmlsafe_json_dumps
+from .assets import Asset, create_blueprint
+from .formatter import compile_format, parse_iso_8601
+from .humanize import calendar, relative_time
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover
+    ZoneInfo = None
 
 # //cdnjs.cloudflare.com/ajax/libs/moment.js/2.29.4/moment-with-locales.min.js
 default_moment_version = '2.29.4'
 default_moment_sri = ('sha512-42PE0rd+wZ2hNXftlM78BSehIGzezNeQuzihiBCvUEB3CVx'
                       'HvsShF86wBWwQORNxNINlBPuq7rG4WWhNiTVHFg==')
+# //cdnjs.cloudflare.com/ajax/libs/moment.js/2.29.4/moment.min.js
+default_moment_core_sri = ('sha512-CryKbMe7sjSCDPl18jtJI5DR5jtkUWxPXWaLCst6Qj'
+                           'H8wxDexfRJic2WRmRXmstr2Y8SxDDWuBO6CQC6IE4KTA==')
 
-js_code = '''function flask_moment_render(elem) {{
-    const timestamp = moment(elem.dataset.timestamp);
-    const func = elem.dataset.function;
-    const format = elem.dataset.format;
-    const timestamp2 = elem.dataset.timestamp2;
-    const no_suffix = elem.dataset.nosuffix;
-    const units = elem.dataset.units;
-    let args = [];
-    if (format)
-        args.push(format);
-    if (timestamp2)
-        args.push(moment(timestamp2));
-    if (no_suffix)
-        args.push(no_suffix);
-    if (units)
-        args.push(units);
-    elem.textContent = timestamp[func].apply(timestamp, args);
-    elem.classList.remove('flask-moment');
-    elem.style.display = "";
-}}
-function flask_moment_render_all() {{
-    const moments = document.querySelectorAll('.flask-moment');
-    moments.forEach(function(moment) {{
-        flask_moment_render(moment);
-        const refresh = moment.dataset.refresh;
-        if (refresh && refresh > 0) {{
-            (function(elem, interval) {{
-                setInterval(function() {{
-                    flask_moment_render(elem);
-                }}, interval);
-            }})(moment, refresh);
-        }}
-    }})
-}}
-document.addEventListener("DOMContentLoaded", flask_moment_render_all);'''
+with open(os.path.join(os.path.dirname(__file__), 'static',
+                       'flask-moment.js')) as f:
+    js_code = f.read().rstrip('\n')
+with open(os.path.join(os.path.dirname(__file__), 'static',
+                       'moment-intl.js')) as f:
+    intl_js_code = f.read().rstrip('\n')
+
+
+@lru_cache(maxsize=None)
+def _static_assets():
+    """Return the JavaScript files that can be served by the extension."""
+    return {
+        'flask-moment': Asset('flask-moment', js_code),
+        'moment-intl': Asset('moment-intl', intl_js_code),
+        'moment': Asset.from_file('moment-' + default_moment_version,
+                                  'moment.min.js'),
+        'moment-with-locales': Asset.from_file(
+            'moment-with-locales-' + default_moment_version,
+            'moment-with-locales.min.js'),
+    }
+
+
+# language codes of the vendored locale files of moment.js
+_vendored_locales = frozenset(
+    filename[:-3] for filename in os.listdir(os.path.join(
+        os.path.dirname(__file__), 'static', 'locale'))
+    if filename.endswith('.js'))
+_locale_asset_prefix = 'moment-{}-locale-'.format(default_moment_version)
+
+
+@lru_cache(maxsize=None)
+def _locale_js(language):
+    """Return the code of the vendored moment.js locale file for a
+    language."""
+    if language not in _vendored_locales:
+        raise ValueError('Unknown moment.js locale: {}'.format(language))
+    with open(os.path.join(os.path.dirname(__file__), 'static', 'locale',
+                           language + '.js'), encoding='utf-8') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def _locale_asset(language):
+    """Return the asset with the vendored moment.js locale file for a
+    language. The assets are created on first use, as there are many of
+    them and applications only need a few."""
+    return Asset(_locale_asset_prefix + language, _locale_js(language))
+
+
+def _locale_asset_for(filename):
+    """Return the locale asset with the given public filename, or ``None``
+    if there is no such asset."""
+    name = filename.rsplit('.', 2)[0]
+    language = name[len(_locale_asset_prefix):]
+    if not name.startswith(_locale_asset_prefix) or \
+            language not in _vendored_locales:
+        return None
+    asset = _locale_asset(language)
+    return asset if asset.filename == filename else None
 
 
 def _naive_now():
@@ -50,19 +100,783 @@ def _naive_now():
     return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
+def _iso_8601(timestamp, local=False, milliseconds=False):
+    """Serialize a timestamp as an ISO 8601 string.
+
+    Naive ``datetime`` and ``date`` objects are assumed to be in UTC, unless
+    ``local`` is ``True``. Timezone aware ``datetime`` objects are converted
+    to UTC, and ``int`` or ``float`` values are interpreted as seconds from
+    the Unix epoch. Strings are assumed to be in ISO 8601 format already, and
+    are returned unchanged.
+    """
+    timespec = 'milliseconds' if milliseconds else 'seconds'
+    if type(timestamp) is datetime and timestamp.tzinfo is None:
+        # fast path for the most common case
+        if local:
+            return timestamp.isoformat('T', timespec)
+        return timestamp.isoformat('T', timespec) + 'Z'
+    if isinstance(timestamp, str):
+        return timestamp
+    if isinstance(timestamp, datetime):
+        if timestamp.utcoffset() is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(
+                tzinfo=None)
+            local = False
+    elif isinstance(timestamp, date):
+        timestamp = datetime(timestamp.year, timestamp.month, timestamp.day)
+    elif isinstance(timestamp, (int, float)):
+        timestamp = datetime.fromtimestamp(timestamp, timezone.utc).replace(
+            tzinfo=None)
+        local = False
+    if local:
+        return timestamp.isoformat('T', timespec)
+    return timestamp.isoformat('T', timespec) + 'Z'
+
+
+def _timestamps_as_iso_8601(timestamps, to_iso_8601, local=False,
+                            milliseconds=False):
+    """Convert a sequence of timestamps to ISO 8601 strings.
+
+    NumPy ``datetime64`` and integer or float arrays with Unix epoch seconds,
+    and pandas objects wrapping them, are converted in a single vectorized
+    operation when NumPy is installed. Any other sequences are converted one
+    element at a time with the given ``to_iso_8601`` function.
+
+    Missing values, given as ``NaT`` or ``NaN``, are returned as ``None``,
+    while ``None`` represents the current time, as in :class:`moment`.
+    """
+    dtype = getattr(timestamps, 'dtype', None)
+    if np is not None and dtype is not None and dtype.kind in 'Miuf':
+        tz = ''
+        if getattr(dtype, 'tz', None) is not None:
+            # timezone aware pandas objects are converted to naive UTC
+            if hasattr(timestamps, 'dt'):
+                timestamps = timestamps.dt.tz_convert('UTC').dt.tz_localize(
+                    None)
+            else:
+                timestamps = timestamps.tz_convert('UTC').tz_localize(None)
+            tz = 'Z'
+        elif dtype.kind != 'M' or not local:
+            tz = 'Z'  # epoch timestamps are always in UTC
+        unit = 'ms' if milliseconds else 's'
+        values = np.asarray(timestamps)
+        if dtype.kind == 'f':
+            # epoch seconds are rounded to microseconds and then truncated,
+            # as done by datetime.fromtimestamp() and isoformat()
+            missing = np.isnan(values)
+            values = np.round(np.where(missing, 0, values) * 1e6).astype(
+                'int64').astype('datetime64[us]')
+            values[missing] = np.datetime64('NaT')
+        elif dtype.kind != 'M':
+            values = values.astype('int64').astype('datetime64[s]')
+        values = values.astype('datetime64[{}]'.format(unit))
+        iso = np.datetime_as_string(values, unit=unit)
+        if tz:
+            iso = np.char.add(iso, tz)
+        iso = iso.tolist()
+        for i in np.flatnonzero(np.isnat(values)).tolist():
+            iso[i] = None
+        return iso
+    iso = []
+    for timestamp in timestamps:
+        if timestamp is None:
+            timestamp = 'now' if _client_now() else _naive_now()
+        elif timestamp != timestamp:  # NaT or NaN
+            iso.append(None)
+            continue
+        iso.append(to_iso_8601(timestamp))
+    return iso
+
+
+def _refresh_interval(refresh):
+    """Return the value of the ``data-refresh`` attribute for the given
+    ``refresh`` argument."""
+    if refresh == 'adaptive':
+        return refresh
+    return int(refresh) * 60000
+
+
+_render_functions = ('format', 'fromNow', 'fromTime', 'toNow', 'toTime',
+                     'calendar', 'valueOf', 'unix', 'diff')
+
+
+@lru_cache(maxsize=None)
+def _render_plan(func, format, no_suffix, units, interval):
+    """Return the static parts of a rendered span for a combination of
+    rendering options, as a tuple with the markup that goes before and after
+    the optional ``data-timestamp2`` attribute."""
+    head = ' data-function="{}"'.format(func)
+    if format:
+        head += ' data-format="{}"'.format(format)
+    tail = ''
+    if no_suffix:
+        tail += ' data-nosuffix="1"'
+    if units:
+        tail += ' data-units="{}"'.format(units)
+    tail += ' data-refresh="{}"'.format(interval)
+    return head, tail
+
+
+@lru_cache(maxsize=4096)
+def _render_span(t, func, format, timestamp2, no_suffix, units, interval,
+                 text=None):
+    """Render a complete span element. The results are cached, since pages
+    often render the same timestamps many times.
+
+    Spans that have ``text`` rendered in the server are visible right away.
+    All other spans are hidden until they are rendered in the client.
+    """
+    head, tail = _render_plan(func, format, no_suffix, units, interval)
+    ts2 = ''
+    if timestamp2:
+        ts2 = ' data-timestamp2="{}"'.format(timestamp2)
+    if text is None:
+        tail += ' style="display: none">' + t
+    else:
+        tail += '>' + str(escape(text))
+    return Markup('<span class="flask-moment" data-timestamp="' + t + '"' +
+                  head + ts2 + tail + '</span>')
+
+
+# units accepted by the diff() function of moment.js that give the same result
+# in every timezone, with their length in milliseconds
+_static_diff_units = {
+    'ms': 1, 'millisecond': 1, 'milliseconds': 1,
+    's': 1000, 'second': 1000, 'seconds': 1000,
+    'm': 60000, 'minute': 60000, 'minutes': 60000,
+    'h': 3600000, 'hour': 3600000, 'hours': 3600000,
+}
+_static_functions = ('valueOf', 'unix', 'diff')
+_epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _epoch_milliseconds(t):
+    """Return the milliseconds from the Unix epoch of an ISO 8601 timestamp,
+    or ``None`` if the timestamp cannot be parsed or does not include a
+    timezone, since moment.js interprets those in the timezone of the
+    client."""
+    if t.endswith('Z'):
+        t = t[:-1] + '+00:00'
+    try:
+        dt = datetime.fromisoformat(t)
+    except ValueError:
+        return None
+    if dt.utcoffset() is None:
+        return None
+    return (dt - _epoch) // timedelta(milliseconds=1)
+
+
+def _static_value(t, func, timestamp2, units):
+    """Return the output of a rendering function that does not depend on the
+    client, or ``None`` if the function must be rendered in the client."""
+    value = _epoch_milliseconds(t)
+    if value is None:
+        return None
+    if func == 'valueOf':
+        return value
+    if func == 'unix':
+        return value // 1000
+    if func == 'diff':
+        if not units:
+            unit = 1
+        elif units == 'M':  # months, the only unit alias that is not lowercase
+            return None
+        else:
+            unit = _static_diff_units.get(units.lower())
+        value2 = _epoch_milliseconds(timestamp2 or '')
+        if unit is None or value2 is None:
+            return None
+        # moment.js truncates the difference towards zero
+        difference = abs(value - value2) // unit
+        return difference if value >= value2 else -difference
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _render_static(t, func, timestamp2, units):
+    """Render a visible span element with a value that is calculated in the
+    server, or return ``None`` if the value must be calculated in the client.
+
+    The span has the attributes of a span rendered in the client, but not the
+    ``flask-moment`` class, so the client leaves it alone.
+    """
+    value = _static_value(t, func, timestamp2, units)
+    if value is None:
+        return None
+    head, tail = _render_plan(func, None, None, units, 0)
+    ts2 = ''
+    if timestamp2:
+        ts2 = ' data-timestamp2="{}"'.format(timestamp2)
+    return Markup('<span data-timestamp="' + t + '"' + head + ts2 + tail +
+                  '>' + str(value) + '</span>')
+
+
+@lru_cache(maxsize=None)
+def _timezone(tz):
+    """Return the ``tzinfo`` object for a timezone name."""
+    if not isinstance(tz, str):
+        return tz
+    if tz == 'UTC':
+        return timezone.utc
+    if ZoneInfo is None:  # pragma: no cover
+        raise ValueError('Timezone names require Python 3.9 or newer')
+    return ZoneInfo(tz)
+
+
+@lru_cache(maxsize=4096)
+def _prerender_format(t, format, tz):
+    try:
+        dt = parse_iso_8601(t, tz)
+    except ValueError:
+        return None  # leave timestamps that cannot be parsed to the client
+    return compile_format(format)(dt)
+
+
+def _prerender(t, func, format, timestamp2, no_suffix, units):
+    """Render the text of a timestamp in the server, or return ``None`` if
+    the given function cannot be rendered in the server."""
+    config = current_app.config if has_app_context() else {}
+    tz = _timezone(config.get('MOMENT_PRERENDER_TIMEZONE', 'UTC'))
+    if func == 'format':
+        return _prerender_format(t, format or config.get(
+            'MOMENT_DEFAULT_FORMAT', 'YYYY-MM-DDTHH:mm:ssZ'), tz)
+    try:
+        dt = parse_iso_8601(t, tz)
+        dt2 = parse_iso_8601(timestamp2, tz) if timestamp2 else None
+    except ValueError:
+        return None
+    if func == 'from':
+        return relative_time(dt, dt2, no_suffix)
+    if func == 'to':
+        return relative_time(dt2, dt, no_suffix)
+    now = _naive_now().replace(tzinfo=timezone.utc).astimezone(tz)
+    if func == 'fromNow':
+        return relative_time(dt, now, no_suffix)
+    if func == 'toNow':
+        return relative_time(now, dt, no_suffix)
+    if func == 'calendar':
+        return calendar(dt, now)[0]
+    return None
+
+
+def _script_tag(src, sri=None, loading='blocking', library=False):
+    """Return a ``<script>`` tag that loads a JavaScript file.
+
+    :param src: The URL of the file.
+    :param sri: The SRI hash of the file, if known.
+    :param loading: ``'blocking'``, ``'defer'`` or ``'async'``.
+    :param library: ``True`` for the last script of moment.js and its
+                    locales, which the supporting code waits for when they
+                    are not loaded in blocking mode.
+    """
+    attributes = ''
+    if sri:
+        attributes += ' integrity="{}" crossorigin="anonymous"'.format(sri)
+    if loading != 'blocking':
+        attributes += ' ' + loading
+        if library:
+            attributes += ' data-flask-moment-library'
+    return '<script src="{}"{}></script>\n'.format(src, attributes)
+
+
+def _resource_hints(scripts):
+    """Return ``<link>`` tags that let the browser connect to the servers
+    and start downloading the given scripts before it finds them in the
+    page."""
+    hints = ''
+    origins = set()
+    for src, sri in scripts:
+        url = urlsplit(src)
+        if url.scheme and url.netloc:
+            origin = '{}://{}'.format(url.scheme, url.netloc)
+            if (origin, bool(sri)) not in origins:
+                origins.add((origin, bool(sri)))
+                hints += '<link rel="preconnect" href="{}"{}>\n'.format(
+                    origin, ' crossorigin' if sri else '')
+    for src, sri in scripts:
+        attributes = ''
+        if sri:
+            attributes = ' integrity="{}" crossorigin="anonymous"'.format(sri)
+        hints += '<link rel="preload" href="{}" as="script"{}>\n'.format(
+            src, attributes)
+    return hints
+
+
+def _js_when_ready(code):
+    """Wrap JavaScript code that uses moment.js, so that it runs once
+    moment.js is available. When moment.js is loaded with the ``defer`` or
+    ``async`` attributes, the code is queued, and the supporting code for this
+    extension runs it after moment.js loads."""
+    return ('(function(f) {{ var q = window.flask_moment_queue; '
+            'if (!q && window.moment) f(); '
+            'else (window.flask_moment_queue = q || []).push(f); }})'
+            '(function() {{\n{}\n}});').format(code)
+
+
+def _js_config(refresh_scheduler=None, lazy=None, observe=None,
+               chunk_size=None, stream=None):
+    """Return the JavaScript code that configures moment.js and the supporting
+    code for this extension, according to the given options and the
+    application's configuration."""
+    default_format = ''
+    if 'MOMENT_DEFAULT_FORMAT' in current_app.config:
+        default_format = '\nmoment.defaultFormat = "{}";'.format(
+            current_app.config['MOMENT_DEFAULT_FORMAT'])
+    if refresh_scheduler is None:
+        refresh_scheduler = current_app.config.get(
+            'MOMENT_REFRESH_SCHEDULER', 'shared')
+    if refresh_scheduler not in ('shared', 'element'):
+        raise ValueError('Invalid refresh scheduler: {}'.format(
+            refresh_scheduler))
+    if lazy is None:
+        lazy = current_app.config.get('MOMENT_LAZY', False)
+    if observe is None:
+        observe = current_app.config.get('MOMENT_OBSERVE', False)
+    if chunk_size is None:
+        chunk_size = current_app.config.get('MOMENT_CHUNK_SIZE', 1000)
+    if stream is None:
+        stream = current_app.config.get('MOMENT_STREAM', False)
+    options = {'scheduler': refresh_scheduler, 'lazy': bool(lazy),
+               'observe': bool(observe), 'chunk_size': int(chunk_size),
+               'stream': bool(stream)}
+    return '{}\nvar flask_moment_options = {};'.format(
+        _js_when_ready('moment.locale("en");' + default_format),
+        json.dumps(options))
+
+
+def _flask_moment_js(refresh_scheduler=None, lazy=None, observe=None,
+                     chunk_size=None, stream=None):
+    return _js_config(refresh_scheduler, lazy, observe, chunk_size,
+                      stream) + '\n' + js_code
+
+
+# configuration variables that affect the output of include_moment() and
+# flask_moment_js()
+_cache_config_keys = ('MOMENT_DEFAULT_FORMAT', 'MOMENT_REFRESH_SCHEDULER',
+                      'MOMENT_LAZY', 'MOMENT_OBSERVE', 'MOMENT_CHUNK_SIZE',
+                      'MOMENT_STREAM')
+
+
+def _cached(func, *args, **kwargs):
+    """Call a function that generates JavaScript code, caching the result in
+    the current application.
+
+    The cache key includes the arguments and the configuration variables that
+    affect the generated code, so that changes in the configuration do not
+    return stale results.
+    """
+    if not has_app_context():
+        return func(*args, **kwargs)
+    config = current_app.config
+    key = (func, args, tuple(sorted(kwargs.items())),
+           tuple(config.get(name) for name in _cache_config_keys),
+           request.script_root if has_request_context() else None)
+    cache = current_app.extensions.setdefault('moment_cache', {})
+    try:
+        return cache[key]
+    except KeyError:
+        value = cache[key] = func(*args, **kwargs)
+    except TypeError:  # unhashable arguments
+        value = func(*args, **kwargs)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _compact_plan(func, format, no_suffix, units, interval):
+    """Return the identifier and the data island entry for a combination of
+    rendering options. The identifier is derived from the options, so that it
+    is the same across requests and processes."""
+    plan = {'function': func}
+    if format:
+        plan['format'] = format
+    if no_suffix:
+        plan['nosuffix'] = '1'
+    if units:
+        plan['units'] = units
+    plan['refresh'] = str(interval)
+    plan_id = hashlib.sha1(json.dumps(plan, sort_keys=True).encode(
+        'utf-8')).hexdigest()[:6]
+    return plan_id, plan
+
+
+@lru_cache(maxsize=4096)
+def _render_compact_span(t, plan_id, timestamp2, text=None):
+    """Render a complete span element in compact mode."""
+    ts2 = ''
+    if timestamp2:
+        ts2 = ' data-t2="{}"'.format(timestamp2)
+    if text is None:
+        ts2 += ' hidden>'
+    else:
+        ts2 += '>' + str(escape(text))
+    return Markup('<span class="flask-moment" data-m="' + plan_id +
+                  '" data-t="' + t + '"' + ts2 + '</span>')
+
+
+def _compact_mode():
+    """Return ``True`` if the current application renders timestamps in
+    compact mode."""
+    return has_app_context() and current_app.config.get(
+        'MOMENT_COMPACT', False)
+
+
+def _client_now():
+    """Return ``True`` if moment objects created without a timestamp are
+    rendered with the current time of the client."""
+    return has_app_context() and current_app.config.get(
+        'MOMENT_CLIENT_NOW', False)
+
+
+def _render_compact(t, func, format, timestamp2, no_suffix, units, interval,
+                    text=None):
+    """Render a span element in compact mode, and register its rendering
+    options to be included in the data island of the current request."""
+    plan_id, plan = _compact_plan(func, format, no_suffix, units, interval)
+    plans = g.setdefault('_moment_plans', {})
+    if plan_id not in plans:
+        plans[plan_id] = plan
+    return _render_compact_span(t, plan_id, timestamp2, text)
+
+
+_signals = Namespace()
+
+#: Signal sent at the end of each request when instrumentation is enabled,
+#: with the application as sender and the rendering statistics of the request
+#: in the ``stats`` argument, in the format returned by
+#: :func:`moment.render_stats`.
+render_stats_collected = _signals.signal('moment-render-stats-collected')
+
+# set to True when an application enables instrumentation, so that the
+# rendering functions only look for the statistics of the current request
+# when they may be needed
+_instrumentation = False
+
+# rendering methods that use a different name in moment.js
+_method_names = {'from': 'fromTime', 'to': 'toTime'}
+
+
+def _request_stats():
+    """Return the rendering statistics of the current request, or ``None``
+    if instrumentation is not enabled for the current application."""
+    if not has_request_context() or \
+            not current_app.extensions.get('moment_instrumentation'):
+        return None
+    return g.setdefault('_moment_stats', {})
+
+
+def _instrumented(func, render, *args):
+    """Call a function that returns a rendered span or a list of them, and
+    add them to the statistics of the current request."""
+    stats = _request_stats()
+    if stats is None:
+        return render(*args)
+    started = perf_counter()
+    rendered = render(*args)
+    elapsed = perf_counter() - started
+    spans = [rendered] if isinstance(rendered, str) else rendered
+    entry = stats.setdefault(_method_names.get(func, func),
+                             {'count': 0, 'bytes': 0, 'time': 0.0})
+    entry['count'] += len(spans)
+    entry['bytes'] += sum(len(span.encode('utf-8')) for span in spans)
+    entry['time'] += elapsed
+    return rendered
+
+
+def _server_timing(stats):
+    """Return the value of a ``Server-Timing`` header with the rendering
+    statistics of a request."""
+    metrics = []
+    for name, entry in [('moment', {
+            'count': sum(entry['count'] for entry in stats.values()),
+            'bytes': sum(entry['bytes'] for entry in stats.values()),
+            'time': sum(entry['time'] for entry in stats.values()),
+    })] + [('moment-' + func, stats[func]) for func in sorted(stats)]:
+        metrics.append('{};dur={:.3f};desc="{} spans, {} bytes"'.format(
+            name, entry['time'] * 1000, entry['count'], entry['bytes']))
+    return ', '.join(metrics)
+
+
+def _add_server_timing(response):
+    stats = g.get('_moment_stats')
+    if stats and current_app.debug:
+        response.headers.add('Server-Timing', _server_timing(stats))
+    return response
+
+
+def _send_render_stats(exc):
+    render_stats_collected.send(current_app._get_current_object(),
+                                stats=moment.render_stats())
+
+
+def _render_timestamp(t, func, format, timestamp2, no_suffix, units,
+                      interval, prerender):
+    """Render a timestamp given as an ISO 8601 string, with the arguments
+    that the rendering methods pass to ``moment._render``."""
+    if interval == 0 and func in _static_functions:
+        rendered = _render_static(t, func, timestamp2, units)
+        if rendered is not None:
+            return rendered
+    text = None
+    if prerender:
+        text = _prerender(t, func, format, timestamp2, no_suffix, units)
+    if _compact_mode():
+        return _render_compact(t, func, format, timestamp2, no_suffix, units,
+                               interval, text)
+    return _render_span(t, func, format, timestamp2, no_suffix, units,
+                        interval, text)
+
+
+def _render_sequence(timestamps, args, local, milliseconds):
+    """Render a sequence of timestamps with the same rendering arguments, as
+    returned by :func:`_render_args`, returning a list of spans."""
+    render = _render_compact if _compact_mode() else _render_span
+    iso_timestamps = _timestamps_as_iso_8601(
+        timestamps, lambda t: _iso_8601(t, local, milliseconds), local,
+        milliseconds)
+    func, format, timestamp2, no_suffix, units, interval, prerender = args
+    args = args[:6]
+    if interval == 0 and func in _static_functions:
+        return [_render_static(t, func, timestamp2, units) or
+                render(t, *args) if t is not None else _empty
+                for t in iso_timestamps]
+    if prerender:
+        return [render(t, *args, _prerender(t, *args[:5]))
+                if t is not None else _empty for t in iso_timestamps]
+    return [render(t, *args) if t is not None else _empty
+            for t in iso_timestamps]
+
+
+# the rendered output of missing timestamps
+_empty = Markup('')
+
+
+def _render_moment(timestamp, args, local=False, milliseconds=False):
+    """Render a timestamp with the rendering arguments returned by
+    :func:`_render_args`."""
+    if timestamp is None:
+        timestamp = 'now' if _client_now() else _naive_now()
+    t = _iso_8601(timestamp, local, milliseconds)
+    if _instrumentation:
+        return _instrumented(args[0], _render_timestamp, t, *args)
+    return _render_timestamp(t, *args)
+
+
+# The functions below normalize the arguments of each rendering function into
+# the arguments of _render_timestamp() that follow the timestamp. They are
+# used by the rendering functions, and by the functions that render many
+# timestamps with the same arguments.
+
+def _format_args(fmt=None, refresh=False, prerender=False, *, local=False,
+                 milliseconds=False):
+    return ('format', fmt or '', None, None, None, _refresh_interval(refresh),
+            prerender)
+
+
+def _from_now_args(no_suffix=False, refresh=False, prerender=False, *,
+                   local=False, milliseconds=False):
+    return ('fromNow', None, None, int(no_suffix), None,
+            _refresh_interval(refresh), prerender)
+
+
+def _from_time_args(timestamp2, no_suffix=False, refresh=False,
+                    prerender=False, *, local=False, milliseconds=False):
+    return ('from', None, _iso_8601(timestamp2, local, milliseconds),
+            int(no_suffix), None, _refresh_interval(refresh), prerender)
+
+
+def _to_now_args(no_suffix=False, refresh=False, prerender=False, *,
+                 local=False, milliseconds=False):
+    return ('toNow', None, None, int(no_suffix), None,
+            _refresh_interval(refresh), prerender)
+
+
+def _to_time_args(timestamp2, no_suffix=False, refresh=False,
+                  prerender=False, *, local=False, milliseconds=False):
+    return ('to', None, _iso_8601(timestamp2, local, milliseconds),
+            int(no_suffix), None, _refresh_interval(refresh), prerender)
+
+
+def _calendar_args(refresh=False, prerender=False, *, local=False,
+                   milliseconds=False):
+    return ('calendar', None, None, None, None, _refresh_interval(refresh),
+            prerender)
+
+
+def _value_of_args(refresh=False, *, local=False, milliseconds=False):
+    return ('valueOf', None, None, None, None, _refresh_interval(refresh),
+            False)
+
+
+def _unix_args(refresh=False, *, local=False, milliseconds=False):
+    return ('unix', None, None, None, None, _refresh_interval(refresh), False)
+
+
+def _diff_args(timestamp2, units, refresh=False, *, local=False,
+               milliseconds=False):
+    return ('diff', None, _iso_8601(timestamp2, local, milliseconds), None,
+            units, _refresh_interval(refresh), False)
+
+
+# the argument normalization functions, by the name of the rendering method
+_render_args_map = {
+    'format': _format_args,
+    'fromNow': _from_now_args,
+    'fromTime': _from_time_args,
+    'toNow': _to_now_args,
+    'toTime': _to_time_args,
+    'calendar': _calendar_args,
+    'valueOf': _value_of_args,
+    'unix': _unix_args,
+    'diff': _diff_args,
+}
+
+
+def _render_args(func, args, kwargs, local=False, milliseconds=False):
+    """Return the normalized rendering arguments for a call to the rendering
+    method ``func`` of :class:`moment` with the given arguments."""
+    return _render_args_map[func](*args, local=local,
+                                  milliseconds=milliseconds,
+                                  **_function_kwargs(kwargs))
+
+
+def render_format(timestamp, fmt=None, refresh=False, prerender=False, *,
+                  local=False, milliseconds=False):
+    """Format a timestamp with a custom formatting string.
+
+    This function returns the same as ``moment(timestamp).format()``, without
+    creating a moment object. The ``local`` and ``milliseconds`` arguments
+    are documented in :class:`moment`, and the other arguments in
+    :func:`moment.format`.
+    """
+    return _render_moment(timestamp, _format_args(fmt, refresh, prerender),
+                          local, milliseconds)
+
+
+def render_from_now(timestamp, no_suffix=False, refresh=False,
+                    prerender=False, *, local=False, milliseconds=False):
+    """Render a timestamp as a relative time, as
+    ``moment(timestamp).fromNow()``."""
+    return _render_moment(timestamp, _from_now_args(
+        no_suffix, refresh, prerender), local, milliseconds)
+
+
+def render_from_time(timestamp, timestamp2, no_suffix=False, refresh=False,
+                     prerender=False, *, local=False, milliseconds=False):
+    """Render a timestamp as a relative time with respect to a reference
+    time, as ``moment(timestamp).fromTime(timestamp2)``."""
+    return _render_moment(timestamp, _from_time_args(
+        timestamp2, no_suffix, refresh, prerender, local=local,
+        milliseconds=milliseconds), local, milliseconds)
+
+
+def render_to_now(timestamp, no_suffix=False, refresh=False, prerender=False,
+                  *, local=False, milliseconds=False):
+    """Render a timestamp as the reverse relative time of
+    :func:`render_from_now`, as ``moment(timestamp).toNow()``."""
+    return _render_moment(timestamp, _to_now_args(
+        no_suffix, refresh, prerender), local, milliseconds)
+
+
+def render_to_time(timestamp, timestamp2, no_suffix=False, refresh=False,
+                   prerender=False, *, local=False, milliseconds=False):
+    """Render a timestamp as the reverse relative time of
+    :func:`render_from_time`, as ``moment(timestamp).toTime(timestamp2)``."""
+    return _render_moment(timestamp, _to_time_args(
+        timestamp2, no_suffix, refresh, prerender, local=local,
+        milliseconds=milliseconds), local, milliseconds)
+
+
+def render_calendar(timestamp, refresh=False, prerender=False, *,
+                    local=False, milliseconds=False):
+    """Render a timestamp as a calendar time, as
+    ``moment(timestamp).calendar()``."""
+    return _render_moment(timestamp, _calendar_args(refresh, prerender),
+                          local, milliseconds)
+
+
+def render_value_of(timestamp, refresh=False, *, local=False,
+                    milliseconds=False):
+    """Render a timestamp as milliseconds from the Unix epoch, as
+    ``moment(timestamp).valueOf()``."""
+    return _render_moment(timestamp, _value_of_args(refresh), local,
+                          milliseconds)
+
+
+def render_unix(timestamp, refresh=False, *, local=False, milliseconds=False):
+    """Render a timestamp as seconds from the Unix epoch, as
+    ``moment(timestamp).unix()``."""
+    return _render_moment(timestamp, _unix_args(refresh), local,
+                          milliseconds)
+
+
+def render_diff(timestamp, timestamp2, units, refresh=False, *, local=False,
+                milliseconds=False):
+    """Render the difference between two timestamps in the given units, as
+    ``moment(timestamp).diff(timestamp2, units)``."""
+    return _render_moment(timestamp, _diff_args(
+        timestamp2, units, refresh, local=local, milliseconds=milliseconds),
+        local, milliseconds)
+
+
+def _function_kwargs(kwargs):
+    """Convert keyword arguments given with the names used by the methods of
+    :class:`moment` to those of the rendering functions, which name the
+    reference timestamp ``timestamp2``."""
+    if 'timestamp' in kwargs:
+        kwargs = dict(kwargs)
+        kwargs['timestamp2'] = kwargs.pop('timestamp')
+    return kwargs
+
+
+def _template_filter(function):
+    """Return a template filter for a rendering function that takes a
+    reference timestamp, which accepts the keyword arguments of the
+    corresponding method of :class:`moment`."""
+    def render(value, *args, **kwargs):
+        return function(value, *args, **_function_kwargs(kwargs))
+
+    return render
+
+
+# the functions that render a timestamp, by the name of the rendering method
+_render_function_map = {
+    'format': render_format,
+    'fromNow': render_from_now,
+    'fromTime': render_from_time,
+    'toNow': render_to_now,
+    'toTime': render_to_time,
+    'calendar': render_calendar,
+    'valueOf': render_value_of,
+    'unix': render_unix,
+    'diff': render_diff,
+}
+
+
 class moment(object):
     """Create a moment object.
 
-    :param timestamp: The ``datetime`` object or ISO 8601 string representing
-                      the timestamp.
+    :param timestamp: The ``datetime`` or ``date`` object, ISO 8601 string, or
+                      number of seconds from the Unix epoch representing the
+                      timestamp. Timezone aware ``datetime`` objects are
+                      converted to UTC. If not given, the current time of
+                      the server is used, or when the ``MOMENT_CLIENT_NOW``
+                      configuration variable is set to ``True``, the time at
+                      which the page is viewed in the client. The string
+                      ``'now'`` always represents the time in the client.
     :param local: If ``True``, the ``timestamp`` argument is given in the
                   local client time. In most cases this argument will be set
                   to ``False`` and all the timestamps managed by the server
                   will be in the UTC timezone.
+    :param milliseconds: If ``True``, timestamps are sent to the client with
+                         millisecond precision. The default is to truncate
+                         timestamps to whole seconds.
     """
+    __slots__ = ('timestamp', 'local', 'milliseconds')
+
     @classmethod
     def include_moment(cls, version=default_moment_version, local_js=None,
-                       no_js=None, sri=None, with_locales=True):
+                       no_js=None, sri=None, with_locales=True, engine=None,
+                       loading=None, resource_hints=None, **kwargs):
         """Include the moment.js library and the supporting JavaScript code
         used by this extension.
 
@@ -81,20 +895,89 @@ class moment(object):
         :param sri: The SRI hash to use when importing the moment.js library,
                     or ``None`` if the SRI hash is unknown or disabled.
         :param with_locales: If ``True``, include the version of moment.js that
-                             has all the locales.
+                             has all the locales. To include only some
+                             locales, pass a list of language codes. The
+                             ``MOMENT_LOCALES`` configuration variable can
+                             also be used to give this list.
+        :param engine: The library used to render timestamps in the browser.
+                       The default of ``'moment'`` uses the moment.js library.
+                       Set to ``'intl'`` to use a small implementation of the
+                       moment.js functions used by this extension based on
+                       the ``Intl`` APIs built into modern browsers, instead
+                       of downloading moment.js. If not given, the
+                       ``MOMENT_ENGINE`` configuration variable is used.
+        :param loading: How the browser loads the JavaScript files. The
+                        default of ``'blocking'`` uses plain ``<script>``
+                        tags. Set to ``'defer'`` or ``'async'`` to load them
+                        with these attributes, so that they do not block the
+                        rendering of the page. Locales that are loaded
+                        separately require ``'defer'``. If not given, the
+                        ``MOMENT_LOADING`` configuration variable is used.
+        :param resource_hints: If ``True``, add ``<link>`` tags that tell the
+                               browser to connect to the CDN and preload the
+                               JavaScript files as early as possible. If not
+                               given, the ``MOMENT_RESOURCE_HINTS``
+                               configuration variable is used.
+        :param kwargs: Options for the supporting JavaScript code, as
+                       documented in :func:`flask_moment_js`.
         """
-        mjs = ''
+        if engine is None:
+            engine = current_app.config.get('MOMENT_ENGINE', 'moment') \
+                if has_app_context() else 'moment'
+        if engine not in ('moment', 'intl'):
+            raise ValueError('Invalid engine: {}'.format(engine))
+        if with_locales is True and has_app_context():
+            with_locales = current_app.config.get('MOMENT_LOCALES', True)
+        if isinstance(with_locales, list):
+            with_locales = tuple(with_locales)
+        if has_app_context():
+            if loading is None:
+                loading = current_app.config.get('MOMENT_LOADING')
+            if resource_hints is None:
+                resource_hints = current_app.config.get(
+                    'MOMENT_RESOURCE_HINTS')
+        loading = loading or 'blocking'
+        if loading not in ('blocking', 'defer', 'async'):
+            raise ValueError('Invalid loading mode: {}'.format(loading))
+        return _cached(cls._include_moment, version, local_js, no_js, sri,
+                       with_locales, engine, loading, bool(resource_hints),
+                       **kwargs)
+
+    @classmethod
+    def _include_moment(cls, version, local_js, no_js, sri, with_locales,
+                        engine, loading, resource_hints, **kwargs):
+        inline_js = ''
+        locales_js = ''
+        scripts = []  # tuples with the URL and the SRI hash of each script
+        assets = None
+        if has_app_context():
+            assets = current_app.extensions.get('moment_assets')
+        if engine == 'intl':
+            no_js = True
+            if assets:
+                scripts.append((assets['moment-intl'].url(), None))
+            else:
+                inline_js = '<script>\n{}\n</script>\n'.format(intl_js_code)
+        locales = ()
+        if isinstance(with_locales, tuple):
+            # load the core library and the requested locales separately
+            locales = [lang for lang in with_locales if lang != 'en']
+            with_locales = False
         if version == default_moment_version and local_js is None and \
-                with_locales is True and sri is None:
-            sri = default_moment_sri
+                sri is None:
+            if with_locales is True:
+                sri = default_moment_sri
+            elif not with_locales:
+                sri = default_moment_core_sri
         if not no_js:
             if local_js is not None:
-                if not sri:
-                    mjs = '<script src="{}"></script>\n'.format(local_js)
-                else:
-                    mjs = ('<script src="{}" integrity="{}" '
-                           'crossorigin="anonymous"></script>\n').format(
-                               local_js, sri)
+                scripts.append((local_js, sri))
+            elif assets and version == default_moment_version:
+                # use the bundled copy of moment.js
+                asset = assets['moment-with-locales' if with_locales
+                               else 'moment']
+                scripts.append((asset.url(), None if sri is False
+                                else asset.sri))
             elif version is not None:
                 if with_locales:
                     js_filename = 'moment-with-locales.min.js' \
@@ -102,18 +985,43 @@ class moment(object):
                         else 'moment-with-langs.min.js'
                 else:
                     js_filename = 'moment.min.js'
-
-                if not sri:
-                    mjs = ('<script src="https://cdnjs.cloudflare.com/ajax/'
-                           'libs/moment.js/{}/{}"></script>\n').format(
-                               version, js_filename)
-                else:
-                    mjs = ('<script src="https://cdnjs.cloudflare.com/ajax/'
-                           'libs/moment.js/{}/{}" integrity="{}" '
-                           'crossorigin="anonymous"></script>\n').format(
-                               version, js_filename, sri)
-        return Markup('{}\n<script>\n{}\n</script>\n'''.format(
-            mjs, cls.flask_moment_js()))
+                scripts.append(('https://cdnjs.cloudflare.com/ajax/libs/'
+                                'moment.js/{}/{}'.format(version, js_filename),
+                                sri))
+            if local_js is None and version is not None and locales:
+                if loading == 'async':
+                    raise ValueError('Locales cannot be loaded separately '
+                                     'with async loading')
+                for lang in locales:
+                    if version != default_moment_version:
+                        scripts.append((
+                            'https://cdnjs.cloudflare.com/ajax/libs/moment.js/'
+                            '{}/locale/{}.min.js'.format(version, lang), None))
+                    elif assets:
+                        # use the bundled copy of the locale file
+                        asset = _locale_asset(lang)
+                        scripts.append((asset.url(), None if sri is False
+                                        else asset.sri))
+                    else:
+                        # there are no SRI hashes for the locale files in the
+                        # CDN, so the bundled copies are added inline instead
+                        locales_js += '<script>\n{}\n</script>\n'.format(
+                            _js_when_ready(_locale_js(lang).rstrip('\n')))
+        library = ''.join(
+            _script_tag(src, script_sri, loading, i == len(scripts) - 1)
+            for i, (src, script_sri) in enumerate(scripts))
+        if assets:
+            # the options go first, as the code reads them when it loads
+            runtime = ('<script>\n{}\n</script>\n{}').format(
+                _js_config(**kwargs), _script_tag(
+                    assets['flask-moment'].url(), None, loading))
+            scripts.append((assets['flask-moment'].url(), None))
+        else:
+            runtime = '<script>\n{}\n</script>\n'.format(
+                cls.flask_moment_js(**kwargs))
+        hints = _resource_hints(scripts) if resource_hints else ''
+        return Markup('{}{}{}{}\n{}'.format(
+            hints, inline_js, library, locales_js, runtime))
 
     @staticmethod
     def locale(language='en', auto_detect=False, customization=None):
@@ -125,19 +1033,42 @@ class moment(object):
                               as needed by the moment.js library.
         """
         if auto_detect:
-            return Markup('<script>\nvar locale = '
-                          'window.navigator.userLanguage || '
-                          'window.navigator.language;\n'
-                          'moment.locale(locale);\n</script>')
-        if customization:
-            return Markup(
-                '<script>\nmoment.locale("{}", {});\n</script>'.format(
-                    language, customization))
-        return Markup(
-            '<script>\nmoment.locale("{}");\n</script>'.format(language))
+            code = ('var locale = window.navigator.userLanguage || '
+                    'window.navigator.language;\nmoment.locale(locale);')
+        elif customization:
+            code = 'moment.locale("{}", {});'.format(language, customization)
+        else:
+            code = 'moment.locale("{}");'.format(language)
+        return Markup('<script>\n{}\n</script>'.format(_js_when_ready(code)))
+
+    @staticmethod
+    def data_island():
+        """Return the rendering options used by the timestamps rendered in
+        compact mode.
+
+        When the ``MOMENT_COMPACT`` configuration variable is set to
+        ``True``, timestamps are rendered with minimal markup, and the
+        rendering options that are shared by many timestamps, such as the
+        function and format, are stored only once per page in a JSON data
+        island. This function must be called after all the timestamps have
+        been rendered, typically at the end of the ``<body>`` section of the
+        template::
+
+            {{ moment.data_island() }}
+
+        Each call returns the options that were used since the previous call
+        in the same request.
+        """
+        plans = g.pop('_moment_plans', None)
+        if not plans:
+            return Markup('')
+        return Markup('<script type="application/json" '
+                      'class="flask-moment-data">{}</script>').format(
+                          htmlsafe_json_dumps(plans, sort_keys=True))
 
     @staticmethod
-    def flask_moment_js():
+    def flask_moment_js(refresh_scheduler=None, lazy=None, observe=None,
+                        chunk_size=None, stream=None):
         """Return the JavaScript supporting code for this extension.
 
         This method is provided to enable custom configurations that are not
@@ -159,12 +1090,42 @@ class moment(object):
 
         Note: only the code specific to Flask-Moment is included. When using
         this method, you must include the moment.js library separately.
+
+        :param refresh_scheduler: The strategy used to refresh timestamps
+                                  in the client. The default of ``'shared'``
+                                  uses a single timer for all the elements
+                                  that have the same refresh interval, and
+                                  updates all of them in one pass. Set to
+                                  ``'element'`` to use an individual timer
+                                  for each element. If not given, the
+                                  ``MOMENT_REFRESH_SCHEDULER`` configuration
+                                  variable is used.
+        :param lazy: If ``True``, timestamps are rendered, and their refresh
+                     timers started, only when they are scrolled into view,
+                     and their refresh timers are stopped when they leave the
+                     view. If not given, the ``MOMENT_LAZY`` configuration
+                     variable is used.
+        :param observe: If ``True``, timestamps that are added to the page
+                        after it was loaded, for example through Ajax, are
+                        rendered automatically. If not given, the
+                        ``MOMENT_OBSERVE`` configuration variable is used.
+        :param chunk_size: The maximum number of elements that are updated in
+                           a single animation frame. All the timestamps are
+                           formatted first, and then written to the page in
+                           chunks of this size. Very large pages are also
+                           formatted in chunks of this size, while the
+                           browser is idle. Set to 0 to update all the
+                           elements at once. If not given, the
+                           ``MOMENT_CHUNK_SIZE`` configuration variable is
+                           used, with a default of 1000.
+        :param stream: If ``True``, timestamps are rendered as soon as they
+                       are parsed by the browser, instead of waiting for the
+                       whole page to load. This is useful for long pages that
+                       are streamed to the client. If not given, the
+                       ``MOMENT_STREAM`` configuration variable is used.
         """
-        default_format = ''
-        if 'MOMENT_DEFAULT_FORMAT' in current_app.config:
-            default_format = '\nmoment.defaultFormat = "{}";'.format(
-                current_app.config['MOMENT_DEFAULT_FORMAT'])
-        return '''moment.locale("en");{}\n{}'''.format(default_format, js_code)
+        return _cached(_flask_moment_js, refresh_scheduler, lazy, observe,
+                       chunk_size, stream)
 
     @staticmethod
     def lang(language):
@@ -175,38 +1136,168 @@ class moment(object):
         """
         return moment.locale(language)
 
-    def __init__(self, timestamp=None, local=False):
+    @classmethod
+    def render_many(cls, timestamps, func='format', local=False,
+                    milliseconds=False, separator=None, **kwargs):
+        """Render a sequence of timestamps with the same options.
+
+        This is a more efficient alternative to creating a moment object for
+        each timestamp when rendering large tables::
+
+            {% for cell in moment.render_many(timestamps, 'fromNow',
+                                              refresh=True) %}
+                <td>{{ cell }}</td>
+            {% endfor %}
+
+        :param timestamps: An iterable with ``datetime`` objects or ISO 8601
+                           strings. If NumPy is installed, this argument can
+                           also be a NumPy array or pandas object with
+                           ``datetime64`` values or with Unix epoch times
+                           given in seconds, which are converted to ISO 8601
+                           strings in a single vectorized operation. A
+                           ``None`` element represents the current time, as
+                           in :class:`moment`. Missing values given as
+                           ``NaT`` or ``NaN`` are rendered as empty strings.
+        :param func: The name of the rendering method to use, such as
+                     ``'format'``, ``'fromNow'`` or ``'diff'``.
+        :param local: If ``True``, the timestamps are given in the local
+                      client time.
+        :param milliseconds: If ``True``, timestamps are sent to the client
+                             with millisecond precision.
+        :param separator: If given, the rendered timestamps are joined with
+                          this string and returned as a single ``Markup``
+                          object. If not given, a list of ``Markup`` objects
+                          is returned.
+        :param kwargs: Additional arguments for the rendering method, such as
+                       ``fmt``, ``refresh`` or ``prerender``.
+        """
+        if func not in _render_functions:
+            raise ValueError('Invalid rendering function: {}'.format(func))
+        args = _render_args(func, (), kwargs, local, milliseconds)
+        if _instrumentation:
+            rendered = _instrumented(args[0], _render_sequence, timestamps,
+                                     args, local, milliseconds)
+        else:
+            rendered = _render_sequence(timestamps, args, local, milliseconds)
+        if separator is not None:
+            return Markup(separator).join(rendered)
+        return rendered
+
+    @classmethod
+    def render_stream(cls, timestamps, func='format', chunk_size=100,
+                      separator='', local=False, milliseconds=False,
+                      **kwargs):
+        """Render a sequence of timestamps in chunks, as a generator.
+
+        This function is intended for responses that are streamed to the
+        client, as each chunk can be sent as soon as it is rendered::
+
+            @app.route('/log')
+            def log():
+                return Response(stream_with_context(
+                    moment.render_stream(read_log_timestamps(), 'fromNow',
+                                         separator='<br>')))
+
+        The timestamps are consumed from the iterable one chunk at a time, so
+        they can also come from a generator. In compact mode each chunk is
+        followed by the data island with its rendering options. The
+        ``stream`` option of :func:`flask_moment_js` makes the browser render
+        the timestamps as soon as they arrive.
+
+        :param timestamps: An iterable with timestamps, as accepted by
+                           :func:`render_many`.
+        :param func: The name of the rendering method to use.
+        :param chunk_size: The number of timestamps in each chunk, which must
+                           be at least 1.
+        :param separator: The string that goes between consecutive rendered
+                          timestamps, including those in different chunks.
+        :param local: If ``True``, the timestamps are given in the local
+                      client time.
+        :param milliseconds: If ``True``, timestamps are sent to the client
+                             with millisecond precision.
+        :param kwargs: Additional arguments for the rendering method.
+        """
+        if func not in _render_functions:
+            raise ValueError('Invalid rendering function: {}'.format(func))
+        if chunk_size < 1:
+            raise ValueError('Invalid chunk size: {}'.format(chunk_size))
+        if getattr(timestamps, 'dtype', None) is not None:
+            # arrays are converted in a single operation, as in render_many
+            timestamps = _timestamps_as_iso_8601(
+                timestamps, lambda t: _iso_8601(t, local, milliseconds),
+                local, milliseconds)
+            # missing values are passed on as NaN, since None means now
+            timestamps = [float('nan') if t is None else t
+                          for t in timestamps]
+        timestamps = iter(timestamps)
+
+        def generate():
+            prefix = Markup('')
+            while True:
+                chunk = list(islice(timestamps, chunk_size))
+                if not chunk:
+                    break
+                rendered = prefix + cls.render_many(
+                    chunk, func, local=local, milliseconds=milliseconds,
+                    separator=separator, **kwargs)
+                if _compact_mode():
+                    rendered += cls.data_island()
+                prefix = Markup(separator)
+                yield rendered
+
+        return generate()
+
+    @staticmethod
+    def render_stats():
+        """Return the rendering statistics of the current request.
+
+        Statistics are only collected when the ``MOMENT_INSTRUMENTATION``
+        configuration variable is set to ``True``. The return value is a
+        dictionary with an entry for each rendering function that was used,
+        such as ``'format'`` or ``'fromNow'``. Each entry is a dictionary
+        with the number of spans rendered in ``count``, their size in bytes
+        in ``bytes``, and the time spent rendering them in seconds in
+        ``time``. The dictionary is a copy, so it can be kept after the
+        request ends.
+        """
+        if not has_request_context():
+            return {}
+        return {func: dict(entry)
+                for func, entry in g.get('_moment_stats', {}).items()}
+
+    @staticmethod
+    def render_cache_info():
+        """Return the hit and miss statistics of the render cache.
+
+        The return value is the named tuple returned by the ``cache_info()``
+        method of functions decorated with ``functools.lru_cache``, with
+        ``hits``, ``misses``, ``maxsize`` and ``currsize`` attributes.
+        """
+        return _render_span.cache_info()
+
+    @staticmethod
+    def render_cache_clear():
+        """Clear the render cache and reset its statistics."""
+        _render_span.cache_clear()
+
+    def __init__(self, timestamp=None, local=False, milliseconds=False):
         if timestamp is None:
-            timestamp = _naive_now()
+            timestamp = 'now' if _client_now() else _naive_now()
         self.timestamp = timestamp
         self.local = local
+        self.milliseconds = milliseconds
 
     def _timestamp_as_iso_8601(self, timestamp):
-        if isinstance(timestamp, str):
-            return timestamp  # assume it is already in ISO 8601 format
-        tz = ''
-        if not self.local:
-            tz = 'Z'
-        return timestamp.strftime('%Y-%m-%dT%H:%M:%S' + tz)
+        return _iso_8601(timestamp, self.local, self.milliseconds)
 
     def _render(self, func, format=None, timestamp2=None, no_suffix=None,
-                units=None, refresh=False):
-        t = self._timestamp_as_iso_8601(self.timestamp)
-        data_values = 'data-function="{}"'.format(func)
-        if format:
-            data_values += ' data-format="{}"'.format(format)
-        if timestamp2:
-            data_values += ' data-timestamp2="{}"'.format(timestamp2)
-        if no_suffix:
-            data_values += ' data-nosuffix="1"'
-        if units:
-            data_values += ' data-units="{}"'.format(units)
-        return Markup(('<span class="flask-moment" data-timestamp="{}" ' +
-                       '{} data-refresh="{}" ' +
-                       'style="display: none">{}</span>').format(
-                           t, data_values, int(refresh) * 60000, t))
-
-    def format(self, fmt=None, refresh=False):
+                units=None, refresh=False, prerender=False):
+        return _render_moment(self.timestamp, (
+            func, format, timestamp2, no_suffix, units,
+            _refresh_interval(refresh), prerender), self.local,
+            self.milliseconds)
+
+    def format(self, fmt=None, refresh=False, prerender=False):
         """Format a moment object with a custom formatting string.
 
         :param fmt: The formatting specification to use, as documented by the
@@ -216,10 +1307,20 @@ class moment(object):
                         refreshing is disabled. If set to an integer, the
                         refresh occurs at the indicated interval, given in
                         minutes.
+        :param prerender: If set to ``True``, the timestamp is also formatted
+                          in the server, so that it is visible before the
+                          page finishes loading, and to clients that do not
+                          run JavaScript. The server renders timestamps in
+                          English, in the timezone given by the
+                          ``MOMENT_PRERENDER_TIMEZONE`` configuration
+                          variable, which defaults to UTC. The timestamp is
+                          rendered again in the client, in its own locale and
+                          timezone.
         """
-        return self._render("format", format=(fmt or ''), refresh=refresh)
+        return render_format(self.timestamp, fmt, refresh, prerender,
+                             local=self.local, milliseconds=self.milliseconds)
 
-    def fromNow(self, no_suffix=False, refresh=False):
+    def fromNow(self, no_suffix=False, refresh=False, prerender=False):
         """Render the moment object as a relative time.
 
         This formatting option is often called "time ago", since it renders
@@ -232,12 +1333,18 @@ class moment(object):
                         minute intervals. If set to ``False``, background
                         refreshing is disabled. If set to an integer, the
                         refresh occurs at the indicated interval, given in
-                        minutes.
+                        minutes. If set to ``'adaptive'``, the
+                        timestamp is refreshed when its rendered text is
+                        expected to change, based on its age.
+        :param prerender: If set to ``True``, the timestamp is also rendered
+                          in the server, as explained for :func:`format`.
         """
-        return self._render("fromNow", no_suffix=int(no_suffix),
-                            refresh=refresh)
+        return render_from_now(self.timestamp, no_suffix, refresh, prerender,
+                               local=self.local,
+                               milliseconds=self.milliseconds)
 
-    def fromTime(self, timestamp, no_suffix=False, refresh=False):
+    def fromTime(self, timestamp, no_suffix=False, refresh=False,
+                 prerender=False):
         """Render the moment object as a relative time with respect to a
         given reference time.
 
@@ -251,11 +1358,14 @@ class moment(object):
                         refreshing is disabled. If set to an integer, the
                         refresh occurs at the indicated interval, given in
                         minutes.
+        :param prerender: If set to ``True``, the timestamp is also rendered
+                          in the server, as explained for :func:`format`.
         """
-        return self._render("from", timestamp2=self._timestamp_as_iso_8601(
-            timestamp), no_suffix=int(no_suffix), refresh=refresh)
+        return render_from_time(self.timestamp, timestamp, no_suffix, refresh,
+                                prerender, local=self.local,
+                                milliseconds=self.milliseconds)
 
-    def toNow(self, no_suffix=False, refresh=False):
+    def toNow(self, no_suffix=False, refresh=False, prerender=False):
         """Render the moment object as a relative time.
 
         This function renders as the reverse time interval of ``fromNow()``.
@@ -266,11 +1376,17 @@ class moment(object):
                         minute intervals. If set to ``False``, background
                         refreshing is disabled. If set to an integer, the
                         refresh occurs at the indicated interval, given in
-                        minutes.
+                        minutes. If set to ``'adaptive'``, the
+                        timestamp is refreshed when its rendered text is
+                        expected to change, based on its age.
+        :param prerender: If set to ``True``, the timestamp is also rendered
+                          in the server, as explained for :func:`format`.
         """
-        return self._render("toNow", no_suffix=int(no_suffix), refresh=refresh)
+        return render_to_now(self.timestamp, no_suffix, refresh, prerender,
+                             local=self.local, milliseconds=self.milliseconds)
 
-    def toTime(self, timestamp, no_suffix=False, refresh=False):
+    def toTime(self, timestamp, no_suffix=False, refresh=False,
+               prerender=False):
         """Render the moment object as a relative time with respect to a
         given reference time.
 
@@ -284,11 +1400,14 @@ class moment(object):
                         refreshing is disabled. If set to an integer, the
                         refresh occurs at the indicated interval, given in
                         minutes.
+        :param prerender: If set to ``True``, the timestamp is also rendered
+                          in the server, as explained for :func:`format`.
         """
-        return self._render("to", timestamp2=self._timestamp_as_iso_8601(
-            timestamp), no_suffix=int(no_suffix), refresh=refresh)
+        return render_to_time(self.timestamp, timestamp, no_suffix, refresh,
+                              prerender, local=self.local,
+                              milliseconds=self.milliseconds)
 
-    def calendar(self, refresh=False):
+    def calendar(self, refresh=False, prerender=False):
         """Render the moment object as a relative time, either to current time
         or a given reference timestamp.
 
@@ -299,36 +1418,54 @@ class moment(object):
                         minute intervals. If set to ``False``, background
                         refreshing is disabled. If set to an integer, the
                         refresh occurs at the indicated interval, given in
-                        minutes.
+                        minutes. If set to ``'adaptive'``, the
+                        timestamp is refreshed when its rendered text is
+                        expected to change, based on its age.
+        :param prerender: If set to ``True``, the timestamp is also rendered
+                          in the server, as explained for :func:`format`.
         """
-        return self._render("calendar", refresh=refresh)
+        return render_calendar(self.timestamp, refresh, prerender,
+                               local=self.local,
+                               milliseconds=self.milliseconds)
 
     def valueOf(self, refresh=False):
         """Render the moment object as milliseconds from Unix Epoch.
 
+        The value is calculated in the server, unless the timestamp is given
+        in the local time of the client or the ``refresh`` argument is given.
+
         :param refresh: If set to ``True``, refresh the timestamp at one
                         minute intervals. If set to ``False``, background
                         refreshing is disabled. If set to an integer, the
                         refresh occurs at the indicated interval, given in
                         minutes.
         """
-        return self._render("valueOf", refresh=refresh)
+        return render_value_of(self.timestamp, refresh, local=self.local,
+                               milliseconds=self.milliseconds)
 
     def unix(self, refresh=False):
         """Render the moment object as seconds from Unix Epoch.
 
+        The value is calculated in the server, unless the timestamp is given
+        in the local time of the client or the ``refresh`` argument is given.
+
         :param refresh: If set to ``True``, refresh the timestamp at one
                         minute intervals. If set to ``False``, background
                         refreshing is disabled. If set to an integer, the
                         refresh occurs at the indicated interval, given in
                         minutes.
         """
-        return self._render("unix", refresh=refresh)
+        return render_unix(self.timestamp, refresh, local=self.local,
+                           milliseconds=self.milliseconds)
 
     def diff(self, timestamp, units, refresh=False):
         """Render the difference between the moment object and the given
         timestamp using the provided units.
 
+        When the units are hours or smaller, the difference is calculated in
+        the server, unless the timestamps are given in the local time of the
+        client or the ``refresh`` argument is given.
+
         :param timestamp: The reference ``datetime`` object or ISO 8601 string.
         :param units: A time unit such as `years`, `months`, `weeks`, `days`,
                       `hours`, `minutes` or `seconds`.
@@ -338,8 +1475,130 @@ class moment(object):
                         refresh occurs at the indicated interval, given in
                         minutes.
         """
-        return self._render("diff", timestamp2=self._timestamp_as_iso_8601(
-            timestamp), units=units, refresh=refresh)
+        return render_diff(self.timestamp, timestamp, units, refresh,
+                           local=self.local, milliseconds=self.milliseconds)
+
+
+# names of the template filters, and the rendering methods they map to
+_template_filters = {
+    'moment_format': 'format',
+    'moment_from_now': 'fromNow',
+    'moment_from_time': 'fromTime',
+    'moment_to_now': 'toNow',
+    'moment_to_time': 'toTime',
+    'moment_calendar': 'calendar',
+    'moment_value_of': 'valueOf',
+    'moment_unix': 'unix',
+    'moment_diff': 'diff',
+}
+
+
+def _render_resolved(timestamp, local, milliseconds, *args):
+    """Template filter that renders a timestamp with rendering arguments that
+    were resolved by :class:`MomentExtension` when the template was
+    compiled."""
+    return _render_moment(timestamp, args, local, milliseconds)
+
+
+def _literal_token(lineno, value):
+    if value is None or isinstance(value, bool):
+        return Token(lineno, 'name', str(value).lower())
+    if isinstance(value, int):
+        return Token(lineno, 'integer', value)
+    return Token(lineno, 'string', value)
+
+
+class MomentExtension(Extension):
+    """Jinja extension that resolves the arguments of the moment template
+    filters when the template is compiled.
+
+    When a filter such as ``moment_format`` is called with arguments that are
+    all literal constants, the filter is replaced with one that receives the
+    arguments in the form used internally, so that rendering each timestamp
+    only does the work that depends on the timestamp. Filters that have
+    variable arguments are left unchanged.
+    """
+    _constants = {'none': None, 'None': None, 'true': True, 'True': True,
+                  'false': False, 'False': False}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.filters['_moment_resolved'] = _render_resolved
+
+    def _parse_arguments(self, tokens, i):
+        """Parse the literal arguments of a filter call that start at
+        ``tokens[i]``, returning the positional arguments, the keyword
+        arguments and the index of the next token, or ``None`` if any of the
+        arguments is not a literal constant."""
+        args, kwargs = [], {}
+        if tokens[i].type != 'lparen':
+            return args, kwargs, i
+        i += 1
+        while tokens[i].type != 'rparen':
+            if tokens[i].type == 'eof':
+                return None
+            name = None
+            if tokens[i].type == 'name' and tokens[i + 1].type == 'assign':
+                name = tokens[i].value
+                i += 2
+            token = tokens[i]
+            if token.type in ('string', 'integer', 'float'):
+                value = token.value
+            elif token.type == 'name' and token.value in self._constants:
+                value = self._constants[token.value]
+            else:
+                return None
+            if name is not None:
+                kwargs[name] = value
+            elif kwargs:
+                return None
+            else:
+                args.append(value)
+            i += 1
+            if tokens[i].type == 'comma':
+                i += 1
+            elif tokens[i].type != 'rparen':
+                return None
+        return args, kwargs, i + 1
+
+    def _resolve(self, func, args, kwargs, lineno):
+        """Return the tokens of a call to the filter that takes resolved
+        arguments, or ``None`` if the arguments are not valid."""
+        local = kwargs.pop('local', False)
+        milliseconds = kwargs.pop('milliseconds', False)
+        try:
+            resolved = _render_args(func, args, kwargs, local, milliseconds)
+        except (TypeError, ValueError):
+            return None  # let the error be reported when rendering
+        tokens = [Token(lineno, 'name', '_moment_resolved'),
+                  Token(lineno, 'lparen', '(')]
+        for value in (local, milliseconds) + resolved:
+            tokens += [_literal_token(lineno, value),
+                       Token(lineno, 'comma', ',')]
+        tokens[-1] = Token(lineno, 'rparen', ')')
+        return tokens
+
+    def filter_stream(self, stream):
+        # the last token is always followed by the end of the stream, so that
+        # the parsing functions can look ahead without checking the length
+        tokens = list(stream) + [Token(stream.current.lineno, 'eof', '')]
+        i = 0
+        while i < len(tokens) - 1:
+            token = tokens[i]
+            yield token
+            i += 1
+            if token.type != 'pipe' or tokens[i].type != 'name' or \
+                    tokens[i].value not in _template_filters:
+                continue
+            parsed = self._parse_arguments(tokens, i + 1)
+            if parsed is None:
+                continue
+            args, kwargs, end = parsed
+            resolved = self._resolve(_template_filters[tokens[i].value],
+                                     args, kwargs, tokens[i].lineno)
+            if resolved is not None:
+                yield from resolved
+                i = end
 
 
 class Moment(object):
@@ -348,10 +1607,32 @@ class Moment(object):
             self.init_app(app)
 
     def init_app(self, app):
+        global _instrumentation
         if not hasattr(app, 'extensions'):  # pragma: no cover
             app.extensions = {}
         app.extensions['moment'] = moment
+        app.extensions['moment_cache'] = {}
         app.context_processor(self.context_processor)
+        for name, func in _template_filters.items():
+            function = _render_function_map[func]
+            if func in ('fromTime', 'toTime', 'diff'):
+                function = _template_filter(function)
+            app.add_template_filter(function, name)
+        if app.config.get('MOMENT_JINJA_EXTENSION', False):
+            app.jinja_env.add_extension(MomentExtension)
+        if app.config.get('MOMENT_INSTRUMENTATION', False):
+            _instrumentation = True
+            app.extensions['moment_instrumentation'] = True
+            app.after_request(_add_server_timing)
+            app.teardown_request(_send_render_stats)
+        if app.config.get('MOMENT_SERVE_STATIC', False):
+            assets = _static_assets()
+            app.register_blueprint(create_blueprint(
+                {asset.filename: asset for asset in assets.values()},
+                url_prefix=app.config.get('MOMENT_STATIC_URL_PATH',
+                                          '/flask-moment'),
+                fallback=_locale_asset_for))
+            app.extensions['moment_assets'] = assets
 
     @staticmethod
     def context_processor():
@@ -359,8 +1640,22 @@ class Moment(object):
             'moment': current_app.extensions['moment']
         }
 
-    def flask_moment_js(self):
-        return current_app.extensions['moment'].flask_moment_js()
+    def flask_moment_js(self, **kwargs):
+        return current_app.extensions['moment'].flask_moment_js(**kwargs)
+
+    def data_island(self):
+        return current_app.extensions['moment'].data_island()
+
+    def render_many(self, timestamps, func='format', **kwargs):
+        return current_app.extensions['moment'].render_many(
+            timestamps, func, **kwargs)
+
+    def render_stream(self, timestamps, func='format', **kwargs):
+        return current_app.extensions['moment'].render_stream(
+            timestamps, func, **kwargs)
+
+    def render_stats(self):
+        return current_app.extensions['moment'].render_stats()
 
     def create(self, timestamp=None):
         return current_app.extensions['moment'](timestamp)
@@ -0,0 +1,84 @@
+import base64
+import gzip
+import hashlib
+import os
+
+from flask import Blueprint, abort, request, url_for
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+static_folder = os.path.join(os.path.dirname(__file__), 'static')
+
+
+class Asset(object):
+    """A JavaScript file served by the extension.
+
+    The contents of the file are loaded once, along with gzip and brotli
+    compressed versions of them. The public name of the asset includes a
+    hash of its contents, so that it can be cached by browsers forever.
+
+    :param name: The name of the asset, without the extension.
+    :param content: The contents of the asset, as a string.
+    """
+    def __init__(self, name, content):
+        self.content = content.encode('utf-8')
+        digest = hashlib.sha512(self.content).digest()
+        self.etag = hashlib.sha256(self.content).hexdigest()[:16]
+        self.filename = '{}.{}.js'.format(name, self.etag)
+        self.sri = 'sha512-' + base64.b64encode(digest).decode('utf-8')
+        self.encodings = {'gzip': gzip.compress(self.content, 9)}
+        if brotli is not None:
+            self.encodings['br'] = brotli.compress(self.content)
+
+    @classmethod
+    def from_file(cls, name, filename):
+        with open(os.path.join(static_folder, filename),
+                  encoding='utf-8') as f:
+            return cls(name, f.read())
+
+    def url(self):
+        return url_for('flask_moment.asset', filename=self.filename)
+
+    def response(self):
+        headers = {
+            'Content-Type': 'application/javascript; charset=utf-8',
+            'Cache-Control': 'public, max-age=31536000, immutable',
+            'ETag': '"{}"'.format(self.etag),
+            'Vary': 'Accept-Encoding',
+        }
+        if self.etag in request.if_none_match:
+            return '', 304, headers
+        for encoding in ('br', 'gzip'):
+            # encodings refused by the client with q=0 are not used
+            if encoding in self.encodings and \
+                    request.accept_encodings[encoding] > 0:
+                headers['Content-Encoding'] = encoding
+                return self.encodings[encoding], 200, headers
+        return self.content, 200, headers
+
+
+def create_blueprint(assets, url_prefix='/flask-moment', fallback=None):
+    """Return a blueprint that serves the given assets.
+
+    :param assets: A dictionary with the assets to serve, keyed by their
+                   public filenames.
+    :param url_prefix: The URL prefix for the assets.
+    :param fallback: A function that returns the asset for a public filename
+                     that is not in ``assets``, or ``None`` if the file does
+                     not exist. This is used for assets that are loaded on
+                     first use.
+    """
+    bp = Blueprint('flask_moment', __name__, url_prefix=url_prefix)
+
+    @bp.route('/<filename>')
+    def asset(filename):
+        asset = assets.get(filename)
+        if asset is None and fallback is not None:
+            asset = fallback(filename)
+        if asset is None:
+            abort(404)
+        return asset.response()
+
+    return bp
@@ -0,0 +1,375 @@
+"""Server-side implementation of the ``format()`` function from moment.js.
+
+Format strings are compiled once into a list of token functions, which are
+then applied to the timestamps being formatted. The tokens and their output
+follow the behavior of moment.js in its default (local time) mode.
+"""
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+import re
+
+from .locales import get_locale
+
+# regular expressions used by moment.js to find the formatting tokens
+_format_tokens = re.compile(
+    r'(\[[^\[]*\])|(\\)?([Hh]mm(ss)?|Mo|MM?M?M?|Do|DDDo|DD?D?D?|ddd?d?|do?|'
+    r'w[o|w]?|W[o|W]?|Qo?|N{1,5}|YYYYYY|YYYYY|YYYY|YY|y{2,4}|yo?|'
+    r'gg(ggg?)?|GG(GGG?)?|e|E|a|A|hh?|HH?|kk?|mm?|ss?|S{1,9}|x|X|zz?|ZZ?|.)')
+_long_date_tokens = re.compile(r'(\[[^\[]*\])|(\\)?(LTS|LT|LL?L?L?|l{1,4})')
+_epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _zero_fill(number, length, force_sign=False):
+    sign = '-' if number < 0 else '+' if force_sign else ''
+    return sign + str(abs(number)).zfill(length)
+
+
+def _long_date_format(token, locale):
+    if token in locale.long_date_format:
+        return locale.long_date_format[token]
+    upper = locale.long_date_format.get(token.upper())
+    if upper is None:
+        return token
+    # the lowercase formats are abbreviated versions of the uppercase ones
+    tokens = [m.group(0) for m in _format_tokens.finditer(upper)]
+    return ''.join(tok[1:] if tok in ('MMMM', 'MM', 'DD', 'dddd') else tok
+                   for tok in tokens)
+
+
+def _expand_format(fmt, locale):
+    """Replace the localized format tokens such as ``LLL`` with the formats
+    they represent in the given locale."""
+    def replace(match):
+        # escaped tokens are left for the formatter, which outputs them as
+        # literal text
+        if match.group(1) or match.group(2):
+            return match.group(0)
+        return _long_date_format(match.group(3), locale)
+
+    for _ in range(6):
+        expanded = _long_date_tokens.sub(replace, fmt)
+        if expanded == fmt:
+            break
+        fmt = expanded
+    return fmt
+
+
+def _day_of_week(dt):
+    return dt.isoweekday() % 7
+
+
+def _day_of_year(dt):
+    return dt.timetuple().tm_yday
+
+
+def _first_week_offset(year, dow, doy):
+    first_week_day = 7 + dow - doy
+    weekday = _day_of_week(date(year, 1, 1) + timedelta(
+        days=first_week_day - 1))
+    return -((7 + weekday - dow) % 7) + first_week_day - 1
+
+
+def _weeks_in_year(year, dow, doy):
+    days = 366 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) \
+        else 365
+    return (days - _first_week_offset(year, dow, doy) +
+            _first_week_offset(year + 1, dow, doy)) // 7
+
+
+def _week_of_year(dt, dow, doy):
+    """Return the week number and week year of a date, for a week that starts
+    on day ``dow`` and a first week that includes January ``7 + dow - doy``.
+    """
+    week = (_day_of_year(dt) - _first_week_offset(dt.year, dow, doy) - 1) \
+        // 7 + 1
+    if week < 1:
+        return week + _weeks_in_year(dt.year - 1, dow, doy), dt.year - 1
+    weeks = _weeks_in_year(dt.year, dow, doy)
+    if week > weeks:
+        return week - weeks, dt.year + 1
+    return week, dt.year
+
+
+def _locale_week(dt, locale):
+    return _week_of_year(dt, locale.week['dow'], locale.week['doy'])
+
+
+def _iso_week(dt):
+    return _week_of_year(dt, 1, 4)
+
+
+def _millisecond(dt):
+    return dt.microsecond // 1000
+
+
+def _utc_offset(dt, separator):
+    offset = dt.utcoffset()
+    minutes = 0 if offset is None else int(offset.total_seconds()) // 60
+    sign = '+'
+    if minutes < 0:
+        minutes = -minutes
+        sign = '-'
+    return sign + _zero_fill(minutes // 60, 2) + separator + _zero_fill(
+        minutes % 60, 2)
+
+
+def _value_of(dt):
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _epoch) // timedelta(milliseconds=1)
+
+
+def _token(func, padding=None, force_sign=False):
+    if padding is None:
+        return lambda dt, locale: str(func(dt, locale))
+    return lambda dt, locale: _zero_fill(func(dt, locale), padding, force_sign)
+
+
+def _ordinal(func, token):
+    return lambda dt, locale: locale.ordinal(func(dt, locale), token)
+
+
+def _fraction(digits):
+    if digits <= 3:
+        return lambda dt, locale: _zero_fill(
+            _millisecond(dt) // 10 ** (3 - digits), digits)
+    return lambda dt, locale: _zero_fill(
+        _millisecond(dt) * 10 ** (digits - 3), digits)
+
+
+def _month(dt, locale):
+    return dt.month
+
+
+def _quarter(dt, locale):
+    return (dt.month + 2) // 3
+
+
+def _date(dt, locale):
+    return dt.day
+
+
+def _yday(dt, locale):
+    return _day_of_year(dt)
+
+
+def _wday(dt, locale):
+    return _day_of_week(dt)
+
+
+def _locale_wday(dt, locale):
+    return (_day_of_week(dt) + 7 - locale.week['dow']) % 7
+
+
+def _week(dt, locale):
+    return _locale_week(dt, locale)[0]
+
+
+def _week_year(dt, locale):
+    return _locale_week(dt, locale)[1]
+
+
+def _short_week_year(dt, locale):
+    return _locale_week(dt, locale)[1] % 100
+
+
+def _isoweek(dt, locale):
+    return _iso_week(dt)[0]
+
+
+def _isoweek_year(dt, locale):
+    return _iso_week(dt)[1]
+
+
+def _short_isoweek_year(dt, locale):
+    return _iso_week(dt)[1] % 100
+
+
+def _year(dt, locale):
+    return dt.year
+
+
+def _short_year(dt, locale):
+    return dt.year % 100
+
+
+def _signed_year(dt, locale):
+    return _zero_fill(dt.year, 4) if dt.year <= 9999 else '+' + str(dt.year)
+
+
+def _hour(dt, locale):
+    return dt.hour
+
+
+def _hour12(dt, locale):
+    return dt.hour % 12 or 12
+
+
+def _hour24(dt, locale):
+    return dt.hour or 24
+
+
+def _minute(dt, locale):
+    return dt.minute
+
+
+def _second(dt, locale):
+    return dt.second
+
+
+_token_functions = {
+    'M': _token(_month),
+    'MM': _token(_month, 2),
+    'Mo': _ordinal(_month, 'M'),
+    'MMM': lambda dt, locale: locale.months_short[dt.month - 1],
+    'MMMM': lambda dt, locale: locale.months[dt.month - 1],
+    'Q': _token(_quarter),
+    'Qo': _ordinal(_quarter, 'Q'),
+    'D': _token(_date),
+    'DD': _token(_date, 2),
+    'Do': _ordinal(_date, 'D'),
+    'DDD': _token(_yday),
+    'DDDD': _token(_yday, 3),
+    'DDDo': _ordinal(_yday, 'DDD'),
+    'd': _token(_wday),
+    'do': _ordinal(_wday, 'd'),
+    'dd': lambda dt, locale: locale.weekdays_min[_day_of_week(dt)],
+    'ddd': lambda dt, locale: locale.weekdays_short[_day_of_week(dt)],
+    'dddd': lambda dt, locale: locale.weekdays[_day_of_week(dt)],
+    'e': _token(_locale_wday),
+    'E': lambda dt, locale: str(dt.isoweekday()),
+    'w': _token(_week),
+    'ww': _token(_week, 2),
+    'wo': _ordinal(_week, 'w'),
+    'W': _token(_isoweek),
+    'WW': _token(_isoweek, 2),
+    'Wo': _ordinal(_isoweek, 'W'),
+    'gg': _token(_short_week_year, 2),
+    'gggg': _token(_week_year, 4),
+    'ggggg': _token(_week_year, 5),
+    'GG': _token(_short_isoweek_year, 2),
+    'GGGG': _token(_isoweek_year, 4),
+    'GGGGG': _token(_isoweek_year, 5),
+    'Y': _signed_year,
+    'YY': _token(_short_year, 2),
+    'YYYY': _token(_year, 4),
+    'YYYYY': _token(_year, 5),
+    'YYYYYY': _token(_year, 6, True),
+    'N': lambda dt, locale: locale.eras['abbr'],
+    'NN': lambda dt, locale: locale.eras['abbr'],
+    'NNN': lambda dt, locale: locale.eras['abbr'],
+    'NNNN': lambda dt, locale: locale.eras['name'],
+    'NNNNN': lambda dt, locale: locale.eras['narrow'],
+    'y': _token(_year, 1),
+    'yy': _token(_year, 2),
+    'yyy': _token(_year, 3),
+    'yyyy': _token(_year, 4),
+    'yo': _ordinal(_year, 'y'),
+    'H': _token(_hour),
+    'HH': _token(_hour, 2),
+    'h': _token(_hour12),
+    'hh': _token(_hour12, 2),
+    'k': _token(_hour24),
+    'kk': _token(_hour24, 2),
+    'hmm': lambda dt, locale: '{}{:02d}'.format(
+        _hour12(dt, locale), dt.minute),
+    'hmmss': lambda dt, locale: '{}{:02d}{:02d}'.format(
+        _hour12(dt, locale), dt.minute, dt.second),
+    'Hmm': lambda dt, locale: '{}{:02d}'.format(dt.hour, dt.minute),
+    'Hmmss': lambda dt, locale: '{}{:02d}{:02d}'.format(
+        dt.hour, dt.minute, dt.second),
+    'm': _token(_minute),
+    'mm': _token(_minute, 2),
+    's': _token(_second),
+    'ss': _token(_second, 2),
+    'S': _fraction(1),
+    'a': lambda dt, locale: locale.meridiem(dt.hour, dt.minute, True),
+    'A': lambda dt, locale: locale.meridiem(dt.hour, dt.minute, False),
+    'Z': lambda dt, locale: _utc_offset(dt, ':'),
+    'ZZ': lambda dt, locale: _utc_offset(dt, ''),
+    'z': lambda dt, locale: '',
+    'zz': lambda dt, locale: '',
+    'X': lambda dt, locale: str(_value_of(dt) // 1000),
+    'x': lambda dt, locale: str(_value_of(dt)),
+}
+for _digits in range(2, 10):
+    _token_functions['S' * _digits] = _fraction(_digits)
+
+
+def _literal(token):
+    if token.startswith('[') and len(token) > 1:
+        return token[1:-1] if token.endswith(']') else token[1:]
+    return token.replace('\\', '')
+
+
+@lru_cache(maxsize=1024)
+def compile_format(fmt, language='en'):
+    """Compile a moment.js format string into a function that formats
+    ``datetime`` objects.
+
+    The compiled functions are cached, so each format string is only parsed
+    once. Naive ``datetime`` objects are formatted as if they were in UTC.
+
+    :param fmt: The format string, as documented for the ``format()``
+                function from moment.js.
+    :param language: The language code of the locale to use.
+    """
+    locale = get_locale(language)
+    parts = []
+    for match in _format_tokens.finditer(_expand_format(fmt, locale)):
+        token = match.group(0)
+        func = _token_functions.get(token)
+        if func is None:
+            text = _literal(token)
+            if parts and isinstance(parts[-1], str):
+                parts[-1] += text
+            else:
+                parts.append(text)
+        else:
+            parts.append(func)
+
+    def formatter(dt):
+        return ''.join([part if isinstance(part, str) else part(dt, locale)
+                        for part in parts])
+
+    return formatter
+
+
+def parse_iso_8601(timestamp, tz=timezone.utc):
+    """Parse an ISO 8601 timestamp into a ``datetime`` object in the given
+    timezone.
+
+    Timestamps that do not have a timezone are assumed to be given in the
+    local time of the ``tz`` timezone.
+
+    :param timestamp: The ISO 8601 string, as generated for the
+                      ``data-timestamp`` attribute of rendered elements.
+    :param tz: The timezone of the returned ``datetime`` object.
+    """
+    if timestamp.endswith('Z'):
+        dt = datetime.fromisoformat(timestamp[:-1]).replace(
+            tzinfo=timezone.utc)
+    else:
+        dt = datetime.fromisoformat(timestamp)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=tz)
+    return dt.astimezone(tz)
+
+
+def format_timestamp(timestamp, fmt, language='en', tz=timezone.utc):
+    """Format a ``datetime`` object or ISO 8601 string with a moment.js
+    format string.
+
+    :param timestamp: The ``datetime`` object or ISO 8601 string to format.
+                      Naive ``datetime`` objects are assumed to be in UTC.
+    :param fmt: The format string.
+    :param language: The language code of the locale to use.
+    :param tz: The timezone in which the timestamp is formatted.
+    """
+    if isinstance(timestamp, str):
+        dt = parse_iso_8601(timestamp, tz)
+    else:
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        dt = timestamp.astimezone(tz)
+    return compile_format(fmt, language)(dt)
@@ -0,0 +1,299 @@
+"""Server-side implementation of the relative time functions from moment.js.
+
+The functions in this module reproduce the ``from()``, ``to()``,
+``fromNow()``, ``toNow()`` and ``calendar()`` functions, including the
+thresholds that moment.js uses to pick a time unit, the calendar month
+arithmetic of its durations and the calendar buckets. Timestamps are given as
+timezone aware ``datetime`` objects, and are interpreted in their own
+timezone, as moment.js does in the local timezone of the browser.
+"""
+from calendar import monthrange
+from datetime import datetime, timedelta, timezone
+import math
+
+from .formatter import compile_format
+from .locales import get_locale
+
+# thresholds used by moment.js to pick the unit of a relative time
+thresholds = {'ss': 44, 's': 45, 'm': 45, 'h': 22, 'd': 26, 'M': 11}
+
+# relative times with a reference of "now" are searched for their next change
+# within this time, and are assumed to be stable past it
+_horizon = timedelta(days=366)
+_epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_millisecond = timedelta(milliseconds=1)
+
+
+def _round(number):
+    """Round a number like ``Math.round()`` in JavaScript."""
+    return math.floor(number + 0.5)
+
+
+def _value_of(dt):
+    return (dt - _epoch) // _millisecond
+
+
+def _add_months(dt, months):
+    month = dt.month - 1 + months
+    year = dt.year + month // 12
+    month = month % 12 + 1
+    return dt.replace(year=year, month=month,
+                      day=min(dt.day, monthrange(year, month)[1]))
+
+
+def _difference(base, other):
+    """Return the difference between two timestamps, with ``base`` not after
+    ``other``, as a number of whole calendar months and the remaining
+    milliseconds."""
+    months = (other.year - base.year) * 12 + other.month - base.month
+    if _value_of(_add_months(base, months)) > _value_of(other):
+        months -= 1
+    return months, _value_of(other) - _value_of(_add_months(base, months))
+
+
+def _relative_unit(months, milliseconds):
+    """Return the locale key and the number for a duration, using the
+    thresholds from moment.js."""
+    days = _round(months * 146097 / 4800)
+    seconds = _round(days * 86400 + milliseconds / 1000)
+    minutes = _round(days * 1440 + milliseconds / 6e4)
+    hours = _round(days * 24 + milliseconds / 36e5)
+    days = _round(days + milliseconds / 864e5)
+    total_months = months + milliseconds / 864e5 * 4800 / 146097
+    if seconds <= thresholds['ss']:
+        return 's', seconds
+    if seconds < thresholds['s']:
+        return 'ss', seconds
+    if minutes <= 1:
+        return 'm', 1
+    if minutes < thresholds['m']:
+        return 'mm', minutes
+    if hours <= 1:
+        return 'h', 1
+    if hours < thresholds['h']:
+        return 'hh', hours
+    if days <= 1:
+        return 'd', 1
+    if days < thresholds['d']:
+        return 'dd', days
+    if _round(total_months) <= 1:
+        return 'M', 1
+    if _round(total_months) < thresholds['M']:
+        return 'MM', _round(total_months)
+    if _round(total_months / 12) <= 1:
+        return 'y', 1
+    return 'yy', _round(total_months / 12)
+
+
+def _substitute(output, placeholder, *args):
+    if callable(output):
+        return output(*args)
+    return output.replace(placeholder, str(args[0]), 1)
+
+
+def relative_time(timestamp, reference, no_suffix=False, language='en'):
+    """Return the relative time of a timestamp with respect to a reference
+    timestamp, as ``moment(timestamp).from(reference)`` in moment.js.
+
+    :param timestamp: The timezone aware ``datetime`` object to render.
+    :param reference: The timezone aware reference ``datetime`` object.
+    :param no_suffix: If ``True``, the text does not include the suffix (the
+                      "ago" or similar).
+    :param language: The language code of the locale to use.
+    """
+    locale = get_locale(language)
+    reference = reference.astimezone(timestamp.tzinfo)
+    is_future = _value_of(timestamp) > _value_of(reference)
+    if is_future:
+        months, milliseconds = _difference(reference, timestamp)
+    else:
+        months, milliseconds = _difference(timestamp, reference)
+    key, number = _relative_unit(months, milliseconds)
+    output = _substitute(locale.relative_time[key], '%d', number or 1,
+                         bool(no_suffix), key, is_future)
+    if no_suffix:
+        return output
+    return _substitute(locale.relative_time['future' if is_future
+                                            else 'past'], '%s', output)
+
+
+def _short_buckets():
+    """Return the relative time buckets that are smaller than a month, as
+    tuples with the key, the upper limit in milliseconds and the size of the
+    unit in milliseconds."""
+    return [
+        ('s', (thresholds['ss'] + 0.5) * 1000, 1000),
+        ('ss', (thresholds['s'] - 0.5) * 1000, 1000),
+        ('m', 1.5 * 6e4, 6e4),
+        ('mm', (thresholds['m'] - 0.5) * 6e4, 6e4),
+        ('h', 1.5 * 36e5, 36e5),
+        ('hh', (thresholds['h'] - 0.5) * 36e5, 36e5),
+        ('d', 1.5 * 864e5, 864e5),
+        ('dd', (thresholds['d'] - 0.5) * 864e5, 864e5),
+    ]
+
+
+def _next_change(elapsed, increasing, crossing, locale):
+    """Return the number of milliseconds until the relative time of a
+    duration of ``elapsed`` milliseconds changes, or ``None`` if the duration
+    is given in months or years.
+
+    In these buckets the duration is the exact time difference, since the
+    shortest month is longer than the last bucket, so the limits of each
+    bucket and the points where the rounded number changes can be calculated
+    directly.
+    """
+    lower = 0
+    for key, upper, unit in _short_buckets():
+        if elapsed < upper:
+            break
+        lower = upper
+    else:
+        return None
+    if upper > 28 * 864e5:  # pragma: no cover
+        return None  # the thresholds were changed to include months
+    output = locale.relative_time[key]
+    number = None
+    if callable(output) or '%d' in output:
+        number = _round(elapsed / unit)
+    if increasing:
+        if number is not None:
+            upper = min(upper, (number + 0.5) * unit)
+        return math.ceil(upper) - elapsed
+    if number is not None:
+        lower = max(lower, (number - 0.5) * unit)
+    if lower == 0:
+        # the text changes when the timestamp goes from future to past
+        return elapsed + crossing
+    return elapsed - math.ceil(lower) + 1
+
+
+def _valid_until(text_at, now, limit):
+    """Return the first time after ``now`` at which ``text_at()`` returns a
+    different text, searching up to ``limit``.
+
+    The search assumes that once the text changes, it does not return to its
+    value at ``now`` before ``limit``. If the text does not change, ``limit``
+    is returned.
+    """
+    text = text_at(now)
+    low, high = 0, (limit - now) // _millisecond
+    if text_at(now + high * _millisecond) == text:
+        return limit
+    while high - low > 1:
+        middle = (low + high) // 2
+        if text_at(now + middle * _millisecond) == text:
+            low = middle
+        else:
+            high = middle
+    return now + high * _millisecond
+
+
+def _relative_to_now(text_at, timestamp, now, crossing, language):
+    # the arithmetic is done in UTC, as adding a duration to a timestamp in
+    # a timezone with daylight saving time gives the wrong wall clock time
+    now = now.astimezone(timezone.utc)
+    text = text_at(now)
+    elapsed = _value_of(now) - _value_of(timestamp)
+    change = _next_change(abs(elapsed), elapsed >= 0, crossing,
+                          get_locale(language))
+    if change is not None:
+        return text, now + change * _millisecond
+    limit = now + _horizon
+    if elapsed < 0:
+        # the text of future timestamps changes when they become past
+        limit = min(limit, timestamp)
+    return text, _valid_until(text_at, now, limit)
+
+
+def from_now(timestamp, now, no_suffix=False, language='en'):
+    """Return the relative time of a timestamp with respect to the current
+    time, as ``moment(timestamp).fromNow()`` in moment.js.
+
+    The return value is a tuple with the text, and the time until which the
+    text remains valid, in UTC. Before this time, rendering the timestamp
+    again returns the same text, so the result can be cached.
+
+    :param timestamp: The timezone aware ``datetime`` object to render.
+    :param now: The timezone aware ``datetime`` object with the current time.
+    :param no_suffix: If ``True``, the text does not include the suffix (the
+                      "ago" or similar).
+    :param language: The language code of the locale to use.
+    """
+    def text_at(t):
+        return relative_time(timestamp, t, no_suffix, language)
+
+    return _relative_to_now(text_at, timestamp, now, 0, language)
+
+
+def to_now(timestamp, now, no_suffix=False, language='en'):
+    """Return the relative time of the current time with respect to a
+    timestamp, as ``moment(timestamp).toNow()`` in moment.js.
+
+    The return value is a tuple with the text, and the time until which the
+    text remains valid, in UTC.
+
+    :param timestamp: The timezone aware ``datetime`` object to render.
+    :param now: The timezone aware ``datetime`` object with the current time.
+    :param no_suffix: If ``True``, the text does not include the suffix (the
+                      "ago" or similar).
+    :param language: The language code of the locale to use.
+    """
+    def text_at(t):
+        return relative_time(t.astimezone(timestamp.tzinfo), timestamp,
+                             no_suffix, language)
+
+    return _relative_to_now(text_at, timestamp, now, 1, language)
+
+
+def _calendar_bucket(diff):
+    if diff < -6:
+        return 'sameElse'
+    if diff < -1:
+        return 'lastWeek'
+    if diff < 0:
+        return 'lastDay'
+    if diff < 1:
+        return 'sameDay'
+    if diff < 2:
+        return 'nextDay'
+    if diff < 7:
+        return 'nextWeek'
+    return 'sameElse'
+
+
+def calendar(timestamp, now, language='en'):
+    """Return the calendar time of a timestamp with respect to the current
+    time, as ``moment(timestamp).calendar()`` in moment.js.
+
+    The return value is a tuple with the text, and the time until which the
+    text remains valid, which is always a midnight in the timezone of the
+    timestamp, given in UTC. For timestamps that are more than a week in the
+    past the text never changes, and the second element of the tuple is
+    ``None``.
+
+    :param timestamp: The timezone aware ``datetime`` object to render.
+    :param now: The timezone aware ``datetime`` object with the current time.
+    :param language: The language code of the locale to use.
+    """
+    locale = get_locale(language)
+    now = now.astimezone(timestamp.tzinfo)
+    start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    # the difference is calculated with wall clock times, as in moment.js
+    diff = (timestamp.replace(tzinfo=None) - start_of_day.replace(
+        tzinfo=None)) / timedelta(days=1)
+    bucket = _calendar_bucket(diff)
+    fmt = locale.calendar[bucket]
+    if callable(fmt):
+        fmt = fmt(timestamp, now)
+    text = compile_format(fmt, language)(timestamp)
+
+    # the bucket changes at the first midnight that moves the difference
+    # below the lower limit of the current bucket
+    lower_limits = [limit for limit in (7, 2, 1, 0, -1, -6) if diff >= limit]
+    if not lower_limits:
+        return text, None
+    days = math.floor(diff - lower_limits[0]) + 1
+    midnight = start_of_day.replace(tzinfo=None) + timedelta(days=days)
+    return text, midnight.replace(tzinfo=timestamp.tzinfo).astimezone(
+        timezone.utc)
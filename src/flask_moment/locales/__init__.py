@@ -0,0 +1,22 @@
+from functools import lru_cache
+import importlib
+
+
+@lru_cache(maxsize=None)
+def get_locale(language='en'):
+    """Return the module with the data for the given locale.
+
+    Locales are imported the first time they are requested. As in moment.js,
+    a regional locale such as ``'en-gb'`` that is not available falls back to
+    its base language, and an unknown language falls back to English.
+
+    :param language: The language code of the locale.
+    """
+    name = language.lower().replace('-', '_')
+    for candidate in (name, name.split('_')[0], 'en'):
+        if not candidate.isidentifier():
+            continue
+        try:
+            return importlib.import_module('.' + candidate, __name__)
+        except ImportError:
+            pass
@@ -0,0 +1,67 @@
+"""English, the default locale of moment.js.
+
+The calendar and relative time entries can also be functions, for languages
+that need them. Calendar functions are called with the timestamp and the
+current time, and return a format string. Relative time functions are called
+with the number, the ``no_suffix`` flag, the key and a flag that is ``True``
+for future times, and return the text.
+"""
+
+months = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+          'August', 'September', 'October', 'November', 'December']
+months_short = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep',
+                'Oct', 'Nov', 'Dec']
+weekdays = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday',
+            'Saturday']
+weekdays_short = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
+weekdays_min = ['Su', 'Mo', 'Tu', 'We', 'Th', 'Fr', 'Sa']
+eras = {'name': 'Anno Domini', 'abbr': 'AD', 'narrow': 'AD'}
+long_date_format = {
+    'LTS': 'h:mm:ss A',
+    'LT': 'h:mm A',
+    'L': 'MM/DD/YYYY',
+    'LL': 'MMMM D, YYYY',
+    'LLL': 'MMMM D, YYYY h:mm A',
+    'LLLL': 'dddd, MMMM D, YYYY h:mm A',
+}
+calendar = {
+    'sameDay': '[Today at] LT',
+    'nextDay': '[Tomorrow at] LT',
+    'nextWeek': 'dddd [at] LT',
+    'lastDay': '[Yesterday at] LT',
+    'lastWeek': '[Last] dddd [at] LT',
+    'sameElse': 'L',
+}
+relative_time = {
+    'future': 'in %s',
+    'past': '%s ago',
+    's': 'a few seconds',
+    'ss': '%d seconds',
+    'm': 'a minute',
+    'mm': '%d minutes',
+    'h': 'an hour',
+    'hh': '%d hours',
+    'd': 'a day',
+    'dd': '%d days',
+    'w': 'a week',
+    'ww': '%d weeks',
+    'M': 'a month',
+    'MM': '%d months',
+    'y': 'a year',
+    'yy': '%d years',
+}
+# first day of the week, and day of January that is always in the first week
+week = {'dow': 0, 'doy': 6}
+
+
+def ordinal(number, token):
+    if number % 100 // 10 == 1:
+        return '{}th'.format(number)
+    return '{}{}'.format(number, {1: 'st', 2: 'nd', 3: 'rd'}.get(
+        number % 10, 'th'))
+
+
+def meridiem(hour, minute, is_lower):
+    if hour > 11:
+        return 'pm' if is_lower else 'PM'
+    return 'am' if is_lower else 'AM'
@@ -0,0 +1,477 @@
+var flask_moment_plans = {};
+var flask_moment_islands = new WeakSet();
+function flask_moment_plan(id) {
+    // compact elements reference their rendering options, which are stored
+    // in JSON data islands
+    if (!(id in flask_moment_plans)) {
+        const islands = document.querySelectorAll('script.flask-moment-data');
+        islands.forEach(function(island) {
+            if (flask_moment_islands.has(island))
+                return;
+            try {
+                Object.assign(flask_moment_plans,
+                              JSON.parse(island.textContent));
+                flask_moment_islands.add(island);
+            }
+            catch (e) {
+                // the island is still being streamed
+            }
+        });
+    }
+    return flask_moment_plans[id];
+}
+function flask_moment_data(elem) {
+    const dataset = elem.dataset;
+    if (!dataset.m)
+        return dataset;
+    return Object.assign({timestamp: dataset.t, timestamp2: dataset.t2},
+                         flask_moment_plan(dataset.m));
+}
+var flask_moment_view_time = null;
+function flask_moment_timestamp(value) {
+    // "now" stands for the time at which the page is viewed, which is the
+    // same for all the elements in the page
+    if (value == 'now') {
+        if (flask_moment_view_time === null)
+            flask_moment_view_time = moment().valueOf();
+        return moment(flask_moment_view_time);
+    }
+    return moment(value);
+}
+var flask_moment_parsed = new WeakMap();
+function flask_moment_parse(elem) {
+    // parse the data attributes of an element only once, unless the locale
+    // has changed since the last time
+    let parsed = flask_moment_parsed.get(elem);
+    const locale = moment.locale();
+    if (!parsed || parsed.locale != locale) {
+        const data = flask_moment_data(elem);
+        let args = [];
+        if (data.format)
+            args.push(data.format);
+        if (data.timestamp2)
+            args.push(flask_moment_timestamp(data.timestamp2));
+        if (data.nosuffix)
+            args.push(data.nosuffix);
+        if (data.units)
+            args.push(data.units);
+        parsed = {timestamp: flask_moment_timestamp(data.timestamp),
+                  func: data.function, args: args, refresh: data.refresh,
+                  locale: locale, text: parsed && parsed.text};
+        flask_moment_parsed.set(elem, parsed);
+    }
+    return parsed;
+}
+function flask_moment_format(elem, now) {
+    const parsed = flask_moment_parse(elem);
+    let func = parsed.func;
+    let args = parsed.args;
+    if (now) {
+        // render relative to the time shared by all the elements in a tick
+        if (func == 'fromNow' || func == 'toNow') {
+            func = (func == 'fromNow') ? 'from' : 'to';
+            args = [now].concat(args);
+        }
+        else if (func == 'calendar')
+            args = [now].concat(args);
+    }
+    return parsed.timestamp[func].apply(parsed.timestamp, args);
+}
+function flask_moment_changed(elem, text) {
+    return flask_moment_parse(elem).text !== text;
+}
+function flask_moment_update(elem, text) {
+    flask_moment_parse(elem).text = text;
+    elem.textContent = text;
+    elem.classList.remove('flask-moment');
+    elem.style.display = "";
+    elem.style.visibility = "";
+    if (elem.hidden)
+        elem.hidden = false;
+}
+function flask_moment_render(elem) {
+    flask_moment_update(elem, flask_moment_format(elem));
+}
+var flask_moment_writes = [];
+var flask_moment_writes_done = 0;
+var flask_moment_frame = null;
+function flask_moment_flush() {
+    // apply a chunk of the pending DOM writes in this animation frame
+    const writes = flask_moment_writes;
+    const end = Math.min(writes.length, flask_moment_writes_done +
+                         flask_moment_options.chunk_size);
+    for (let i = flask_moment_writes_done; i < end; i++)
+        flask_moment_update(writes[i][0], writes[i][1]);
+    flask_moment_writes_done = end;
+    if (end < writes.length)
+        flask_moment_frame = requestAnimationFrame(flask_moment_flush);
+    else {
+        flask_moment_writes = [];
+        flask_moment_writes_done = 0;
+        flask_moment_frame = null;
+    }
+}
+function flask_moment_write(elem, text) {
+    flask_moment_writes.push([elem, text]);
+    if (!flask_moment_frame)
+        flask_moment_frame = requestAnimationFrame(flask_moment_flush);
+}
+function flask_moment_refresh(elements, now) {
+    // format all the elements first, and then apply the DOM writes for the
+    // elements that changed in batches, one per animation frame
+    const size = flask_moment_options.chunk_size;
+    if (!size || !window.requestAnimationFrame) {
+        elements.forEach(function(elem) {
+            const text = flask_moment_format(elem, now);
+            if (flask_moment_changed(elem, text))
+                flask_moment_update(elem, text);
+        });
+        return;
+    }
+    elements = Array.from(elements);
+    const idle = window.requestIdleCallback && elements.length > 10 * size;
+    let i = 0;
+    (function format_chunk() {
+        // very large sets of elements are formatted in chunks when the
+        // browser is idle
+        const end = idle ? Math.min(i + size, elements.length) :
+            elements.length;
+        for (; i < end; i++) {
+            const text = flask_moment_format(elements[i], now);
+            if (flask_moment_changed(elements[i], text))
+                flask_moment_write(elements[i], text);
+        }
+        if (i < elements.length)
+            requestIdleCallback(format_chunk);
+    })();
+}
+var flask_moment_timers = {};
+var flask_moment_scheduled = new WeakMap();
+function flask_moment_start_timer(group) {
+    group.timer = setInterval(function() {
+        flask_moment_refresh(group.elements, moment());
+    }, group.interval);
+}
+var flask_moment_element_timers = new Set();
+function flask_moment_start_element_timer(entry) {
+    entry.timer = setInterval(function() {
+        flask_moment_refresh([entry.elem], moment());
+    }, entry.interval);
+}
+function flask_moment_schedule(elem, interval) {
+    if (flask_moment_scheduled.has(elem))
+        return;
+    if (flask_moment_options.scheduler == 'element') {
+        const entry = {elem: elem, interval: interval, timer: null};
+        flask_moment_element_timers.add(entry);
+        if (!document.hidden)
+            flask_moment_start_element_timer(entry);
+        flask_moment_scheduled.set(elem, function() {
+            clearInterval(entry.timer);
+            flask_moment_element_timers.delete(entry);
+        });
+        return;
+    }
+    let group = flask_moment_timers[interval];
+    if (!group) {
+        group = flask_moment_timers[interval] = {
+            interval: interval, elements: new Set(), timer: null};
+        if (!document.hidden)
+            flask_moment_start_timer(group);
+    }
+    group.elements.add(elem);
+    flask_moment_scheduled.set(elem, function() {
+        group.elements.delete(elem);
+        if (group.elements.size == 0) {
+            clearInterval(group.timer);
+            delete flask_moment_timers[interval];
+        }
+    });
+}
+function flask_moment_unschedule(elem) {
+    const cancel = flask_moment_scheduled.get(elem);
+    if (cancel) {
+        flask_moment_scheduled.delete(elem);
+        cancel();
+    }
+}
+var flask_moment_adaptive = new Set();
+var flask_moment_adaptive_timer = null;
+function flask_moment_next_change(elem, now) {
+    // return the number of milliseconds until the text of a relative time
+    // element changes, based on the thresholds used by moment.js
+    const minute = 60000, hour = 3600000, day = 86400000;
+    const parsed = flask_moment_parse(elem);
+    if (parsed.func == 'calendar')
+        return moment(now).add(1, 'day').startOf('day').valueOf() - now;
+    const diff = now - parsed.timestamp.valueOf();
+    const age = Math.abs(diff);
+    let next;
+    if (age < 45000)
+        next = (diff >= 0) ? 45000 - age : age;
+    else {
+        const unit = (age < 45 * minute) ? minute :
+            ((age < 22 * hour) ? hour : day);
+        next = (age + unit / 2) % unit;
+        if (diff >= 0)
+            next = unit - next;
+    }
+    return Math.min(Math.max(next, 1000), day);
+}
+function flask_moment_start_adaptive_timer() {
+    if (flask_moment_adaptive_timer) {
+        clearTimeout(flask_moment_adaptive_timer);
+        flask_moment_adaptive_timer = null;
+    }
+    if (document.hidden || flask_moment_adaptive.size == 0)
+        return;
+    let due = Infinity;
+    flask_moment_adaptive.forEach(function(entry) {
+        due = Math.min(due, entry.due);
+    });
+    flask_moment_adaptive_timer = setTimeout(flask_moment_adaptive_refresh,
+                                             Math.max(due - Date.now(), 0));
+}
+function flask_moment_adaptive_refresh(all) {
+    const now = moment();
+    let elements = [];
+    flask_moment_adaptive.forEach(function(entry) {
+        if (all === true || entry.due <= now.valueOf()) {
+            elements.push(entry.elem);
+            entry.due = now.valueOf() + flask_moment_next_change(
+                entry.elem, now.valueOf());
+        }
+    });
+    flask_moment_refresh(elements, now);
+    flask_moment_start_adaptive_timer();
+}
+function flask_moment_schedule_adaptive(elem) {
+    if (flask_moment_scheduled.has(elem))
+        return;
+    const now = Date.now();
+    const entry = {elem: elem, due: now + flask_moment_next_change(elem, now)};
+    flask_moment_adaptive.add(entry);
+    flask_moment_scheduled.set(elem, function() {
+        flask_moment_adaptive.delete(entry);
+        flask_moment_start_adaptive_timer();
+    });
+    flask_moment_start_adaptive_timer();
+}
+function flask_moment_on_visibility() {
+    // pause refreshing while the page is hidden, and bring all the elements
+    // up to date when it becomes visible again
+    if (document.hidden) {
+        for (const interval in flask_moment_timers) {
+            clearInterval(flask_moment_timers[interval].timer);
+            flask_moment_timers[interval].timer = null;
+        }
+        flask_moment_element_timers.forEach(function(entry) {
+            clearInterval(entry.timer);
+            entry.timer = null;
+        });
+        flask_moment_start_adaptive_timer();
+        return;
+    }
+    const now = moment();
+    for (const interval in flask_moment_timers) {
+        const group = flask_moment_timers[interval];
+        if (group.timer === null) {
+            flask_moment_refresh(group.elements, now);
+            flask_moment_start_timer(group);
+        }
+    }
+    let paused = [];
+    flask_moment_element_timers.forEach(function(entry) {
+        if (entry.timer === null) {
+            paused.push(entry.elem);
+            flask_moment_start_element_timer(entry);
+        }
+    });
+    flask_moment_refresh(paused, now);
+    flask_moment_adaptive_refresh(true);
+}
+function flask_moment_activate(elements) {
+    flask_moment_refresh(elements);
+    elements.forEach(function(elem) {
+        const refresh = flask_moment_parse(elem).refresh;
+        if (refresh == 'adaptive')
+            flask_moment_schedule_adaptive(elem);
+        else if (refresh && refresh > 0)
+            flask_moment_schedule(elem, parseInt(refresh));
+    });
+}
+var flask_moment_observer = null;
+function flask_moment_on_intersection(entries) {
+    let elements = [];
+    entries.forEach(function(entry) {
+        const elem = entry.target;
+        if (!elem.isConnected) {
+            // the element was removed from the page
+            flask_moment_observer.unobserve(elem);
+            flask_moment_unschedule(elem);
+        }
+        else if (entry.isIntersecting)
+            elements.push(elem);
+        else
+            flask_moment_unschedule(elem);
+    });
+    flask_moment_activate(elements);
+}
+function flask_moment_observe(elem) {
+    // hidden elements have no layout box and never intersect the viewport,
+    // so they are laid out with invisible contents until they are rendered
+    if (!flask_moment_observer)
+        flask_moment_observer = new IntersectionObserver(
+            flask_moment_on_intersection);
+    if (elem.hidden || elem.style.display == "none") {
+        elem.style.visibility = "hidden";
+        elem.style.display = "";
+        elem.hidden = false;
+    }
+    flask_moment_observer.observe(elem);
+}
+var flask_moment_seen = new WeakSet();
+var flask_moment_pending = [];
+function flask_moment_find(root) {
+    let elements = Array.from(root.querySelectorAll('.flask-moment'));
+    if (root.matches && root.matches('.flask-moment'))
+        elements.unshift(root);
+    return elements;
+}
+function flask_moment_render_elements(elements) {
+    const lazy = flask_moment_options.lazy && window.IntersectionObserver;
+    elements = elements.filter(function(elem) {
+        if (flask_moment_seen.has(elem))
+            return false;
+        if (elem.dataset.m && !flask_moment_plan(elem.dataset.m)) {
+            // the data island with the rendering options of this element
+            // has not arrived yet
+            flask_moment_pending.push(elem);
+            return false;
+        }
+        flask_moment_seen.add(elem);
+        return true;
+    });
+    if (lazy)
+        elements.forEach(flask_moment_observe);
+    else
+        flask_moment_activate(elements);
+}
+function flask_moment_render_subtree(root) {
+    flask_moment_render_elements(flask_moment_find(root));
+}
+function flask_moment_render_all() {
+    flask_moment_pending = [];
+    flask_moment_render_subtree(document);
+}
+function flask_moment_managed(root) {
+    // return the elements in a subtree that are rendered by this script,
+    // either already or once they are activated
+    let elements = Array.from(
+        root.querySelectorAll('[data-timestamp],[data-m]'));
+    if (root.dataset.timestamp || root.dataset.m)
+        elements.unshift(root);
+    return elements;
+}
+var flask_moment_detached = new WeakSet();
+function flask_moment_on_mutation(mutations) {
+    mutations.forEach(function(mutation) {
+        mutation.removedNodes.forEach(function(node) {
+            if (node.nodeType != 1)
+                return;
+            flask_moment_managed(node).forEach(function(elem) {
+                // elements that were moved to another place in the page
+                // are still connected, and keep their refresh timers
+                if (elem.isConnected || !flask_moment_seen.has(elem))
+                    return;
+                flask_moment_unschedule(elem);
+                flask_moment_seen.delete(elem);
+                if (flask_moment_observer)
+                    flask_moment_observer.unobserve(elem);
+                if (!elem.classList.contains('flask-moment'))
+                    flask_moment_detached.add(elem);
+            });
+        });
+        mutation.addedNodes.forEach(function(node) {
+            if (node.nodeType != 1)
+                return;
+            // rendered elements that are inserted back into the page have
+            // lost the flask-moment class, so they are found separately
+            const detached = flask_moment_managed(node).filter(function(elem) {
+                return flask_moment_detached.delete(elem);
+            });
+            flask_moment_render_elements(
+                flask_moment_find(node).concat(detached));
+        });
+    });
+}
+var flask_moment_stream_observer = null;
+function flask_moment_on_stream(mutations) {
+    // render the elements inserted by the parser while the page is loading,
+    // along with those that were waiting for their data island
+    let elements = flask_moment_pending;
+    flask_moment_pending = [];
+    mutations.forEach(function(mutation) {
+        mutation.addedNodes.forEach(function(node) {
+            if (node.nodeType == 1)
+                elements = elements.concat(flask_moment_find(node));
+        });
+    });
+    flask_moment_render_elements(elements);
+}
+function flask_moment_start() {
+    if (flask_moment_stream_observer) {
+        flask_moment_stream_observer.disconnect();
+        flask_moment_stream_observer = null;
+    }
+    flask_moment_render_all();
+    if (flask_moment_options.observe && window.MutationObserver)
+        new MutationObserver(flask_moment_on_mutation).observe(
+            document.body, {childList: true, subtree: true});
+}
+function flask_moment_start_stream() {
+    if (flask_moment_options.stream && window.MutationObserver &&
+            document.readyState == "loading") {
+        flask_moment_stream_observer = new MutationObserver(
+            flask_moment_on_stream);
+        flask_moment_stream_observer.observe(
+            document.documentElement, {childList: true, subtree: true});
+        flask_moment_render_all();
+    }
+}
+function flask_moment_when_ready(callback) {
+    // moment.js can be loaded with the defer or async attributes, in which
+    // case it may not be available yet; the marked script is the last one of
+    // the library and its locales, as each locale file also sets the global
+    // locale when it runs
+    if (window.moment) {
+        callback();
+        return;
+    }
+    const library = document.querySelector(
+        "script[data-flask-moment-library]");
+    if (library)
+        library.addEventListener("load", callback);
+    else if (document.readyState == "loading")
+        document.addEventListener("DOMContentLoaded", callback);
+    else
+        window.addEventListener("load", callback);
+}
+function flask_moment_run_queue() {
+    // run the code that was waiting for moment.js, such as the locale
+    // configuration, and any code added later right away
+    const queue = window.flask_moment_queue || [];
+    window.flask_moment_queue = {push: function(callback) { callback(); }};
+    queue.forEach(function(callback) { callback(); });
+}
+flask_moment_when_ready(function() {
+    flask_moment_run_queue();
+    flask_moment_start_stream();
+});
+if (document.readyState == "loading")
+    document.addEventListener("DOMContentLoaded", function() {
+        flask_moment_when_ready(flask_moment_start);
+    });
+else
+    flask_moment_when_ready(flask_moment_start);
+document.addEventListener("visibilitychange", flask_moment_on_visibility);
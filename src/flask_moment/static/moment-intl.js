@@ -0,0 +1,232 @@
+// A minimal implementation of the subset of the moment.js API that is used by
+// Flask-Moment, based on the Intl APIs that are built into modern browsers.
+var moment = (function() {
+    const units = {
+        millisecond: 1, second: 1000, minute: 60000, hour: 3600000,
+        day: 86400000, week: 604800000};
+    const aliases = {
+        ms: 'millisecond', s: 'second', m: 'minute', h: 'hour', d: 'day',
+        w: 'week', M: 'month', Q: 'quarter', y: 'year'};
+    const tokens = new RegExp(
+        '\\[[^\\]]*\\]|LTS|LT|LLLL|LLL|LL|L|llll|lll|ll|l|YYYY|YY|Do|MMMM|MMM|' +
+        'MM|M|DD|D|dddd|ddd|dd|d|HH|H|hh|h|mm|m|ss|s|SSS|A|a|ZZ|Z|X|x', 'g');
+    const presets = {
+        LT: {hour: 'numeric', minute: '2-digit'},
+        LTS: {hour: 'numeric', minute: '2-digit', second: '2-digit'},
+        L: {year: 'numeric', month: '2-digit', day: '2-digit'},
+        l: {year: 'numeric', month: 'numeric', day: 'numeric'},
+        LL: {year: 'numeric', month: 'long', day: 'numeric'},
+        ll: {year: 'numeric', month: 'short', day: 'numeric'},
+        LLL: {year: 'numeric', month: 'long', day: 'numeric',
+              hour: 'numeric', minute: '2-digit'},
+        lll: {year: 'numeric', month: 'short', day: 'numeric',
+              hour: 'numeric', minute: '2-digit'},
+        LLLL: {weekday: 'long', year: 'numeric', month: 'long',
+               day: 'numeric', hour: 'numeric', minute: '2-digit'},
+        llll: {weekday: 'short', year: 'numeric', month: 'short',
+               day: 'numeric', hour: 'numeric', minute: '2-digit'}};
+    let locale = 'en';
+    let formatters = {};
+
+    function formatter(key, create) {
+        // Intl formatters are expensive to create, so they are cached
+        key = locale + ':' + key;
+        if (!(key in formatters))
+            formatters[key] = create();
+        return formatters[key];
+    }
+    function intl(date, options) {
+        return formatter(JSON.stringify(options), function() {
+            return new Intl.DateTimeFormat(locale, options);
+        }).format(date);
+    }
+    function pad(value, length) {
+        return String(value).padStart(length, '0');
+    }
+    function ordinal(n) {
+        if (locale.split('-')[0] != 'en')
+            return n + '.';
+        const suffixes = {one: 'st', two: 'nd', few: 'rd', other: 'th'};
+        return n + suffixes[formatter('ordinal', function() {
+            return new Intl.PluralRules('en', {type: 'ordinal'});
+        }).select(n)];
+    }
+    function offset(date, separator) {
+        const minutes = -date.getTimezoneOffset();
+        const abs = Math.abs(minutes);
+        return (minutes < 0 ? '-' : '+') + pad(Math.floor(abs / 60), 2) +
+            separator + pad(abs % 60, 2);
+    }
+    function normalize(unit) {
+        unit = aliases[unit] || unit;
+        return unit.replace(/s$/, '');
+    }
+    function parse(value) {
+        if (value === undefined || value === null)
+            return new Date();
+        if (value instanceof Moment)
+            return new Date(value._d.getTime());
+        if (typeof value == 'string' && /^\d{4}-\d\d-\d\d$/.test(value))
+            value += 'T00:00:00';  // date-only strings are in local time
+        return new Date(value);
+    }
+
+    function Moment(date) {
+        this._d = date;
+    }
+    Moment.prototype.valueOf = function() {
+        return this._d.getTime();
+    };
+    Moment.prototype.unix = function() {
+        return Math.floor(this.valueOf() / 1000);
+    };
+    Moment.prototype.add = function(amount, unit) {
+        const date = new Date(this._d.getTime());
+        unit = normalize(unit);
+        if (unit == 'day')
+            date.setDate(date.getDate() + amount);
+        else if (unit == 'week')
+            date.setDate(date.getDate() + 7 * amount);
+        else if (unit == 'month')
+            date.setMonth(date.getMonth() + amount);
+        else if (unit == 'year')
+            date.setFullYear(date.getFullYear() + amount);
+        else
+            date.setTime(date.getTime() + amount * units[unit]);
+        return new Moment(date);
+    };
+    Moment.prototype.startOf = function(unit) {
+        const date = new Date(this._d.getTime());
+        switch (normalize(unit)) {
+            case 'year': date.setMonth(0);  // falls through
+            case 'month': date.setDate(1);  // falls through
+            case 'day': date.setHours(0);  // falls through
+            case 'hour': date.setMinutes(0);  // falls through
+            case 'minute': date.setSeconds(0);  // falls through
+            case 'second': date.setMilliseconds(0);
+        }
+        return new Moment(date);
+    };
+    Moment.prototype.format = function(format) {
+        const date = this._d;
+        const h = date.getHours();
+        return (format || moment.defaultFormat).replace(tokens, function(t) {
+            switch (t) {
+                case 'YYYY': return pad(date.getFullYear(), 4);
+                case 'YY': return pad(date.getFullYear() % 100, 2);
+                case 'MMMM': return intl(date, {month: 'long'});
+                case 'MMM': return intl(date, {month: 'short'});
+                case 'MM': return pad(date.getMonth() + 1, 2);
+                case 'M': return String(date.getMonth() + 1);
+                case 'DD': return pad(date.getDate(), 2);
+                case 'Do': return ordinal(date.getDate());
+                case 'D': return String(date.getDate());
+                case 'dddd': return intl(date, {weekday: 'long'});
+                case 'ddd': return intl(date, {weekday: 'short'});
+                case 'dd': return intl(date, {weekday: 'narrow'});
+                case 'd': return String(date.getDay());
+                case 'HH': return pad(h, 2);
+                case 'H': return String(h);
+                case 'hh': return pad(h % 12 || 12, 2);
+                case 'h': return String(h % 12 || 12);
+                case 'mm': return pad(date.getMinutes(), 2);
+                case 'm': return String(date.getMinutes());
+                case 'ss': return pad(date.getSeconds(), 2);
+                case 's': return String(date.getSeconds());
+                case 'SSS': return pad(date.getMilliseconds(), 3);
+                case 'A': return h < 12 ? 'AM' : 'PM';
+                case 'a': return h < 12 ? 'am' : 'pm';
+                case 'ZZ': return offset(date, '');
+                case 'Z': return offset(date, ':');
+                case 'X': return String(Math.floor(date.getTime() / 1000));
+                case 'x': return String(date.getTime());
+            }
+            if (t in presets)
+                return intl(date, presets[t]);
+            return t.slice(1, -1);  // escaped text
+        });
+    };
+    Moment.prototype.from = function(other, no_suffix) {
+        // use the same thresholds as moment.js to pick the unit
+        const diff = this.valueOf() - moment(other).valueOf();
+        const seconds = Math.round(Math.abs(diff) / 1000);
+        const minutes = Math.round(seconds / 60);
+        const hours = Math.round(minutes / 60);
+        const days = Math.round(hours / 24);
+        const months = Math.round(days / 30.436875);
+        let value, unit;
+        if (seconds < 45) { value = seconds; unit = 'second'; }
+        else if (minutes < 45) { value = minutes; unit = 'minute'; }
+        else if (hours < 22) { value = hours; unit = 'hour'; }
+        else if (days < 26) { value = days; unit = 'day'; }
+        else if (months < 11) { value = months; unit = 'month'; }
+        else { value = Math.max(Math.round(days / 365.25), 1); unit = 'year'; }
+        if (diff != 0)
+            value = Math.max(value, 1);
+        if (no_suffix)
+            return formatter('unit:' + unit, function() {
+                return new Intl.NumberFormat(locale, {
+                    style: 'unit', unit: unit, unitDisplay: 'long'});
+            }).format(value);
+        // as in moment.js, a difference of zero is in the past
+        return formatter('relative', function() {
+            return new Intl.RelativeTimeFormat(locale);
+        }).format(diff <= 0 ? -value : value, unit);
+    };
+    Moment.prototype.fromNow = function(no_suffix) {
+        return this.from(moment(), no_suffix);
+    };
+    Moment.prototype.to = function(other, no_suffix) {
+        return moment(other).from(this, no_suffix);
+    };
+    Moment.prototype.toNow = function(no_suffix) {
+        return this.to(moment(), no_suffix);
+    };
+    Moment.prototype.calendar = function(reference) {
+        const days = Math.round(
+            (this.startOf('day').valueOf() -
+             moment(reference).startOf('day').valueOf()) / units.day);
+        if (days < -6 || days > 6)
+            return this.format('L');
+        let day;
+        if (days >= -1 && days <= 1) {
+            day = formatter('calendar', function() {
+                return new Intl.RelativeTimeFormat(locale, {numeric: 'auto'});
+            }).format(days, 'day');
+            day = day.charAt(0).toUpperCase() + day.slice(1);
+        }
+        else
+            day = this.format('dddd');
+        return day + ' ' + this.format('LT');
+    };
+    Moment.prototype.diff = function(other, unit) {
+        other = moment(other);
+        unit = normalize(unit || 'millisecond');
+        if (unit == 'month' || unit == 'quarter' || unit == 'year') {
+            const a = this._d, b = other._d;
+            let months = (a.getFullYear() - b.getFullYear()) * 12 +
+                a.getMonth() - b.getMonth();
+            const anchor = other.add(months, 'month').valueOf();
+            if (months > 0 && anchor > a.getTime())
+                months--;
+            else if (months < 0 && anchor < a.getTime())
+                months++;
+            return Math.trunc(months / {month: 1, quarter: 3, year: 12}[unit]);
+        }
+        return Math.trunc((this.valueOf() - other.valueOf()) / units[unit]);
+    };
+
+    function moment(value) {
+        return new Moment(parse(value));
+    }
+    moment.locale = function(language) {
+        if (language) {
+            locale = language;
+            formatters = {};
+        }
+        return locale;
+    };
+    moment.defaultFormat = 'YYYY-MM-DDTHH:mm:ssZ';
+    moment.fn = Moment.prototype;
+    return moment;
+})();
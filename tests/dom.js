@@ -0,0 +1,203 @@
+// A minimal DOM for running the Flask-Moment JavaScript code in Node.js.
+//
+// The test job is read from stdin as JSON, with the scripts to load and the
+// test code to run after them. The test code stores its output in the
+// `result` global, which is written to stdout as JSON. Timers run on a fake
+// clock that the test code advances with tick(), and mutation records are
+// delivered to the observers when the test code calls flush().
+const vm = require('vm');
+
+let now = Date.UTC(2017, 0, 15, 22, 47, 6);
+let timers = new Map();
+let next_timer = 1;
+let observers = [];
+
+function start_timer(callback, delay, repeat) {
+    const id = next_timer++;
+    timers.set(id, {callback: callback, due: now + (delay || 0),
+                    interval: repeat ? delay : null});
+    return id;
+}
+function tick(ms) {
+    const end = now + ms;
+    for (;;) {
+        let id = null;
+        timers.forEach(function(timer, key) {
+            if (timer.due <= end && (id === null ||
+                                     timer.due < timers.get(id).due))
+                id = key;
+        });
+        if (id === null)
+            break;
+        const timer = timers.get(id);
+        now = Math.max(now, timer.due);
+        if (timer.interval === null)
+            timers.delete(id);
+        else
+            timer.due += timer.interval;
+        timer.callback();
+    }
+    now = end;
+}
+
+function record(target, added, removed) {
+    observers.forEach(function(observer) {
+        if (observer.root && observer.root.contains(target))
+            observer.records.push({target: target, addedNodes: added,
+                                   removedNodes: removed});
+    });
+}
+function flush() {
+    observers.forEach(function(observer) {
+        const records = observer.records;
+        observer.records = [];
+        if (records.length)
+            observer.callback(records);
+    });
+}
+class MutationObserver {
+    constructor(callback) {
+        this.callback = callback;
+        this.root = null;
+        this.records = [];
+        observers.push(this);
+    }
+    observe(root) {
+        this.root = root;
+    }
+    disconnect() {
+        this.root = null;
+    }
+}
+
+function matches(elem, selector) {
+    return selector.split(',').some(function(part) {
+        const match = /^(\w*)(?:\.([\w-]+))?(?:\[([\w-]+)\])?$/.exec(
+            part.trim());
+        return (!match[1] || elem.tagName == match[1].toUpperCase()) &&
+            (!match[2] || elem.classList.contains(match[2])) &&
+            (!match[3] || elem.hasAttribute(match[3]));
+    });
+}
+function dataset_key(name) {
+    return name.slice(5).replace(/-(\w)/g, function(m, c) {
+        return c.toUpperCase();
+    });
+}
+class Element {
+    constructor(tag, attributes) {
+        this.nodeType = 1;
+        this.tagName = tag.toUpperCase();
+        this.parentNode = null;
+        this.children = [];
+        this.dataset = {};
+        this.style = {};
+        this.hidden = false;
+        this.textContent = '';
+        const classes = new Set();
+        this.classList = {
+            add: function(name) { classes.add(name); },
+            remove: function(name) { classes.delete(name); },
+            contains: function(name) { return classes.has(name); }};
+        Object.keys(attributes || {}).forEach(function(name) {
+            const value = attributes[name];
+            if (name == 'class')
+                value.split(' ').forEach(this.classList.add);
+            else if (name == 'style')
+                this.style.display = /display: *none/.test(value) ?
+                    'none' : '';
+            else if (name.startsWith('data-'))
+                this.dataset[dataset_key(name)] = value;
+        }, this);
+    }
+    get isConnected() {
+        let node = this;
+        while (node.parentNode)
+            node = node.parentNode;
+        return node === document.documentElement;
+    }
+    hasAttribute(name) {
+        return name.startsWith('data-') && dataset_key(name) in this.dataset;
+    }
+    matches(selector) {
+        return matches(this, selector);
+    }
+    contains(node) {
+        for (; node; node = node.parentNode)
+            if (node === this)
+                return true;
+        return false;
+    }
+    querySelectorAll(selector) {
+        let found = [];
+        this.children.forEach(function(child) {
+            if (child.matches(selector))
+                found.push(child);
+            found = found.concat(child.querySelectorAll(selector));
+        });
+        return found;
+    }
+    querySelector(selector) {
+        return this.querySelectorAll(selector)[0] || null;
+    }
+    appendChild(child) {
+        if (child.parentNode)
+            child.parentNode.removeChild(child);
+        child.parentNode = this;
+        this.children.push(child);
+        record(this, [child], []);
+        return child;
+    }
+    removeChild(child) {
+        this.children.splice(this.children.indexOf(child), 1);
+        child.parentNode = null;
+        record(this, [], [child]);
+        return child;
+    }
+    addEventListener() {
+    }
+}
+
+const document = {
+    documentElement: new Element('html'),
+    readyState: 'complete',
+    hidden: false,
+    listeners: {},
+    addEventListener: function(name, callback) {
+        this.listeners[name] = callback;
+    },
+    createElement: function(tag, attributes) {
+        return new Element(tag, attributes);
+    },
+    querySelector: function(selector) {
+        return this.documentElement.querySelector(selector);
+    },
+    querySelectorAll: function(selector) {
+        return this.documentElement.querySelectorAll(selector);
+    }};
+document.body = document.documentElement.appendChild(new Element('body'));
+
+const context = vm.createContext({
+    console: console, document: document, tick: tick, flush: flush,
+    MutationObserver: MutationObserver,
+    setTimeout: function(f, ms) { return start_timer(f, ms, false); },
+    setInterval: function(f, ms) { return start_timer(f, ms, true); },
+    clearTimeout: function(id) { timers.delete(id); },
+    clearInterval: function(id) { timers.delete(id); },
+    addEventListener: function() {}});
+context.window = context;
+vm.runInContext('Date.now = function() { return now(); };', context);
+context.now = function() { return now; };
+context.timers = function() { return timers.size; };
+
+let input = '';
+process.stdin.on('data', function(chunk) { input += chunk; });
+process.stdin.on('end', function() {
+    const job = JSON.parse(input);
+    job.scripts.forEach(function(script) {
+        // run UMD modules such as moment.js as plain browser scripts
+        vm.runInContext('var module, exports, define;\n' + script, context);
+    });
+    vm.runInContext(job.test, context);
+    process.stdout.write(JSON.stringify(context.result));
+});
@@ -1,11 +1,29 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
+import gzip
+import json
+import re
 import unittest
 from unittest import mock
 
-from flask import Flask, render_template_string
+from flask import Blueprint, Flask, render_template_string
 from markupsafe import Markup
 
-from flask_moment import Moment, default_moment_version, default_moment_sri
+import flask_moment
+from flask_moment import Moment, default_moment_version, \
+    default_moment_sri, default_moment_core_sri
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
 
 
 class TestMoment(unittest.TestCase):
@@ -65,6 +83,290 @@ class TestMoment(unittest.TestCase):
         assert default_moment_version + '/moment-with-locales.min.js' in ts
         assert 'moment.defaultFormat = "foo";' in ts
 
+    def test_include_moment_locale_subset(self):
+        include_moment = self.moment.include_moment(
+            with_locales=['en', 'de', 'ja'])
+        assert include_moment.startswith(
+            '<script src="https://cdnjs.cloudflare.com/ajax/libs/moment.js/{}'
+            '/moment.min.js" integrity="{}" crossorigin="anonymous"></script>'
+            '\n<script>\n'.format(
+                default_moment_version, default_moment_core_sri))
+        # the bundled locale files are inline, as the CDN has no SRI hashes
+        # for them
+        assert include_moment.count('<script src=') == 1
+        assert 'locale/' not in include_moment
+        assert include_moment.index("moment.defineLocale('de'") < \
+            include_moment.index("moment.defineLocale('ja'") < \
+            include_moment.index('moment.locale("en");')
+        assert "moment.defineLocale('en'" not in include_moment
+        with self.assertRaises(ValueError):
+            self.moment.include_moment(with_locales=['xx'])
+        include_moment = self.moment.include_moment(
+            version='2.29.1', with_locales=['en', 'de', 'ja'])
+        assert include_moment.startswith(
+            '<script src="https://cdnjs.cloudflare.com/ajax/libs/moment.js/'
+            '2.29.1/moment.min.js"></script>\n<script src="https://cdnjs.'
+            'cloudflare.com/ajax/libs/moment.js/2.29.1/locale/de.min.js">'
+            '</script>\n<script src="https://cdnjs.cloudflare.com/ajax/libs/'
+            'moment.js/2.29.1/locale/ja.min.js"></script>\n')
+
+    def test_include_moment_locale_subset_config(self):
+        self.app.config['MOMENT_LOCALES'] = ['es']
+        ts = str(render_template_string('{{ moment.include_moment() }}'))
+        assert '/moment.min.js" integrity="{}"'.format(
+            default_moment_core_sri) in ts
+        assert "moment.defineLocale('es'" in ts
+        self.app.config['MOMENT_LOCALES'] = ['fr']
+        ts = str(render_template_string('{{ moment.include_moment() }}'))
+        assert "moment.defineLocale('fr'" in ts
+        ts = str(render_template_string(
+            '{{ moment.include_moment(with_locales=False) }}'))
+        assert 'defineLocale' not in ts
+        ts = str(render_template_string(
+            '{{ moment.include_moment(local_js="/moment.js") }}'))
+        assert 'defineLocale' not in ts
+
+    def test_include_moment_intl_engine(self):
+        include_moment = str(self.moment.include_moment(engine='intl'))
+        assert 'cdnjs' not in include_moment
+        assert include_moment.startswith('<script>\n')
+        assert 'var moment = (function() {' in include_moment
+        assert 'Intl.RelativeTimeFormat' in include_moment
+        assert 'function flask_moment_render(elem) {' in include_moment
+        self.app.config['MOMENT_ENGINE'] = 'intl'
+        ts = str(render_template_string('{{ moment.include_moment() }}'))
+        assert ts == include_moment
+        ts = str(render_template_string(
+            '{{ moment.include_moment(engine="moment") }}'))
+        assert 'cdnjs' in ts
+        with self.assertRaises(ValueError):
+            self.moment.include_moment(engine='foo')
+
+    def test_include_moment_loading(self):
+        include_moment = self.moment.include_moment(loading='defer')
+        assert '/moment-with-locales.min.js" integrity="{}" crossorigin=' \
+            '"anonymous" defer data-flask-moment-library></script>'.format(
+                default_moment_sri) in include_moment
+        assert 'window.flask_moment_queue' in include_moment
+        include_moment = self.moment.include_moment(
+            loading='defer', with_locales=['de'])
+        # the inline locale code waits in the queue for moment.js
+        assert '/moment.min.js" integrity="{}" crossorigin="anonymous" ' \
+            'defer data-flask-moment-library></script>\n<script>\n' \
+            '(function(f) {{'.format(default_moment_core_sri) in include_moment
+        assert "moment.defineLocale('de'" in include_moment
+        include_moment = self.moment.include_moment(
+            loading='defer', version='2.29.1', with_locales=['de'])
+        assert '/moment.min.js" defer></script>' in include_moment
+        assert '/locale/de.min.js" defer data-flask-moment-library>' \
+            '</script>' in include_moment
+        assert include_moment.count(' defer data-flask-moment-library') == 1
+        include_moment = self.moment.include_moment(
+            loading='defer', version='2.29.1', with_locales=['en', 'de', 'ja'])
+        tags = re.findall(r'<script src=[^>]*>', include_moment)
+        assert [tag.endswith(' data-flask-moment-library>')
+                for tag in tags] == [False, False, True]
+        assert '/locale/ja.min.js' in tags[-1]
+        self.app.config['MOMENT_LOADING'] = 'async'
+        ts = str(render_template_string('{{ moment.include_moment() }}'))
+        assert ' async data-flask-moment-library></script>' in ts
+        with self.assertRaises(ValueError):
+            self.moment.include_moment(with_locales=['de'])
+        with self.assertRaises(ValueError):
+            self.moment.include_moment(loading='lazy')
+        assert ' defer data' not in self.moment.include_moment(
+            loading='blocking')
+
+    def test_include_moment_loading_static(self):
+        app = Flask(__name__)
+        app.config['MOMENT_SERVE_STATIC'] = True
+        app.config['MOMENT_LOADING'] = 'defer'
+        Moment(app)
+        with app.test_request_context():
+            include_moment = str(app.extensions['moment'].include_moment(
+                with_locales=False))
+            moment_tag, js_tag = re.findall(r'<script src=[^>]*>',
+                                            include_moment)
+            assert moment_tag.endswith(' defer data-flask-moment-library>')
+            assert js_tag.endswith('.js" defer>')
+
+    def test_include_moment_resource_hints(self):
+        include_moment = self.moment.include_moment(resource_hints=True)
+        assert include_moment.startswith(
+            '<link rel="preconnect" href="https://cdnjs.cloudflare.com" '
+            'crossorigin>\n<link rel="preload" href="https://cdnjs.'
+            'cloudflare.com/ajax/libs/moment.js/{}/moment-with-locales.min.'
+            'js" as="script" integrity="{}" crossorigin="anonymous">\n'
+            '<script'.format(default_moment_version, default_moment_sri))
+        include_moment = self.moment.include_moment(
+            local_js='/static/moment.js', resource_hints=True)
+        assert include_moment.startswith(
+            '<link rel="preload" href="/static/moment.js" as="script">\n'
+            '<script')
+        assert '<link' not in self.moment.include_moment()
+        self.app.config['MOMENT_RESOURCE_HINTS'] = True
+        ts = str(render_template_string('{{ moment.include_moment() }}'))
+        assert ts.startswith('<link rel="preconnect"')
+
+    def test_include_moment_cache(self):
+        with mock.patch('flask_moment.version_parse',
+                        wraps=flask_moment.version_parse) as version_parse:
+            include_moment = self.moment.include_moment(version='2.17.1')
+            assert version_parse.call_count == 2
+            assert self.moment.include_moment(version='2.17.1') == \
+                include_moment
+            assert version_parse.call_count == 2
+            self.moment.include_moment(version='2.17.1', lazy=True)
+            assert version_parse.call_count == 4
+        self.app.config['MOMENT_DEFAULT_FORMAT'] = 'foo'
+        include_moment = self.moment.include_moment(version='2.17.1')
+        assert 'moment.defaultFormat = "foo";' in include_moment
+        self.app.config['MOMENT_CHUNK_SIZE'] = 10
+        assert '"chunk_size": 10' in self.moment.include_moment(
+            version='2.17.1')
+        assert '"chunk_size": 10' in self.moment.flask_moment_js()
+        self.app.config['MOMENT_CHUNK_SIZE'] = 20
+        assert '"chunk_size": 20' in self.moment.flask_moment_js()
+
+    def test_serve_static(self):
+        app = Flask(__name__)
+        app.config['MOMENT_SERVE_STATIC'] = True
+        Moment(app)
+        with app.test_request_context():
+            include_moment = str(app.extensions['moment'].include_moment(
+                with_locales=False))
+            assert 'cdnjs' not in include_moment
+            assert 'function flask_moment_render' not in include_moment
+            assert 'moment.locale("en");' in include_moment
+            moment_url, js_url = re.findall(r'src="([^"]*)"', include_moment)
+            assert moment_url.startswith('/flask-moment/moment-2.29.4.')
+            assert js_url.startswith('/flask-moment/flask-moment.')
+            # the options are defined before the code that reads them
+            assert include_moment.index('var flask_moment_options') < \
+                include_moment.index(js_url)
+            assert 'integrity="{}"'.format(default_moment_core_sri) in \
+                include_moment
+            include_moment = str(app.extensions['moment'].include_moment(
+                with_locales=['de']))
+            locale_asset = flask_moment._locale_asset('de')
+            locale_url = locale_asset.url()
+            assert locale_url.startswith(
+                '/flask-moment/moment-2.29.4-locale-de.')
+            assert re.findall(r'src="([^"]*)"', include_moment) == [
+                moment_url, locale_url, js_url]
+            assert '{}" integrity="{}" crossorigin="anonymous">'.format(
+                locale_url, locale_asset.sri) in include_moment
+            assert 'cdnjs' not in include_moment
+            assert 'integrity' not in str(app.extensions[
+                'moment'].include_moment(with_locales=['de'], sri=False))
+            include_moment = str(app.extensions['moment'].include_moment(
+                version='2.29.1', with_locales=['de']))
+            assert 'https://cdnjs.cloudflare.com/ajax/libs/moment.js/2.29.1/' \
+                'locale/de.min.js' in include_moment
+            with self.assertRaises(ValueError):
+                app.extensions['moment'].include_moment(with_locales=['xx'])
+            include_moment = str(app.extensions['moment'].include_moment())
+            assert 'cdnjs' not in include_moment
+            locales_url, js_url3 = re.findall(r'src="([^"]*)"',
+                                              include_moment)
+            assert locales_url.startswith(
+                '/flask-moment/moment-with-locales-2.29.4.')
+            assert js_url3 == js_url
+            assert 'integrity="{}"'.format(default_moment_sri) in \
+                include_moment
+
+        client = app.test_client()
+        rv = client.get(js_url)
+        assert rv.status_code == 200
+        assert rv.headers['Content-Type'] == \
+            'application/javascript; charset=utf-8'
+        assert rv.headers['Cache-Control'] == \
+            'public, max-age=31536000, immutable'
+        assert 'Content-Encoding' not in rv.headers
+        assert 'function flask_moment_render(elem) {' in rv.get_data(True)
+        etag = rv.headers['ETag']
+        assert etag.strip('"') in js_url
+
+        rv = client.get(js_url, headers={'If-None-Match': etag})
+        assert rv.status_code == 304
+
+        rv = client.get(locale_url)
+        assert rv.status_code == 200
+        assert rv.headers['Cache-Control'] == \
+            'public, max-age=31536000, immutable'
+        assert "moment.defineLocale('de'" in rv.get_data(True)
+        assert client.get(locale_url.replace('.js', '0.js')).status_code == \
+            404
+        assert client.get('/flask-moment/moment-2.29.4-locale-xx.0.js') \
+            .status_code == 404
+
+        rv = client.get(moment_url, headers={'Accept-Encoding': 'gzip'})
+        assert rv.status_code == 200
+        assert rv.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(rv.data).startswith(b'!function(e,t)')
+
+        rv = client.get(locales_url)
+        assert rv.status_code == 200
+        assert "defineLocale(\"zh-tw\"" in rv.get_data(True)
+
+        assert client.get('/flask-moment/moment.min.js').status_code == 404
+
+        with app.test_request_context():
+            include_moment = str(app.extensions['moment'].include_moment(
+                engine='intl'))
+        intl_url, js_url2 = re.findall(r'src="([^"]*)"', include_moment)
+        assert intl_url.startswith('/flask-moment/moment-intl.')
+        assert js_url2 == js_url
+        assert b'Intl.DateTimeFormat' in client.get(intl_url).data
+
+    @unittest.skipIf(brotli is None, 'brotli is not installed')
+    def test_serve_static_brotli(self):
+        app = Flask(__name__)
+        app.config['MOMENT_SERVE_STATIC'] = True
+        Moment(app)
+        with app.test_request_context():
+            js_url = app.extensions['moment_assets']['flask-moment'].url()
+        rv = app.test_client().get(
+            js_url, headers={'Accept-Encoding': 'gzip, deflate, br'})
+        assert rv.headers['Content-Encoding'] == 'br'
+        assert b'flask_moment_render' in brotli.decompress(rv.data)
+
+    def test_serve_static_refused_encodings(self):
+        app = Flask(__name__)
+        app.config['MOMENT_SERVE_STATIC'] = True
+        Moment(app)
+        with app.test_request_context():
+            js_url = app.extensions['moment_assets']['flask-moment'].url()
+        client = app.test_client()
+        rv = client.get(js_url,
+                        headers={'Accept-Encoding': 'gzip;q=0, br;q=0'})
+        assert 'Content-Encoding' not in rv.headers
+        assert b'flask_moment_render' in rv.data
+        rv = client.get(js_url, headers={'Accept-Encoding': 'br;q=0, gzip'})
+        assert rv.headers['Content-Encoding'] == 'gzip'
+        assert b'flask_moment_render' in gzip.decompress(rv.data)
+
+    def test_serve_static_blueprint_name(self):
+        app = Flask(__name__)
+        app.register_blueprint(Blueprint('moment', __name__))
+        app.config['MOMENT_SERVE_STATIC'] = True
+        Moment(app)
+        assert 'flask_moment' in app.blueprints
+        with app.test_request_context():
+            js_url = app.extensions['moment_assets']['flask-moment'].url()
+        assert app.test_client().get(js_url).status_code == 200
+
+    def test_serve_static_custom_url_path(self):
+        app = Flask(__name__)
+        app.config['MOMENT_SERVE_STATIC'] = True
+        app.config['MOMENT_STATIC_URL_PATH'] = '/static/moment'
+        Moment(app)
+        with app.test_request_context():
+            include_moment = str(app.extensions['moment'].include_moment(
+                sri=False, with_locales=False))
+            assert 'src="/static/moment/moment-2.29.4.' in include_moment
+            assert 'integrity' not in include_moment
+
     @mock.patch('flask_moment._naive_now')
     def test_moment_default(self, now):
         now.return_value = 'foo'
@@ -96,6 +398,61 @@ class TestMoment(unittest.TestCase):
         assert isinstance(js, str)
         assert 'function flask_moment_render(elem) {' in js
 
+    def test_flask_moment_js_refresh_scheduler(self):
+        js = self.moment_app.flask_moment_js()
+        assert 'var flask_moment_options = {"scheduler": "shared"' in js
+        js = self.moment_app.flask_moment_js(refresh_scheduler='element')
+        assert '"scheduler": "element"' in js
+        self.app.config['MOMENT_REFRESH_SCHEDULER'] = 'element'
+        ts = str(render_template_string('{{ moment.include_moment() }}'))
+        assert '"scheduler": "element"' in ts
+        ts = str(render_template_string(
+            '{{ moment.include_moment(refresh_scheduler="shared") }}'))
+        assert '"scheduler": "shared"' in ts
+        with self.assertRaises(ValueError):
+            self.moment_app.flask_moment_js(refresh_scheduler='foo')
+
+    def test_flask_moment_js_lazy(self):
+        js = self.moment_app.flask_moment_js()
+        assert '"lazy": false' in js
+        js = self.moment_app.flask_moment_js(lazy=True)
+        assert '"lazy": true' in js
+        self.app.config['MOMENT_LAZY'] = True
+        ts = str(render_template_string('{{ moment.include_moment() }}'))
+        assert '"lazy": true' in ts
+        ts = str(render_template_string(
+            '{{ moment.include_moment(lazy=False) }}'))
+        assert '"lazy": false' in ts
+
+    def test_flask_moment_js_observe(self):
+        js = self.moment_app.flask_moment_js()
+        assert '"observe": false' in js
+        assert 'function flask_moment_render_subtree(root) {' in js
+        js = self.moment_app.flask_moment_js(observe=True)
+        assert '"observe": true' in js
+        self.app.config['MOMENT_OBSERVE'] = True
+        ts = str(render_template_string('{{ moment.include_moment() }}'))
+        assert '"observe": true' in ts
+
+    def test_flask_moment_js_chunk_size(self):
+        js = self.moment_app.flask_moment_js()
+        assert '"chunk_size": 1000' in js
+        js = self.moment_app.flask_moment_js(chunk_size=0)
+        assert '"chunk_size": 0' in js
+        self.app.config['MOMENT_CHUNK_SIZE'] = 50
+        ts = str(render_template_string('{{ moment.include_moment() }}'))
+        assert '"chunk_size": 50' in ts
+
+    def test_flask_moment_js_stream(self):
+        js = self.moment_app.flask_moment_js()
+        assert '"stream": false' in js
+        js = self.moment_app.flask_moment_js(stream=True)
+        assert '"stream": true' in js
+        assert 'function flask_moment_on_stream(mutations) {' in js
+        self.app.config['MOMENT_STREAM'] = True
+        ts = str(render_template_string('{{ moment.include_moment() }}'))
+        assert '"stream": true' in ts
+
     def test__moment_datetime_passed(self):
         ts = datetime(2017, 1, 15, 22, 47, 6, 479898)
         m = self.moment(timestamp=ts)
@@ -127,6 +484,30 @@ class TestMoment(unittest.TestCase):
         m = self.moment(local=True)  # local is ignored in this case
         assert m._timestamp_as_iso_8601(timestamp=ts) == ts
 
+    def test__timestamp_as_iso_8601_aware(self):
+        ts = datetime(2017, 1, 15, 22, 47, 6, 479898,
+                      tzinfo=timezone(timedelta(hours=-5)))
+        m = self.moment(local=True)  # local is ignored in this case
+        assert m._timestamp_as_iso_8601(ts) == '2017-01-16T03:47:06Z'
+
+    def test__timestamp_as_iso_8601_date(self):
+        m = self.moment()
+        assert m._timestamp_as_iso_8601(date(2017, 1, 15)) == \
+            '2017-01-15T00:00:00Z'
+        m = self.moment(local=True)
+        assert m._timestamp_as_iso_8601(date(2017, 1, 15)) == \
+            '2017-01-15T00:00:00'
+
+    def test__timestamp_as_iso_8601_milliseconds(self):
+        ts = datetime(2017, 1, 15, 22, 47, 6, 479898)
+        m = self.moment(ts, milliseconds=True)
+        assert m._timestamp_as_iso_8601(ts) == '2017-01-15T22:47:06.479Z'
+        assert m._timestamp_as_iso_8601(1484520426.5) == \
+            '2017-01-15T22:47:06.500Z'
+        m = self.moment(ts, local=True, milliseconds=True)
+        assert m._timestamp_as_iso_8601(ts) == '2017-01-15T22:47:06.479'
+        assert 'data-timestamp="2017-01-15T22:47:06.479"' in m.format('LL')
+
     def test__render_default(self):
         m = self.moment()
         rts = m._render(func='format')  # rts: rendered time stamp
@@ -141,12 +522,93 @@ class TestMoment(unittest.TestCase):
         assert rts.find('data-timestamp="') > 0
         assert rts.find('data-function="format" data-refresh="60000"') > 0
 
+    def test__render_full_markup(self):
+        m = self.moment(timestamp=datetime(2017, 1, 15, 22, 47, 6))
+        rts = m._render(func='from', format='LL',
+                        timestamp2='2017-01-16T00:00:00Z', no_suffix=1,
+                        units='days', refresh=2)
+        assert rts == (
+            '<span class="flask-moment" data-timestamp="2017-01-15T22:47:06Z"'
+            ' data-function="from" data-format="LL" '
+            'data-timestamp2="2017-01-16T00:00:00Z" data-nosuffix="1" '
+            'data-units="days" data-refresh="120000" style="display: none">'
+            '2017-01-15T22:47:06Z</span>')
+
+    def test__render_cache(self):
+        self.moment.render_cache_clear()
+        m = self.moment(timestamp=datetime(2017, 1, 15, 22, 47, 6))
+        rts1 = m.fromNow(refresh=True)
+        rts2 = m.fromNow(refresh=1)
+        assert rts1 == rts2
+        info = self.moment.render_cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+        assert info.currsize == 1
+        self.moment.render_cache_clear()
+        assert self.moment.render_cache_info().currsize == 0
+
     def test_format_default(self):
         m = self.moment()
         rts = m.format('this-format-please')
         assert rts.find(
             'data-format="this-format-please" data-refresh="0"') > 0
 
+    def test_format_prerender(self):
+        m = self.moment(datetime(2017, 1, 15, 22, 47, 6))
+        rts = m.format('LLLL', prerender=True)
+        assert rts.endswith('data-format="LLLL" data-refresh="0">'
+                            'Sunday, January 15, 2017 10:47 PM</span>')
+        assert 'display: none' not in rts
+        assert m.format(prerender=True).endswith(
+            '>2017-01-15T22:47:06+00:00</span>')
+        assert m.format('[<b>]YYYY', prerender=True).endswith(
+            '>&lt;b&gt;2017</span>')
+        self.app.config['MOMENT_DEFAULT_FORMAT'] = 'L'
+        assert m.format(prerender=True).endswith('>01/15/2017</span>')
+        self.app.config['MOMENT_PRERENDER_TIMEZONE'] = timezone(
+            timedelta(hours=-5))
+        assert m.format('LLL Z', prerender=True).endswith(
+            '>January 15, 2017 5:47 PM -05:00</span>')
+        assert self.moment('not a date').format(prerender=True).endswith(
+            ' style="display: none">not a date</span>')
+
+    def test_format_prerender_many(self):
+        ts = [datetime(2017, 1, 15, 22, 47, 6), '2018-02-03T04:05:06Z']
+        rts = self.moment.render_many(ts, 'format', fmt='LL',
+                                      prerender=True)
+        assert rts == [self.moment(t).format('LL', prerender=True)
+                       for t in ts]
+        assert rts[1].endswith('>February 3, 2018</span>')
+        self.app.config['MOMENT_COMPACT'] = True
+        with self.app.test_request_context():
+            rts = self.moment(ts[0]).format('LL', prerender=True)
+            assert rts.endswith(
+                'data-t="2017-01-15T22:47:06Z">January 15, 2017</span>')
+
+    @mock.patch('flask_moment._naive_now')
+    def test_relative_prerender(self, now):
+        now.return_value = datetime(2017, 1, 15, 22, 47, 6)
+        m = self.moment(datetime(2017, 1, 15, 19, 40))
+        assert m.fromNow(prerender=True).endswith(
+            'data-refresh="0">3 hours ago</span>')
+        assert m.fromNow(no_suffix=True, prerender=True).endswith(
+            '>3 hours</span>')
+        assert m.toNow(prerender=True).endswith('>in 3 hours</span>')
+        assert m.calendar(prerender=True).endswith(
+            '>Today at 7:40 PM</span>')
+        assert m.fromTime(datetime(2017, 1, 20), prerender=True).endswith(
+            '>4 days ago</span>')
+        assert m.toTime(datetime(2017, 1, 20), prerender=True).endswith(
+            '>in 4 days</span>')
+        assert 'display: none' in m.fromNow()
+        self.app.config['MOMENT_PRERENDER_TIMEZONE'] = timezone(
+            timedelta(hours=-5))
+        assert m.calendar(prerender=True).endswith(
+            '>Today at 2:40 PM</span>')
+        rts = self.moment.render_many([m.timestamp], 'fromNow',
+                                      prerender=True)
+        assert rts == [m.fromNow(prerender=True)]
+
     def test_fromNow_default(self):
         m = self.moment()
         rts = m.fromNow()
@@ -178,6 +640,11 @@ class TestMoment(unittest.TestCase):
         assert rts.find(m._timestamp_as_iso_8601(
             timestamp=m.timestamp)) > 0
 
+    def test_fromNow_adaptive_refresh(self):
+        m = self.moment()
+        rts = m.fromNow(refresh='adaptive')
+        assert rts.find('data-function="fromNow" data-refresh="adaptive"') > 0
+
     def test_toNow_default(self):
         m = self.moment()
         rts = m.toNow()
@@ -216,6 +683,16 @@ class TestMoment(unittest.TestCase):
         rts = m.calendar()
         assert rts.find('data-function="calendar" data-refresh="0"') > 0
 
+    def test_calendar_adaptive_refresh(self):
+        m = self.moment()
+        rts = m.calendar(refresh='adaptive')
+        assert rts.find(
+            'data-function="calendar" data-refresh="adaptive"') > 0
+        rts = self.moment.render_many([m.timestamp], 'calendar',
+                                      refresh='adaptive')
+        assert rts[0].find(
+            'data-function="calendar" data-refresh="adaptive"') > 0
+
     def test_valueOf_default(self):
         m = self.moment()
         rts = m.valueOf()
@@ -248,6 +725,430 @@ class TestMoment(unittest.TestCase):
         assert rts.find(m._timestamp_as_iso_8601(
             timestamp=m.timestamp)) > 0
 
+    def test_static_values(self):
+        m = self.moment(datetime(2017, 1, 15, 22, 47, 6, 479000),
+                        milliseconds=True)
+        assert m.valueOf() == (
+            '<span data-timestamp="2017-01-15T22:47:06.479Z" '
+            'data-function="valueOf" data-refresh="0">1484520426479</span>')
+        assert m.unix() == (
+            '<span data-timestamp="2017-01-15T22:47:06.479Z" '
+            'data-function="unix" data-refresh="0">1484520426</span>')
+        ts = datetime(2017, 1, 16, 1, 0, 0)
+        assert m.diff(ts, 'hours').endswith('data-units="hours" '
+                                            'data-refresh="0">-2</span>')
+        assert m.diff(ts, 'Minutes').endswith('>-132</span>')
+        assert m.diff(ts, 's').endswith('>-7973</span>')
+        assert m.diff('2017-01-15T22:00:00-05:00', 'h').endswith(
+            '>-4</span>')
+
+    def test_static_values_in_client(self):
+        m = self.moment(datetime(2017, 1, 15, 22, 47, 6))
+        ts = datetime(2017, 1, 16, 1, 0, 0)
+        # calendar units depend on the timezone of the client
+        for units in ['days', 'weeks', 'M', 'months', 'years', 'fortnights']:
+            assert 'class="flask-moment"' in m.diff(ts, units)
+        # refreshed values and local timestamps are rendered in the client
+        assert 'class="flask-moment"' in m.unix(refresh=True)
+        assert 'class="flask-moment"' in self.moment(
+            datetime(2017, 1, 15), local=True).valueOf()
+        assert 'class="flask-moment"' in self.moment('2017-01-15').unix()
+        assert 'class="flask-moment"' in self.moment('tomorrow').unix()
+        assert 'class="flask-moment"' in m.diff('tomorrow', 'hours')
+
+    def test_static_values_many(self):
+        ts = [datetime(2017, 1, 15, 22, 47, 6), '2018-02-03T04:05:06']
+        rts = self.moment.render_many(ts, 'unix')
+        assert rts[0].endswith('>1484520426</span>')
+        assert 'class="flask-moment"' in rts[1]
+        self.app.config['MOMENT_COMPACT'] = True
+        rts = self.moment_app.render_many(ts, 'diff', timestamp=ts[0],
+                                          units='seconds')
+        assert rts[0].endswith('>0</span>')
+        assert 'data-m="' in rts[1]
+
+    def test_render_many(self):
+        ts = [datetime(2017, 1, 15, 22, 47, 6), '2018-02-03T04:05:06Z']
+        rts = self.moment.render_many(ts, 'format', fmt='LL', refresh=True)
+        assert len(rts) == 2
+        assert rts[0] == self.moment(ts[0]).format('LL', refresh=True)
+        assert rts[1] == self.moment(ts[1]).format('LL', refresh=True)
+
+    def test_render_many_joined(self):
+        ts = [datetime(2017, 1, 15, 22, 47, 6), datetime(2020, 1, 1)]
+        rts = self.moment_app.render_many(ts, 'diff', local=True,
+                                          separator='<br>',
+                                          timestamp=datetime(2021, 1, 1),
+                                          units='days')
+        assert isinstance(rts, Markup)
+        assert rts == self.moment(ts[0], local=True).diff(
+            datetime(2021, 1, 1), 'days') + Markup('<br>') + self.moment(
+                ts[1], local=True).diff(datetime(2021, 1, 1), 'days')
+
+    def test_render_stream(self):
+        ts = [datetime(2017, 1, 15, 22, 47, 6) + timedelta(minutes=i)
+              for i in range(5)]
+        chunks = list(self.moment_app.render_stream(
+            ts, 'fromNow', chunk_size=2, separator='<br>', refresh=True))
+        assert len(chunks) == 3
+        assert all(isinstance(chunk, Markup) for chunk in chunks)
+        assert chunks[1].startswith('<br><span')
+        assert Markup('').join(chunks) == self.moment.render_many(
+            ts, 'fromNow', separator='<br>', refresh=True)
+        assert list(self.moment.render_stream([])) == []
+        with self.assertRaises(ValueError):
+            self.moment.render_stream(ts, 'foo')
+        for chunk_size in (0, -1):
+            with self.assertRaises(ValueError):
+                self.moment.render_stream(ts, chunk_size=chunk_size)
+
+    def test_render_stream_lazy(self):
+        consumed = []
+
+        def timestamps():
+            for i in range(10):
+                consumed.append(i)
+                yield datetime(2017, 1, 15) + timedelta(days=i)
+
+        stream = self.moment.render_stream(timestamps(), 'format',
+                                           chunk_size=4, fmt='LL')
+        assert consumed == []
+        next(stream)
+        assert len(consumed) == 4
+        assert len(list(stream)) == 2
+        assert len(consumed) == 10
+
+    def test_render_stream_compact(self):
+        self.app.config['MOMENT_COMPACT'] = True
+        ts = [datetime(2017, 1, 15, 22, 47, 6), datetime(2018, 1, 1)]
+        chunks = list(self.moment.render_stream(ts, 'format', chunk_size=1,
+                                                fmt='LL'))
+        for chunk in chunks:
+            assert chunk.count('class="flask-moment-data"') == 1
+            assert chunk.index('data-m=') < chunk.index('flask-moment-data')
+        assert self.moment.data_island() == ''
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_render_stream_numpy(self):
+        ts = np.array(['2017-01-15T22:47:06', '2018-01-01T00:00:00'],
+                      dtype='datetime64[s]')
+        chunks = list(self.moment.render_stream(ts, 'unix', chunk_size=1))
+        assert chunks[0].endswith('>1484520426</span>')
+        assert chunks[1].endswith('>1514764800</span>')
+
+    def test__timestamp_as_iso_8601_epoch(self):
+        m = self.moment(local=True)  # local is ignored in this case
+        assert m._timestamp_as_iso_8601(1484520426) == '2017-01-15T22:47:06Z'
+        assert m._timestamp_as_iso_8601(1484520426.5) == \
+            '2017-01-15T22:47:06Z'
+
+    @mock.patch('flask_moment.np', None)
+    def test_render_many_epoch_without_numpy(self):
+        rts = self.moment.render_many([1484520426, 0], 'calendar')
+        assert rts == [
+            self.moment('2017-01-15T22:47:06Z').calendar(),
+            self.moment('1970-01-01T00:00:00Z').calendar(),
+        ]
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_render_many_numpy_datetime64(self):
+        ts = np.array(['2017-01-15T22:47:06.479898', '2020-01-01'],
+                      dtype='datetime64[ns]')
+        rts = self.moment.render_many(ts, 'fromNow')
+        assert rts == [
+            self.moment(datetime(2017, 1, 15, 22, 47, 6)).fromNow(),
+            self.moment(datetime(2020, 1, 1)).fromNow(),
+        ]
+        rts = self.moment.render_many(ts, 'fromNow', local=True)
+        assert rts[0] == self.moment(datetime(2017, 1, 15, 22, 47, 6),
+                                     local=True).fromNow()
+        rts = self.moment.render_many(ts, 'fromNow', milliseconds=True)
+        assert rts[0] == self.moment(datetime(2017, 1, 15, 22, 47, 6, 479000),
+                                     milliseconds=True).fromNow()
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_render_many_numpy_epoch(self):
+        ts = np.array([1484520426, 0])
+        rts = self.moment.render_many(ts, 'unix', local=True)
+        assert rts == [
+            self.moment('2017-01-15T22:47:06Z').unix(),
+            self.moment('1970-01-01T00:00:00Z').unix(),
+        ]
+        rts = self.moment.render_many(ts.astype(float), 'unix')
+        assert rts[0] == self.moment('2017-01-15T22:47:06Z').unix()
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_timestamps_as_iso_8601_epoch_arrays(self):
+        arrays = [
+            np.array([1484520426, 0, -1, 1500084000]),
+            np.array([1484520426.479, 0.5, -1.500001, 1500084000.999]),
+        ]
+        for ts in arrays:
+            for milliseconds in (False, True):
+                with self.subTest(dtype=ts.dtype, milliseconds=milliseconds):
+                    m = self.moment(milliseconds=milliseconds)
+                    assert flask_moment._timestamps_as_iso_8601(
+                        ts, m._timestamp_as_iso_8601,
+                        milliseconds=milliseconds) == [
+                        flask_moment._iso_8601(t.item(), False, milliseconds)
+                        for t in ts]
+        rts = self.moment.render_many(np.array([1484520426]),
+                                      milliseconds=True)
+        assert 'data-timestamp="2017-01-15T22:47:06.000Z"' in rts[0]
+
+    @mock.patch('flask_moment._naive_now')
+    def test_render_many_missing(self, now):
+        now.return_value = datetime(2017, 1, 15, 22, 47, 6)
+        ts = datetime(2018, 1, 1)
+        rts = self.moment.render_many([ts, None, float('nan')], 'fromNow')
+        assert rts == [self.moment(ts).fromNow(), self.moment().fromNow(), '']
+        self.app.config['MOMENT_CLIENT_NOW'] = True
+        assert 'data-timestamp="now"' in self.moment.render_many([None])[0]
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_render_many_numpy_missing(self):
+        ts = np.array(['2017-01-15T22:47:06', 'NaT'], dtype='datetime64[s]')
+        expected = [self.moment('2017-01-15T22:47:06Z').format('LL'), '']
+        assert self.moment.render_many(ts, fmt='LL') == expected
+        assert self.moment.render_many(np.array([1484520426, np.nan]),
+                                       fmt='LL') == expected
+        assert self.moment.render_many(ts, 'unix') == [
+            self.moment('2017-01-15T22:47:06Z').unix(), '']
+        assert self.moment.render_many(ts, fmt='LL', prerender=True)[1] == ''
+        chunks = list(self.moment.render_stream(ts, fmt='LL', chunk_size=1))
+        assert chunks == expected
+
+    @unittest.skipIf(pd is None, 'pandas is not installed')
+    def test_render_many_pandas(self):
+        ts = pd.Series(pd.to_datetime(['2017-01-15 22:47:06']))
+        rts = self.moment.render_many(ts, 'format', fmt='LLL')
+        assert rts == [self.moment('2017-01-15T22:47:06Z').format('LLL')]
+        rts = self.moment.render_many(
+            pd.Series(pd.to_datetime(['2017-01-15 22:47:06', None])),
+            'format', fmt='LLL')
+        assert rts == [self.moment('2017-01-15T22:47:06Z').format('LLL'), '']
+        rts = self.moment.render_many([pd.NaT], 'format', fmt='LLL')
+        assert rts == ['']
+        rts = self.moment.render_many(ts.dt.tz_localize('Europe/Madrid'),
+                                      'format', fmt='LLL', local=True)
+        assert rts == [self.moment('2017-01-15T21:47:06Z').format('LLL')]
+        rts = self.moment.render_many(
+            pd.DatetimeIndex(ts).tz_localize('Europe/Madrid'), 'format',
+            fmt='LLL')
+        assert rts == [self.moment('2017-01-15T21:47:06Z').format('LLL')]
+
+    def test_render_many_invalid_function(self):
+        with self.assertRaises(ValueError):
+            self.moment.render_many([datetime(2020, 1, 1)], 'render_many')
+
+    def test_compact(self):
+        self.app.config['MOMENT_COMPACT'] = True
+        with self.app.test_request_context():
+            m = self.moment(timestamp=datetime(2017, 1, 15, 22, 47, 6))
+            rts1 = m.format('LL', refresh=True)
+            rts2 = m.fromTime(datetime(2017, 1, 16), no_suffix=True)
+            rts3 = self.moment_app.render_many([m.timestamp], 'format',
+                                               fmt='LL', refresh=True)[0]
+            assert rts1 == rts3
+            assert rts1.startswith('<span class="flask-moment" data-m="')
+            assert rts1.endswith(
+                '" data-t="2017-01-15T22:47:06Z" hidden></span>')
+            assert 'data-t2="2017-01-16T00:00:00Z" hidden>' in rts2
+            island = self.moment_app.data_island()
+            assert island.startswith('<script type="application/json" '
+                                     'class="flask-moment-data">{')
+            plans = json.loads(island[island.index('{'):-len('</script>')])
+            assert plans == {
+                rts1[rts1.index('data-m="') + 8:][:6]: {
+                    'function': 'format', 'format': 'LL',
+                    'refresh': '60000'},
+                rts2[rts2.index('data-m="') + 8:][:6]: {
+                    'function': 'from', 'nosuffix': '1', 'refresh': '0'},
+            }
+            assert self.moment.data_island() == ''
+            m.format('LL', refresh=True)
+            assert self.moment.data_island() != ''
+
+    def test_compact_escaping(self):
+        self.app.config['MOMENT_COMPACT'] = True
+        with self.app.test_request_context():
+            self.moment().format('</script>')
+            island = str(self.moment.data_island())
+            assert island.count('</script>') == 1
+
+    def test_slots(self):
+        m = self.moment(datetime(2017, 1, 15, 22, 47, 6))
+        assert not hasattr(m, '__dict__')
+        with self.assertRaises(AttributeError):
+            m.foo = 'bar'
+
+    def test_render_functions(self):
+        ts = datetime(2017, 1, 15, 22, 47, 6, 123000)
+        ts2 = datetime(2017, 1, 20)
+        m = self.moment(ts)
+        ml = self.moment(ts, local=True, milliseconds=True)
+        tests = [
+            (flask_moment.render_format(ts, 'LLL', refresh=True),
+             m.format('LLL', refresh=True)),
+            (flask_moment.render_format(ts, prerender=True),
+             m.format(prerender=True)),
+            (flask_moment.render_from_now(ts, True), m.fromNow(True)),
+            (flask_moment.render_from_time(ts, ts2, prerender=True),
+             m.fromTime(ts2, prerender=True)),
+            (flask_moment.render_to_now(ts, refresh='adaptive'),
+             m.toNow(refresh='adaptive')),
+            (flask_moment.render_to_time(ts, ts2, True), m.toTime(ts2, True)),
+            (flask_moment.render_calendar(ts), m.calendar()),
+            (flask_moment.render_value_of(ts), m.valueOf()),
+            (flask_moment.render_unix(ts, refresh=True), m.unix(True)),
+            (flask_moment.render_diff(ts, ts2, 'hours'),
+             m.diff(ts2, 'hours')),
+            (flask_moment.render_from_time(ts, ts2, local=True,
+                                           milliseconds=True),
+             ml.fromTime(ts2)),
+            (flask_moment.render_diff(ts, ts2, 'days', local=True,
+                                      milliseconds=True),
+             ml.diff(ts2, 'days')),
+        ]
+        for output, expected in tests:
+            with self.subTest(expected=expected):
+                assert output == expected
+        self.app.config['MOMENT_CLIENT_NOW'] = True
+        assert flask_moment.render_from_now(None) == \
+            self.moment().fromNow()
+
+    def test_reference_timestamp_keyword(self):
+        ts = datetime(2017, 1, 15, 22, 47, 6)
+        ts2 = datetime(2017, 1, 20)
+        m = self.moment(ts)
+        assert self.moment.render_many([ts], 'fromTime', timestamp=ts2) == \
+            [m.fromTime(ts2)]
+        assert self.moment.render_many([ts], 'diff', timestamp=ts2,
+                                       units='days') == [m.diff(ts2, 'days')]
+        template = ("{{ ts|moment_to_time(timestamp=ts2) }}\n"
+                    "{{ ts|moment_diff(timestamp='2017-01-20T00:00:00Z', "
+                    "units='days') }}")
+        expected = [m.toTime(ts2), m.diff(ts2, 'days')]
+        assert render_template_string(
+            template, ts=ts, ts2=ts2).split('\n') == expected
+        self.app.jinja_env.add_extension(flask_moment.MomentExtension)
+        assert render_template_string(
+            template, ts=ts, ts2=ts2).split('\n') == expected
+
+    def test_template_filters(self):
+        ts = datetime(2017, 1, 15, 22, 47, 6)
+        ts2 = datetime(2017, 1, 20)
+        m = self.moment(ts)
+        expected = [
+            m.format('LLL', refresh=True), m.fromNow(no_suffix=True),
+            m.fromTime(ts2), m.toNow(), m.toTime(ts2, prerender=True),
+            m.calendar(), m.valueOf(), m.unix(), m.diff(ts2, 'days'),
+            self.moment(ts, local=True).format('LL')]
+        template = (
+            "{{ ts|moment_format('LLL', refresh=True) }}\n"
+            "{{ ts|moment_from_now(no_suffix=True) }}\n"
+            "{{ ts|moment_from_time(ts2) }}\n"
+            "{{ ts|moment_to_now }}\n"
+            "{{ ts|moment_to_time(ts2, prerender=True) }}\n"
+            "{{ ts|moment_calendar() }}\n"
+            "{{ ts|moment_value_of }}\n"
+            "{{ ts|moment_unix }}\n"
+            "{{ ts|moment_diff(ts2, units='days') }}\n"
+            "{{ ts|moment_format('LL', local=True) }}")
+        assert render_template_string(
+            template, ts=ts, ts2=ts2).split('\n') == expected
+        self.app.jinja_env.add_extension(flask_moment.MomentExtension)
+        assert render_template_string(
+            template, ts=ts, ts2=ts2).split('\n') == expected
+
+    def test_jinja_extension(self):
+        app = Flask(__name__)
+        app.config['MOMENT_JINJA_EXTENSION'] = True
+        Moment(app)
+        ts = datetime(2017, 1, 15, 22, 47, 6)
+        m = self.moment(ts)
+        with app.app_context():
+            template = ("{{ ts|moment_format('LLL', refresh=True) }}\n"
+                        "{{ ts|moment_from_time('2017-01-20T00:00:00Z', "
+                        "True) }}\n"
+                        "{{ ts|moment_diff('2017-01-20T00:00:00Z', 'h') }}\n"
+                        "{{ ts|moment_format(fmt) }}\n"
+                        "{{ ts|moment_to_now(no_suffix=1, refresh=1) }}")
+            assert render_template_string(
+                template, ts=ts, fmt='LL').split('\n') == [
+                    m.format('LLL', refresh=True),
+                    m.fromTime('2017-01-20T00:00:00Z', True),
+                    m.diff('2017-01-20T00:00:00Z', 'h'),
+                    m.format('LL'),
+                    m.toNow(no_suffix=1, refresh=1)]
+            code = app.jinja_env.compile(template, raw=True)
+            assert code.count("False, False, '") == 4
+            assert "False, False, 'format', 'LLL', None, None, None, 60000, " \
+                "False)" in code
+            assert "'diff', None, '2017-01-20T00:00:00Z', None, 'h', 0, " \
+                "False)" in code
+
+            # filters with invalid arguments report their errors when
+            # rendering
+            with self.assertRaises(TypeError):
+                render_template_string("{{ ts|moment_format(foo=1) }}",
+                                       ts=ts)
+            with self.assertRaises(Exception):
+                render_template_string("{{ ts|moment_format('LL' }}", ts=ts)
+
+    def test_instrumentation(self):
+        app = Flask(__name__)
+        app.config['MOMENT_INSTRUMENTATION'] = True
+        moment = Moment(app)
+        ts = [datetime(2017, 1, 15, 22, 47, 6), datetime(2018, 1, 1)]
+
+        @app.route('/')
+        def index():
+            rendered = render_template_string(
+                '{{ moment(ts[0]).format("LL") }}'
+                '{{ moment(ts[1]).fromTime(ts[0]) }}'
+                '{{ ts[0]|moment_format("LLL") }}', ts=ts)
+            rendered += str(moment.render_many(ts, 'fromNow', separator=''))
+            index.stats = moment.render_stats()
+            return rendered
+
+        collected = []
+
+        def receiver(sender, stats):
+            collected.append((sender, stats))
+
+        with flask_moment.render_stats_collected.connected_to(receiver, app):
+            rv = app.test_client().get('/')
+        body = rv.get_data(as_text=True)
+        stats = index.stats
+        assert sorted(stats) == ['format', 'fromNow', 'fromTime']
+        assert stats['format']['count'] == 2
+        assert stats['fromNow']['count'] == 2
+        assert stats['fromTime']['count'] == 1
+        assert sum(entry['bytes'] for entry in stats.values()) == len(body)
+        assert all(entry['time'] > 0 for entry in stats.values())
+        assert collected == [(app, stats)]
+        assert 'Server-Timing' not in rv.headers
+
+        app.debug = True
+        rv = app.test_client().get('/')
+        timing = rv.headers['Server-Timing']
+        assert timing.startswith('moment;dur=')
+        assert 'desc="5 spans, {} bytes"'.format(len(body)) in timing
+        assert 'moment-fromNow;dur=' in timing
+
+    def test_instrumentation_disabled(self):
+        @self.app.route('/')
+        def index():
+            index.stats = self.moment.render_stats()
+            return self.moment(datetime(2017, 1, 15)).format('LL')
+
+        self.app.debug = True
+        rv = self.app.test_client().get('/')
+        assert 'Server-Timing' not in rv.headers
+        assert index.stats == {}
+        assert self.moment.render_stats() == {}
+
     @mock.patch('flask_moment._naive_now')
     def test_create_default_no_timestamp(self, now):
         ts = datetime(2017, 1, 15, 22, 1, 21, 101361)
@@ -256,6 +1157,36 @@ class TestMoment(unittest.TestCase):
         moment.init_app(self.app)
         assert moment.create().timestamp == ts
 
+    @mock.patch('flask_moment._naive_now')
+    def test_client_now(self, now):
+        now.side_effect = AssertionError('the server time was used')
+        self.app.config['MOMENT_CLIENT_NOW'] = True
+        m = self.moment_app.create()
+        assert m.timestamp == 'now'
+        assert m.format('LL', prerender=True) == (
+            '<span class="flask-moment" data-timestamp="now" '
+            'data-function="format" data-format="LL" data-refresh="0" '
+            'style="display: none">now</span>')
+        assert 'data-timestamp="now"' in m.unix()
+        assert 'data-timestamp2="now"' in self.moment(
+            datetime(2017, 1, 15)).fromTime('now')
+
+    @mock.patch('flask_moment._naive_now')
+    def test_output_depends_only_on_arguments(self, now):
+        now.side_effect = AssertionError('the server time was used')
+        m = self.moment(datetime(2017, 1, 15, 22, 47, 6))
+        ts = datetime(2017, 1, 20)
+        m.format('LL', prerender=True)
+        m.fromNow()
+        m.fromTime(ts, prerender=True)
+        m.toNow(refresh='adaptive')
+        m.toTime(ts, prerender=True)
+        m.calendar()
+        m.valueOf()
+        m.unix()
+        m.diff(ts, 'days')
+        self.moment.render_many([ts], 'fromNow', refresh=True)
+
     def test_create_default_with_timestamp(self):
         moment = Moment()
         moment.init_app(self.app)
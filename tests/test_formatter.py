@@ -0,0 +1,179 @@
+from datetime import datetime, timezone
+import unittest
+
+from flask_moment.formatter import compile_format, format_timestamp, \
+    parse_iso_8601
+from flask_moment.locales import get_locale
+
+try:
+    from zoneinfo import ZoneInfo
+    ZoneInfo('America/New_York')
+except Exception:  # pragma: no cover
+    ZoneInfo = None  # zoneinfo or the timezone database are not available
+
+# expected output of moment(timestamp).format(token) from moment.js 2.29.4,
+# running in the UTC timezone
+tokens = {
+    '2016-02-29T13:05:09.045Z': [
+        ('M', '2'), ('Mo', '2nd'), ('MM', '02'), ('MMM', 'Feb'),
+        ('MMMM', 'February'), ('Q', '1'), ('Qo', '1st'), ('D', '29'),
+        ('Do', '29th'), ('DD', '29'), ('DDD', '60'), ('DDDo', '60th'),
+        ('DDDD', '060'), ('d', '1'), ('do', '1st'), ('dd', 'Mo'),
+        ('ddd', 'Mon'), ('dddd', 'Monday'), ('e', '1'), ('E', '1'),
+        ('w', '10'), ('wo', '10th'), ('ww', '10'), ('W', '9'), ('Wo', '9th'),
+        ('WW', '09'), ('gg', '16'), ('gggg', '2016'), ('ggggg', '02016'),
+        ('GG', '16'), ('GGGG', '2016'), ('GGGGG', '02016'), ('Y', '2016'),
+        ('YY', '16'), ('YYYY', '2016'), ('YYYYY', '02016'),
+        ('YYYYYY', '+002016'), ('N', 'AD'), ('NNNN', 'Anno Domini'),
+        ('NNNNN', 'AD'), ('y', '2016'), ('yo', '2016th'), ('yy', '2016'),
+        ('yyyy', '2016'), ('H', '13'), ('HH', '13'), ('h', '1'),
+        ('hh', '01'), ('k', '13'), ('kk', '13'), ('hmm', '105'),
+        ('hmmss', '10509'), ('Hmm', '1305'), ('Hmmss', '130509'), ('m', '5'),
+        ('mm', '05'), ('s', '9'), ('ss', '09'), ('S', '0'), ('SS', '04'),
+        ('SSS', '045'), ('SSSS', '0450'), ('SSSSSSSSS', '045000000'),
+        ('a', 'pm'), ('A', 'PM'), ('Z', '+00:00'), ('ZZ', '+0000'), ('z', ''),
+        ('X', '1456751109'), ('x', '1456751109045'), ('LT', '1:05 PM'),
+        ('LTS', '1:05:09 PM'), ('L', '02/29/2016'),
+        ('LL', 'February 29, 2016'), ('LLL', 'February 29, 2016 1:05 PM'),
+        ('LLLL', 'Monday, February 29, 2016 1:05 PM'), ('l', '2/29/2016'),
+        ('ll', 'Feb 29, 2016'), ('lll', 'Feb 29, 2016 1:05 PM'),
+        ('llll', 'Mon, Feb 29, 2016 1:05 PM'),
+    ],
+    '2017-01-01T00:00:00Z': [
+        ('M', '1'), ('Mo', '1st'), ('MM', '01'), ('MMM', 'Jan'),
+        ('MMMM', 'January'), ('Q', '1'), ('Qo', '1st'), ('D', '1'),
+        ('Do', '1st'), ('DD', '01'), ('DDD', '1'), ('DDDo', '1st'),
+        ('DDDD', '001'), ('d', '0'), ('do', '0th'), ('dd', 'Su'),
+        ('ddd', 'Sun'), ('dddd', 'Sunday'), ('e', '0'), ('E', '7'),
+        ('w', '1'), ('wo', '1st'), ('ww', '01'), ('W', '52'), ('Wo', '52nd'),
+        ('WW', '52'), ('gg', '17'), ('gggg', '2017'), ('ggggg', '02017'),
+        ('GG', '16'), ('GGGG', '2016'), ('GGGGG', '02016'), ('Y', '2017'),
+        ('YY', '17'), ('YYYY', '2017'), ('YYYYY', '02017'),
+        ('YYYYYY', '+002017'), ('H', '0'), ('HH', '00'), ('h', '12'),
+        ('hh', '12'), ('k', '24'), ('kk', '24'), ('hmm', '1200'),
+        ('hmmss', '120000'), ('Hmm', '000'), ('Hmmss', '00000'), ('m', '0'),
+        ('mm', '00'), ('s', '0'), ('ss', '00'), ('S', '0'), ('SS', '00'),
+        ('SSS', '000'), ('a', 'am'), ('A', 'AM'), ('X', '1483228800'),
+        ('x', '1483228800000'), ('LT', '12:00 AM'), ('LTS', '12:00:00 AM'),
+        ('L', '01/01/2017'), ('LL', 'January 1, 2017'),
+        ('LLL', 'January 1, 2017 12:00 AM'),
+        ('LLLL', 'Sunday, January 1, 2017 12:00 AM'), ('l', '1/1/2017'),
+        ('ll', 'Jan 1, 2017'), ('lll', 'Jan 1, 2017 12:00 AM'),
+        ('llll', 'Sun, Jan 1, 2017 12:00 AM'),
+    ],
+}
+
+# expected output of moment('2017-01-15T22:47:06.479Z').format(fmt)
+formats = [
+    ('dddd, MMMM Do YYYY, h:mm:ss a',
+     'Sunday, January 15th 2017, 10:47:06 pm'),
+    ('[Today is] dddd', 'Today is Sunday'),
+    ('[[nested]] YYYY', '[nested] 2017'),
+    ('YYYY [escaped] YYYY', '2017 escaped 2017'),
+    ('\\Y\\Y Y', 'YY 2017'),
+    ('LLLL [at] LT', 'Sunday, January 15, 2017 10:47 PM at 10:47 PM'),
+    ('MMM Do, YY [Q]Q', 'Jan 15th, 17 Q1'),
+    ('gggg-[W]ww-e', '2017-W03-0'),
+    ('GGGG-[W]WW-E', '2017-W02-7'),
+    ('[unterminated', '[unt0r47inpmt00'),
+    ('ddd, hA', 'Sun, 10PM'),
+    ('MMMMDo', 'January15th'),
+    ('YYYYMMDD', '20170115'),
+    ('[a][b]', 'ab'),
+    ('l lll', '1/15/2017 Jan 15, 2017 10:47 PM'),
+    ('\\L', 'L'),
+    ('\\LT', 'LT'),
+    ('\\LLLL', 'LLLL'),
+    ('L \\L', '01/15/2017 L'),
+    ('\\l LT', 'l 10:47 PM'),
+    ('[\\L] L', '\\L 01/15/2017'),
+    ('\\LTS lll', 'LT4 Jan 15, 2017 10:47 PM'),
+]
+
+# expected output of moment(timestamp).format('gggg-ww-e GGGG-WW-E') at the
+# boundaries of locale and ISO week years
+weeks = [
+    ('2008-12-29T12:00:00Z', '2009-01-1 2009-01-1'),
+    ('2010-01-03T12:00:00Z', '2010-02-0 2009-53-7'),
+    ('2012-01-01T12:00:00Z', '2012-01-0 2011-52-7'),
+    ('2020-12-31T12:00:00Z', '2021-01-4 2020-53-4'),
+    ('2021-01-03T12:00:00Z', '2021-02-0 2020-53-7'),
+    ('2027-01-01T12:00:00Z', '2027-01-5 2026-53-5'),
+]
+
+# expected output of moment(timestamp).format('YYYY-MM-DD HH:mm Z ZZ x') with
+# the browser set to other timezones
+timezones = {
+    'America/New_York': [
+        ('2017-01-15T22:47:06.479Z',
+         '2017-01-15 17:47 -05:00 -0500 1484520426479'),
+        ('2017-07-15T02:00:00Z',
+         '2017-07-14 22:00 -04:00 -0400 1500084000000'),
+        ('2024-03-10T07:30:00Z',
+         '2024-03-10 03:30 -04:00 -0400 1710055800000'),
+    ],
+    'Asia/Kolkata': [
+        ('2017-01-15T22:47:06.479Z',
+         '2017-01-16 04:17 +05:30 +0530 1484520426479'),
+        ('2017-07-15T02:00:00Z',
+         '2017-07-15 07:30 +05:30 +0530 1500084000000'),
+        ('2024-03-10T07:30:00Z',
+         '2024-03-10 13:00 +05:30 +0530 1710055800000'),
+    ],
+}
+
+
+class TestFormatter(unittest.TestCase):
+    def test_tokens(self):
+        for timestamp, expected in tokens.items():
+            for fmt, output in expected:
+                with self.subTest(timestamp=timestamp, fmt=fmt):
+                    assert format_timestamp(timestamp, fmt) == output
+
+    def test_formats(self):
+        for fmt, output in formats:
+            with self.subTest(fmt=fmt):
+                assert format_timestamp('2017-01-15T22:47:06.479Z',
+                                        fmt) == output
+
+    def test_weeks(self):
+        for timestamp, output in weeks:
+            with self.subTest(timestamp=timestamp):
+                assert format_timestamp(
+                    timestamp, 'gggg-ww-e GGGG-WW-E') == output
+
+    @unittest.skipIf(ZoneInfo is None, 'timezone database is not available')
+    def test_timezones(self):
+        for tz, expected in timezones.items():
+            for timestamp, output in expected:
+                with self.subTest(tz=tz, timestamp=timestamp):
+                    assert format_timestamp(
+                        timestamp, 'YYYY-MM-DD HH:mm Z ZZ x',
+                        tz=ZoneInfo(tz)) == output
+
+    def test_datetime(self):
+        assert format_timestamp(datetime(2017, 1, 15, 22, 47, 6),
+                                'LLL') == 'January 15, 2017 10:47 PM'
+        assert format_timestamp(datetime(2017, 1, 15, 22, 47, 6,
+                                         tzinfo=timezone.utc),
+                                'X') == '1484520426'
+
+    def test_compile_format_cache(self):
+        assert compile_format('LLL') is compile_format('LLL')
+        assert compile_format('LLL') is not compile_format('LL')
+
+    def test_parse_iso_8601(self):
+        assert parse_iso_8601('2017-01-15T22:47:06Z') == datetime(
+            2017, 1, 15, 22, 47, 6, tzinfo=timezone.utc)
+        assert parse_iso_8601('2017-01-15T22:47:06.479') == datetime(
+            2017, 1, 15, 22, 47, 6, 479000, tzinfo=timezone.utc)
+        assert parse_iso_8601('2017-01-15') == datetime(
+            2017, 1, 15, tzinfo=timezone.utc)
+        with self.assertRaises(ValueError):
+            parse_iso_8601('yesterday')
+
+    def test_get_locale(self):
+        assert get_locale('en').__name__ == 'flask_moment.locales.en'
+        assert get_locale('en-GB') is get_locale('en')
+        assert get_locale('xx') is get_locale('en')
+        assert get_locale('../en') is get_locale('en')
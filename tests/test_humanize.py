@@ -0,0 +1,200 @@
+from datetime import datetime, timedelta, timezone
+import unittest
+
+from flask_moment.formatter import parse_iso_8601
+from flask_moment.humanize import calendar, from_now, relative_time, to_now
+
+try:
+    from zoneinfo import ZoneInfo
+    ZoneInfo('America/New_York')
+except Exception:  # pragma: no cover
+    ZoneInfo = None  # zoneinfo or the timezone database are not available
+
+# expected output of moment(timestamp).from(reference),
+# moment(timestamp).from(reference, true) and moment(timestamp).to(reference)
+# from moment.js 2.29.4, at the limits of each unit
+relative_times = [
+    ('2017-01-15T22:47:06Z', '2017-01-15T22:47:06Z',
+     'a few seconds ago', 'a few seconds', 'a few seconds ago'),
+    ('2017-01-15T22:47:50Z', '2017-01-15T22:47:06Z',
+     'in a few seconds', 'a few seconds', 'a few seconds ago'),
+    ('2017-01-15T22:46:22Z', '2017-01-15T22:47:06Z',
+     'a few seconds ago', 'a few seconds', 'in a few seconds'),
+    ('2017-01-15T22:47:51Z', '2017-01-15T22:47:06Z',
+     'in a minute', 'a minute', 'a minute ago'),
+    ('2017-01-15T22:46:21Z', '2017-01-15T22:47:06Z',
+     'a minute ago', 'a minute', 'in a minute'),
+    ('2017-01-15T22:48:35Z', '2017-01-15T22:47:06Z',
+     'in a minute', 'a minute', 'a minute ago'),
+    ('2017-01-15T22:45:37Z', '2017-01-15T22:47:06Z',
+     'a minute ago', 'a minute', 'in a minute'),
+    ('2017-01-15T22:48:36Z', '2017-01-15T22:47:06Z',
+     'in 2 minutes', '2 minutes', '2 minutes ago'),
+    ('2017-01-15T22:45:36Z', '2017-01-15T22:47:06Z',
+     '2 minutes ago', '2 minutes', 'in 2 minutes'),
+    ('2017-01-15T23:31:35Z', '2017-01-15T22:47:06Z',
+     'in 44 minutes', '44 minutes', '44 minutes ago'),
+    ('2017-01-15T22:02:37Z', '2017-01-15T22:47:06Z',
+     '44 minutes ago', '44 minutes', 'in 44 minutes'),
+    ('2017-01-15T23:31:36Z', '2017-01-15T22:47:06Z',
+     'in an hour', 'an hour', 'an hour ago'),
+    ('2017-01-15T22:02:36Z', '2017-01-15T22:47:06Z',
+     'an hour ago', 'an hour', 'in an hour'),
+    ('2017-01-16T00:17:05Z', '2017-01-15T22:47:06Z',
+     'in an hour', 'an hour', 'an hour ago'),
+    ('2017-01-15T21:17:07Z', '2017-01-15T22:47:06Z',
+     'an hour ago', 'an hour', 'in an hour'),
+    ('2017-01-16T00:17:06Z', '2017-01-15T22:47:06Z',
+     'in 2 hours', '2 hours', '2 hours ago'),
+    ('2017-01-15T21:17:06Z', '2017-01-15T22:47:06Z',
+     '2 hours ago', '2 hours', 'in 2 hours'),
+    ('2017-01-16T20:17:05Z', '2017-01-15T22:47:06Z',
+     'in 21 hours', '21 hours', '21 hours ago'),
+    ('2017-01-15T01:17:07Z', '2017-01-15T22:47:06Z',
+     '21 hours ago', '21 hours', 'in 21 hours'),
+    ('2017-01-16T20:17:06Z', '2017-01-15T22:47:06Z',
+     'in a day', 'a day', 'a day ago'),
+    ('2017-01-15T01:17:06Z', '2017-01-15T22:47:06Z',
+     'a day ago', 'a day', 'in a day'),
+    ('2017-01-17T10:47:05Z', '2017-01-15T22:47:06Z',
+     'in a day', 'a day', 'a day ago'),
+    ('2017-01-14T10:47:07Z', '2017-01-15T22:47:06Z',
+     'a day ago', 'a day', 'in a day'),
+    ('2017-01-17T10:47:06Z', '2017-01-15T22:47:06Z',
+     'in 2 days', '2 days', '2 days ago'),
+    ('2017-01-14T10:47:06Z', '2017-01-15T22:47:06Z',
+     '2 days ago', '2 days', 'in 2 days'),
+    ('2017-02-10T10:47:05Z', '2017-01-15T22:47:06Z',
+     'in 25 days', '25 days', '25 days ago'),
+    ('2016-12-21T10:47:07Z', '2017-01-15T22:47:06Z',
+     '25 days ago', '25 days', 'in 25 days'),
+    ('2017-02-10T10:47:06Z', '2017-01-15T22:47:06Z',
+     'in a month', 'a month', 'a month ago'),
+    ('2016-12-21T10:47:06Z', '2017-01-15T22:47:06Z',
+     'a month ago', 'a month', 'in a month'),
+    ('2017-03-01T22:47:06Z', '2017-01-15T22:47:06Z',
+     'in a month', 'a month', 'a month ago'),
+    ('2016-12-01T22:47:06Z', '2017-01-15T22:47:06Z',
+     'a month ago', 'a month', 'in a month'),
+    ('2017-11-30T22:47:06Z', '2017-01-15T22:47:06Z',
+     'in 10 months', '10 months', '10 months ago'),
+    ('2016-03-02T22:47:06Z', '2017-01-15T22:47:06Z',
+     '10 months ago', '10 months', 'in 10 months'),
+    ('2017-12-01T22:47:06Z', '2017-01-15T22:47:06Z',
+     'in a year', 'a year', 'a year ago'),
+    ('2016-03-01T22:47:06Z', '2017-01-15T22:47:06Z',
+     '10 months ago', '10 months', 'in 10 months'),
+    ('2018-07-16T22:47:06Z', '2017-01-15T22:47:06Z',
+     'in 2 years', '2 years', '2 years ago'),
+    ('2015-07-18T22:47:06Z', '2017-01-15T22:47:06Z',
+     'a year ago', 'a year', 'in a year'),
+    ('2018-07-17T22:47:06Z', '2017-01-15T22:47:06Z',
+     'in 2 years', '2 years', '2 years ago'),
+    ('2015-07-17T22:47:06Z', '2017-01-15T22:47:06Z',
+     'a year ago', 'a year', 'in a year'),
+    ('2019-10-12T22:47:06Z', '2017-01-15T22:47:06Z',
+     'in 3 years', '3 years', '3 years ago'),
+    ('2014-04-21T22:47:06Z', '2017-01-15T22:47:06Z',
+     '3 years ago', '3 years', 'in 3 years'),
+    ('2017-02-28T12:00:00Z', '2017-01-31T12:00:00Z',
+     'in a month', 'a month', 'a month ago'),
+    ('2017-03-31T00:00:00Z', '2017-02-28T00:00:00Z',
+     'in a month', 'a month', 'a month ago'),
+    ('2016-02-29T00:00:00Z', '2017-02-28T00:00:00Z',
+     'a year ago', 'a year', 'in a year'),
+]
+
+# expected output of moment(timestamp).calendar('2017-01-15T22:47:06Z')
+calendar_times = [
+    ('2017-01-07T22:47:06Z', '01/07/2017'),
+    ('2017-01-09T01:11:06Z', 'Last Monday at 1:11 AM'),
+    ('2017-01-09T22:47:06Z', 'Last Monday at 10:47 PM'),
+    ('2017-01-13T22:47:06Z', 'Last Friday at 10:47 PM'),
+    ('2017-01-14T22:32:42Z', 'Yesterday at 10:32 PM'),
+    ('2017-01-14T22:47:06Z', 'Yesterday at 10:47 PM'),
+    ('2017-01-15T10:47:06Z', 'Today at 10:47 AM'),
+    ('2017-01-15T21:35:06Z', 'Today at 9:35 PM'),
+    ('2017-01-15T22:47:06Z', 'Today at 10:47 PM'),
+    ('2017-01-16T10:47:06Z', 'Tomorrow at 10:47 AM'),
+    ('2017-01-16T20:23:06Z', 'Tomorrow at 8:23 PM'),
+    ('2017-01-16T22:47:06Z', 'Tomorrow at 10:47 PM'),
+    ('2017-01-17T10:47:06Z', 'Tuesday at 10:47 AM'),
+    ('2017-01-17T22:47:06Z', 'Tuesday at 10:47 PM'),
+    ('2017-01-22T20:23:06Z', '01/22/2017'),
+    ('2017-01-22T22:47:06Z', '01/22/2017'),
+    ('2017-01-23T22:47:06Z', '01/23/2017'),
+]
+utc = timezone.utc
+now = datetime(2017, 1, 15, 22, 47, 6, tzinfo=utc)
+
+
+class TestHumanize(unittest.TestCase):
+    def test_relative_time(self):
+        for timestamp, reference, from_, from_no_suffix, to in \
+                relative_times:
+            with self.subTest(timestamp=timestamp, reference=reference):
+                timestamp = parse_iso_8601(timestamp)
+                reference = parse_iso_8601(reference)
+                assert relative_time(timestamp, reference) == from_
+                assert relative_time(timestamp, reference,
+                                     no_suffix=True) == from_no_suffix
+                assert relative_time(reference, timestamp) == to
+
+    def test_calendar(self):
+        for timestamp, output in calendar_times:
+            with self.subTest(timestamp=timestamp):
+                assert calendar(parse_iso_8601(timestamp), now)[0] == output
+
+    def test_from_now(self):
+        assert from_now(now - timedelta(hours=3), now) == (
+            '3 hours ago', datetime(2017, 1, 15, 23, 17, 6, tzinfo=utc))
+        assert from_now(now + timedelta(hours=3), now) == (
+            'in 3 hours', datetime(2017, 1, 15, 23, 17, 6, 1000, tzinfo=utc))
+        assert from_now(now - timedelta(seconds=10), now) == (
+            'a few seconds ago', datetime(2017, 1, 15, 22, 47, 40, 500000,
+                                          tzinfo=utc))
+        assert from_now(now + timedelta(seconds=10), now) == (
+            'in a few seconds', datetime(2017, 1, 15, 22, 47, 16,
+                                         tzinfo=utc))
+        assert from_now(now - timedelta(days=95), now) == (
+            '3 months ago', datetime(2017, 1, 28, 4, 1, 39, tzinfo=utc))
+        assert from_now(now - timedelta(days=3000), now) == (
+            '8 years ago', datetime(2017, 4, 29, 9, 16, 12, tzinfo=utc))
+
+    def test_to_now(self):
+        assert to_now(now - timedelta(hours=3), now) == (
+            'in 3 hours', datetime(2017, 1, 15, 23, 17, 6, tzinfo=utc))
+        assert to_now(now + timedelta(seconds=10), now) == (
+            'a few seconds ago', datetime(2017, 1, 15, 22, 47, 16, 1000,
+                                          tzinfo=utc))
+
+    def test_valid_until(self):
+        for delta in (timedelta(seconds=-50), timedelta(minutes=30),
+                      timedelta(hours=-30), timedelta(days=12),
+                      timedelta(days=-40), timedelta(days=400)):
+            for func in (from_now, to_now):
+                with self.subTest(delta=delta, func=func.__name__):
+                    text, valid_until = func(now + delta, now)
+                    before = valid_until - timedelta(milliseconds=1)
+                    assert func(now + delta, before)[0] == text
+                    assert func(now + delta, valid_until)[0] != text
+
+    def test_calendar_valid_until(self):
+        assert calendar(now - timedelta(hours=1), now) == (
+            'Today at 9:47 PM', datetime(2017, 1, 16, tzinfo=utc))
+        assert calendar(now + timedelta(days=3), now) == (
+            'Wednesday at 10:47 PM', datetime(2017, 1, 17, tzinfo=utc))
+        assert calendar(now + timedelta(days=30), now) == (
+            '02/14/2017', datetime(2017, 2, 8, tzinfo=utc))
+        assert calendar(now - timedelta(days=30), now) == (
+            '12/16/2016', None)
+
+    @unittest.skipIf(ZoneInfo is None, 'timezone database is not available')
+    def test_daylight_saving_time(self):
+        tz = ZoneInfo('America/New_York')
+        local_now = datetime(2016, 3, 12, 23, 0, tzinfo=tz)
+        timestamp = datetime(2016, 3, 13, 3, 0, tzinfo=tz)
+        assert from_now(timestamp, local_now) == (
+            'in 3 hours', datetime(2016, 3, 13, 4, 30, 0, 1000, tzinfo=utc))
+        assert calendar(timestamp, local_now) == (
+            'Tomorrow at 3:00 AM', datetime(2016, 3, 13, 5, tzinfo=utc))
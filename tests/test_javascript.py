@@ -0,0 +1,113 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import unittest
+
+from flask import Flask
+
+import flask_moment
+from flask_moment import Moment
+
+node = shutil.which('node')
+harness = os.path.join(os.path.dirname(__file__), 'dom.js')
+static = os.path.join(os.path.dirname(flask_moment.__file__), 'static')
+
+
+def static_file(name):
+    with open(os.path.join(static, name), encoding='utf-8') as f:
+        return f.read()
+
+
+@unittest.skipUnless(node, 'Node.js is not available')
+class TestJavaScript(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        Moment(self.app)
+        self.moment = self.app.extensions['moment']
+        self.appctx = self.app.app_context()
+        self.appctx.push()
+
+    def tearDown(self):
+        self.appctx.pop()
+
+    def run_js(self, scripts, test):
+        job = json.dumps({'scripts': scripts, 'test': test})
+        output = subprocess.run([node, harness], input=job, check=True,
+                                stdout=subprocess.PIPE,
+                                universal_newlines=True).stdout
+        return json.loads(output)
+
+    def span_attributes(self, span):
+        return dict(re.findall(r'([\w-]+)="([^"]*)"', str(span)))
+
+    def test_moved_element_keeps_refreshing(self):
+        span = self.moment('2017-01-15T22:45:06Z').fromNow(refresh=True)
+        scripts = [static_file('moment.min.js'),
+                   str(self.moment.flask_moment_js(observe=True))]
+        attributes = 'const attributes = {};'.format(
+            json.dumps(self.span_attributes(span)))
+        result = self.run_js(scripts, attributes + '''
+            const first = document.body.appendChild(
+                document.createElement('div'));
+            const second = document.body.appendChild(
+                document.createElement('div'));
+            const elem = first.appendChild(
+                document.createElement('span', attributes));
+            flush();
+            result = [elem.textContent];
+
+            // move the element within a single batch of mutations
+            second.appendChild(elem);
+            flush();
+            tick(60000);
+            result.push(elem.textContent);
+
+            // remove the element, and insert it back later
+            second.removeChild(elem);
+            flush();
+            tick(60000);
+            result.push(elem.textContent);
+            first.appendChild(elem);
+            flush();
+            result.push(elem.textContent);
+            tick(60000);
+            result.push(elem.textContent);
+
+            // remove the element for good
+            first.removeChild(elem);
+            flush();
+            result.push(timers());
+        ''')
+        assert result == ['2 minutes ago', '3 minutes ago', '3 minutes ago',
+                          '4 minutes ago', '5 minutes ago', 0]
+
+    def test_inline_locales(self):
+        include_moment = str(self.moment.include_moment(
+            with_locales=['de', 'fr'], loading='defer'))
+        inline = re.findall(r'<script>\n(.*?)\n</script>', include_moment,
+                            re.DOTALL)
+        # moment.js loads after the inline code, which waits for it
+        result = self.run_js(inline + [static_file('moment.min.js')], '''
+            flask_moment_run_queue();
+            result = [moment.locale(), moment.locales().sort()];
+            moment.locale('de');
+            result.push(moment('2017-01-15T22:47:06Z').utc().format('LLLL'));
+        ''')
+        assert result == ['en', ['de', 'en', 'fr'],
+                          'Sonntag, 15. Januar 2017 22:47']
+
+    def test_intl_engine_relative_time(self):
+        result = self.run_js([static_file('moment-intl.js')], '''
+            const now = '2017-01-15T22:47:06Z';
+            result = [-60000, -30000, -300, 0, 300, 30000, 60000].map(
+                function(ms) {
+                    return moment(Date.parse(now) + ms).from(now);
+                });
+            result.push(moment(now).from(now, true));
+            result.push(moment(now).to(now));
+        ''')
+        assert result == ['1 minute ago', '30 seconds ago', '1 second ago',
+                          '0 seconds ago', 'in 1 second', 'in 30 seconds',
+                          'in 1 minute', '0 seconds', '0 seconds ago']